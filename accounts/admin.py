@@ -4,6 +4,7 @@ Accounts app admin configuration.
 
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from django.db.models import Count
 from django.utils.translation import gettext_lazy as _
 from .models import CustomUser, Department
 
@@ -27,9 +28,13 @@ class DepartmentAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_user_count=Count('users'))
+    
     def user_count(self, obj):
-        return obj.user_count
+        return obj._user_count
     user_count.short_description = _('Kullanıcı Sayısı')
+    user_count.admin_order_field = '_user_count'
 
 
 @admin.register(CustomUser)
@@ -37,12 +42,14 @@ class CustomUserAdmin(UserAdmin):
     """
     Özelleştirilmiş kullanıcı admin yapılandırması.
     """
-    list_display = ['username', 'email', 'full_name', 'user_type', 
+    list_display = ['username', 'email', 'full_name_db', 'user_type', 
                     'department', 'is_verified', 'is_active']
     list_filter = ['user_type', 'department', 'is_verified', 'is_active', 
                    'is_staff', 'is_superuser']
     search_fields = ['username', 'email', 'first_name', 'last_name', 'phone']
     ordering = ['-created_at']
+    list_select_related = ['department']
+    autocomplete_fields = ['department']
     
     fieldsets = (
         (None, {
@@ -74,7 +81,3 @@ class CustomUserAdmin(UserAdmin):
     
     readonly_fields = ['last_login', 'date_joined', 'last_activity', 
                        'created_at', 'updated_at']
-    
-    def full_name(self, obj):
-        return obj.full_name
-    full_name.short_description = _('Ad Soyad')
@@ -3,3 +3,12 @@ from django.apps import AppConfig
 
 class AccountsConfig(AppConfig):
     name = 'accounts'
+    
+    def ready(self):
+        try:
+            import accounts.signals  # noqa
+        except ImportError:
+            pass
+        
+        from accounts.services.dashboard_service import validate_admin_dashboard_stats
+        validate_admin_dashboard_stats()
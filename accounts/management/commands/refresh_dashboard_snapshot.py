@@ -0,0 +1,17 @@
+"""
+Management command to refresh the precomputed admin dashboard statistics.
+Intended to be run periodically (e.g. every minute from cron).
+"""
+
+from django.core.management.base import BaseCommand
+from accounts.services import DashboardStatisticsService
+
+
+class Command(BaseCommand):
+    help = 'Recompute admin dashboard statistics into the snapshot row'
+    
+    def handle(self, *args, **options):
+        snapshot = DashboardStatisticsService.refresh_snapshot()
+        self.stdout.write(self.style.SUCCESS(
+            f'Dashboard snapshot updated at {snapshot.updated_at}'
+        ))
@@ -2,6 +2,10 @@
 Management command to seed initial admin user and departments.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from accounts.models import CustomUser, Department
@@ -35,98 +39,127 @@ class Command(BaseCommand):
         self.stdout.write('Seeding initial data...')
         
         # Create departments
-        departments_data = [
-            {'name': 'Satış', 'department_type': Department.DepartmentType.SALES},
-            {'name': 'Finans', 'department_type': Department.DepartmentType.FINANCE},
-            {'name': 'Hukuk', 'department_type': Department.DepartmentType.LEGAL},
-            {'name': 'Operasyon', 'department_type': Department.DepartmentType.OPERATIONS},
-            {'name': 'Bilgi Teknolojileri', 'department_type': Department.DepartmentType.IT},
-            {'name': 'İnsan Kaynakları', 'department_type': Department.DepartmentType.HR},
+        department_names = [
+            'Satış',
+            'Finans',
+            'Hukuk',
+            'Operasyon',
+            'Bilgi Teknolojileri',
+            'İnsan Kaynakları',
         ]
         
-        for dept_data in departments_data:
-            dept, created = Department.objects.get_or_create(
-                name=dept_data['name'],
-                defaults={'department_type': dept_data['department_type']}
-            )
-            if created:
-                self.stdout.write(f'  Created department: {dept.name}')
+        existing = set(
+            Department.objects.filter(
+                name__in=department_names
+            ).values_list('name', flat=True)
+        )
+        
+        # bulk_create save() çağırmaz; code alanı burada üretilir.
+        Department.objects.bulk_create(
+            [
+                Department(name=name, code=Department.generate_code(name))
+                for name in department_names
+                if name not in existing
+            ],
+            batch_size=settings.BULK_CREATE_BATCH_SIZE,
+            ignore_conflicts=True
+        )
+        
+        for name in department_names:
+            if name in existing:
+                self.stdout.write(f'  Department exists: {name}')
             else:
-                self.stdout.write(f'  Department exists: {dept.name}')
+                self.stdout.write(f'  Created department: {name}')
         
-        # Create admin user
+        # Create users
         username = options['username']
         email = options['email']
         password = options['password']
         
-        user, created = CustomUser.objects.get_or_create(
-            username=username,
-            defaults={
-                'email': email,
-                'first_name': 'Sistem',
-                'last_name': 'Yöneticisi',
-                'user_type': CustomUser.UserType.ADMIN,
-                'is_staff': True,
-                'is_superuser': True,
-                'is_verified': True,
-            }
-        )
+        sales_department = Department.objects.filter(name='Satış').only('id').first()
         
-        if created:
-            user.set_password(password)
-            user.save()
-            self.stdout.write(self.style.SUCCESS(
-                f'\nAdmin user created:'
-                f'\n  Username: {username}'
-                f'\n  Email: {email}'
-                f'\n  Password: {password}'
-            ))
-        else:
-            self.stdout.write(self.style.WARNING(
-                f'Admin user already exists: {username}'
-            ))
+        users_data = [
+            {
+                'label': 'Admin user',
+                'password': password,
+                'fields': {
+                    'username': username,
+                    'email': email,
+                    'first_name': 'Sistem',
+                    'last_name': 'Yöneticisi',
+                    'user_type': CustomUser.UserType.ADMIN,
+                    'is_staff': True,
+                    'is_superuser': True,
+                    'is_verified': True,
+                },
+            },
+            {
+                'label': 'Salesperson',
+                'password': 'satis123',
+                'fields': {
+                    'username': 'satis1',
+                    'email': 'satis1@leasing.local',
+                    'first_name': 'Ahmet',
+                    'last_name': 'Yılmaz',
+                    'user_type': CustomUser.UserType.SALESPERSON,
+                    'department': sales_department,
+                    'is_verified': True,
+                },
+            },
+            {
+                'label': 'Customer',
+                'password': 'musteri123',
+                'fields': {
+                    'username': 'musteri1',
+                    'email': 'musteri1@example.com',
+                    'first_name': 'Mehmet',
+                    'last_name': 'Demir',
+                    'user_type': CustomUser.UserType.CUSTOMER,
+                    'is_verified': True,
+                },
+            },
+        ]
         
-        # Create a sample salesperson
-        sales_user, created = CustomUser.objects.get_or_create(
-            username='satis1',
-            defaults={
-                'email': 'satis1@leasing.local',
-                'first_name': 'Ahmet',
-                'last_name': 'Yılmaz',
-                'user_type': CustomUser.UserType.SALESPERSON,
-                'department': Department.objects.get(name='Satış'),
-                'is_verified': True,
-            }
+        existing_users = set(
+            CustomUser.objects.filter(
+                username__in=[data['fields']['username'] for data in users_data]
+            ).values_list('username', flat=True)
         )
+        new_users_data = [
+            data for data in users_data
+            if data['fields']['username'] not in existing_users
+        ]
         
-        if created:
-            sales_user.set_password('satis123')
-            sales_user.save()
-            self.stdout.write(self.style.SUCCESS(
-                f'\nSalesperson created:'
-                f'\n  Username: satis1'
-                f'\n  Password: satis123'
+        # PBKDF2 hash'leme GIL'i bıraktığı için şifreler paralel hash'lenir.
+        with ThreadPoolExecutor() as executor:
+            password_hashes = list(executor.map(
+                make_password,
+                [data['password'] for data in new_users_data]
             ))
         
-        # Create a sample customer
-        customer_user, created = CustomUser.objects.get_or_create(
-            username='musteri1',
-            defaults={
-                'email': 'musteri1@example.com',
-                'first_name': 'Mehmet',
-                'last_name': 'Demir',
-                'user_type': CustomUser.UserType.CUSTOMER,
-                'is_verified': True,
-            }
+        # Şifre hash'i INSERT öncesinde atanır; ayrıca save() gerekmez.
+        CustomUser.objects.bulk_create(
+            [
+                CustomUser(password=password_hash, **data['fields'])
+                for data, password_hash in zip(new_users_data, password_hashes)
+            ],
+            batch_size=settings.BULK_CREATE_BATCH_SIZE
         )
         
-        if created:
-            customer_user.set_password('musteri123')
-            customer_user.save()
-            self.stdout.write(self.style.SUCCESS(
-                f'\nCustomer created:'
-                f'\n  Username: musteri1'
-                f'\n  Password: musteri123'
+        for data in new_users_data:
+            fields = data['fields']
+            message = (
+                f'\n{data["label"]} created:'
+                f'\n  Username: {fields["username"]}'
+            )
+            if fields['user_type'] == CustomUser.UserType.ADMIN:
+                message += f'\n  Email: {fields["email"]}'
+            message += f'\n  Password: {data["password"]}'
+            self.stdout.write(self.style.SUCCESS(message))
+        
+        if username in existing_users:
+            self.stdout.write(self.style.WARNING(
+                f'Admin user already exists: {username}'
             ))
         
         self.stdout.write(self.style.SUCCESS('\nSeeding completed!'))
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_remove_department_department_type_department_code_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['date_joined'], name='accounts_cu_date_jo_fcefff_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0 on 2026-10-16 11:30
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_customuser_accounts_cu_date_jo_fcefff_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('user_stats', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='Kullanıcı İstatistikleri')),
+                ('order_stats', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='Sipariş İstatistikleri')),
+                ('customer_stats', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='Müşteri İstatistikleri')),
+                ('document_stats', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='Belge İstatistikleri')),
+                ('department_stats', models.JSONField(default=list, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='Departman İstatistikleri')),
+                ('system_health', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='Sistem Sağlığı')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Güncellenme Tarihi')),
+            ],
+            options={
+                'verbose_name': 'Dashboard Özeti',
+                'verbose_name_plural': 'Dashboard Özetleri',
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_dashboardsnapshot'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['user_type'], name='accounts_cu_user_ty_97b0bf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['last_activity'], name='accounts_cu_last_ac_6ec725_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-16 12:30
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_customuser_accounts_cu_user_ty_97b0bf_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='full_name_db',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(models.Q(('first_name', ''), ('last_name', ''), _connector='OR'), then=models.F('username')), default=django.db.models.functions.text.Concat('first_name', models.Value(' '), 'last_name')), output_field=models.CharField(max_length=301), verbose_name='Ad Soyad'),
+        ),
+    ]
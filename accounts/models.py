@@ -4,12 +4,29 @@ Custom user model and department management.
 """
 
 from django.contrib.auth.models import AbstractUser
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models.functions import Concat
 from django.utils.translation import gettext_lazy as _
 from django.utils.text import slugify
 import re
 
 
+# Türkçe karakter dönüşüm tablosu
+_TR_CHAR_TABLE = str.maketrans({
+    'Ç': 'C', 'Ğ': 'G', 'İ': 'I', 'Ö': 'O', 'Ş': 'S', 'Ü': 'U',
+    'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 'ş': 's', 'ü': 'u',
+})
+_NON_ALNUM_RE = re.compile(r'[^A-Z0-9]+')
+
+# Kullanıcı tipi -> dashboard URL
+_DASHBOARD_URLS = {
+    'admin': '/admin-dashboard/',
+    'salesperson': '/sales-dashboard/',
+    'customer': '/customer-dashboard/',
+}
+
+
 class Department(models.Model):
     """
     Departman modeli.
@@ -60,23 +77,18 @@ class Department(models.Model):
     def __str__(self):
         return self.name
     
+    @staticmethod
+    def generate_code(name):
+        """Departman adından code değeri üretir."""
+        # Türkçe karakterleri dönüştür, alfanumerik olmayanları alt çizgiye çevir
+        code = _NON_ALNUM_RE.sub('_', name.upper().translate(_TR_CHAR_TABLE))
+        # Uzunluk sınırı
+        return code.strip('_')[:100]
+    
     def save(self, *args, **kwargs):
         # Code otomatik oluştur
         if not self.code:
-            # Türkçe karakterleri dönüştür ve code oluştur
-            code = self.name.upper()
-            # Türkçe karakter dönüşümü
-            tr_map = {
-                'Ç': 'C', 'Ğ': 'G', 'I': 'I', 'İ': 'I', 'Ö': 'O', 'Ş': 'S', 'Ü': 'U',
-                'ç': 'c', 'ğ': 'g', 'ı': 'i', 'i': 'i', 'ö': 'o', 'ş': 's', 'ü': 'u'
-            }
-            for tr_char, en_char in tr_map.items():
-                code = code.replace(tr_char, en_char)
-            # Sadece alfanumerik ve alt çizgi
-            code = re.sub(r'[^A-Z0-9]', '_', code)
-            code = re.sub(r'_+', '_', code).strip('_')
-            # Uzunluk sınırı
-            self.code = code[:100]
+            self.code = self.generate_code(self.name)
         super().save(*args, **kwargs)
     
     @property
@@ -162,10 +174,29 @@ class CustomUser(AbstractUser):
         blank=True
     )
     
+    # full_name property'sinin veritabanında saklanan karşılığı (admin listeleri için)
+    full_name_db = models.GeneratedField(
+        verbose_name=_('Ad Soyad'),
+        expression=models.Case(
+            models.When(
+                models.Q(first_name='') | models.Q(last_name=''),
+                then=models.F('username')
+            ),
+            default=Concat('first_name', models.Value(' '), 'last_name'),
+        ),
+        output_field=models.CharField(max_length=301),
+        db_persist=True
+    )
+    
     class Meta:
         verbose_name = _('Kullanıcı')
         verbose_name_plural = _('Kullanıcılar')
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user_type']),
+            models.Index(fields=['last_activity']),
+            models.Index(fields=['date_joined']),
+        ]
     
     def __str__(self):
         if self.first_name and self.last_name:
@@ -203,9 +234,68 @@ class CustomUser(AbstractUser):
     
     def get_dashboard_url(self):
         """Kullanıcı tipine göre dashboard URL'ini döndürür."""
-        if self.is_admin:
+        if self.is_superuser:
             return '/admin-dashboard/'
-        elif self.is_salesperson:
-            return '/sales-dashboard/'
-        else:
-            return '/customer-dashboard/'
+        return _DASHBOARD_URLS.get(self.user_type, '/customer-dashboard/')
+
+
+class DashboardSnapshot(models.Model):
+    """
+    Admin dashboard istatistiklerinin önceden hesaplanmış kopyası.
+    Tek satır tutulur; refresh_dashboard_snapshot komutu ile periyodik güncellenir.
+    """
+    
+    user_stats = models.JSONField(
+        _('Kullanıcı İstatistikleri'),
+        default=dict,
+        encoder=DjangoJSONEncoder
+    )
+    order_stats = models.JSONField(
+        _('Sipariş İstatistikleri'),
+        default=dict,
+        encoder=DjangoJSONEncoder
+    )
+    customer_stats = models.JSONField(
+        _('Müşteri İstatistikleri'),
+        default=dict,
+        encoder=DjangoJSONEncoder
+    )
+    document_stats = models.JSONField(
+        _('Belge İstatistikleri'),
+        default=dict,
+        encoder=DjangoJSONEncoder
+    )
+    department_stats = models.JSONField(
+        _('Departman İstatistikleri'),
+        default=list,
+        encoder=DjangoJSONEncoder
+    )
+    system_health = models.JSONField(
+        _('Sistem Sağlığı'),
+        default=dict,
+        encoder=DjangoJSONEncoder
+    )
+    updated_at = models.DateTimeField(
+        _('Güncellenme Tarihi'),
+        auto_now=True
+    )
+    
+    SNAPSHOT_FIELDS = [
+        'user_stats',
+        'order_stats',
+        'customer_stats',
+        'document_stats',
+        'department_stats',
+        'system_health',
+    ]
+    
+    class Meta:
+        verbose_name = _('Dashboard Özeti')
+        verbose_name_plural = _('Dashboard Özetleri')
+    
+    def __str__(self):
+        return f"Dashboard Snapshot - {self.updated_at}"
+    
+    def to_context(self):
+        """Template context'ine eklenecek istatistikleri döndürür."""
+        return {field: getattr(self, field) for field in self.SNAPSHOT_FIELDS}
@@ -1,6 +1,5 @@
-from .dashboard_service import DashboardStatisticsService
-
-__all__ = ['DashboardStatisticsService']
-
-
+from .dashboard_service import (
+    DashboardStatisticsService, ADMIN_DASHBOARD_STATS, get_cached_stats
+)
 
+__all__ = ['DashboardStatisticsService', 'ADMIN_DASHBOARD_STATS', 'get_cached_stats']
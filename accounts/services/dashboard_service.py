@@ -3,14 +3,103 @@ Dashboard statistics service.
 Provides metrics and statistics for admin dashboard.
 """
 
-from django.db.models import Count, Sum, Avg, Q
-from django.db.models.functions import TruncDate, TruncMonth
+from django.db.models import (
+    Count, Sum, Avg, Q, OuterRef, Subquery, Value, DecimalField
+)
+from django.db.models.functions import Coalesce, TruncDate, TruncMonth
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from datetime import timedelta
+from functools import partial, wraps
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
+STATS_CACHE_PREFIX = 'dashboard_stats'
+STATS_CACHE_TTL = 60  # seconds
+
+# Model etiketi -> o tablodan beslenen istatistik anahtarları
+STATS_CACHE_DEPENDENCIES = {
+    'accounts.customuser': [
+        'user_stats', 'department_stats', 'system_health', 'salesperson_performance',
+    ],
+    'accounts.department': ['department_stats', 'salesperson_performance'],
+    'orders.order': [
+        'order_stats', 'department_stats', 'orders_by_month',
+        'salesperson_performance', 'pending_approvals',
+    ],
+    'customers.customer': [
+        'customer_stats', 'department_stats', 'salesperson_performance',
+        'pending_approvals',
+    ],
+    'documents.uploadeddocument': ['document_stats', 'pending_approvals'],
+    'documents.kvkkdocument': ['pending_approvals'],
+}
+
+
+def _current_month_range(now=None):
+    """
+    İçinde bulunulan ayın [başlangıç, sonraki ay başlangıcı) aralığını döndürür.
+    
+    __month/__year lookup'ları kolonu EXTRACT() ile sardığı için index
+    kullanamaz; aralık filtresi created_at index'i üzerinden taranabilir.
+    """
+    local_now = timezone.localtime(now)
+    month_start = local_now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    next_month_start = (month_start + timedelta(days=32)).replace(day=1)
+    return month_start, next_month_start
+
+
+def cached_stat(key, ttl=STATS_CACHE_TTL):
+    """
+    İstatistik sonucunu Django cache'inde saklayan decorator.
+    
+    Sadece varsayılan argümanlarla yapılan çağrılar cache'lenir;
+    parametreli çağrılar her zaman veritabanından hesaplanır.
+    """
+    cache_key = f'{STATS_CACHE_PREFIX}:{key}'
+    
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if args or kwargs:
+                return fn(*args, **kwargs)
+            return cache.get_or_set(cache_key, fn, ttl)
+        wrapper.cache_key = cache_key
+        return wrapper
+    return decorator
+
+
+def get_cached_stats(stats):
+    """
+    Cache'te hazır bulunan istatistikleri tek sorguda getirir.
+    
+    `stats` anahtar -> (fonksiyon, varsayılan) sözlüğüdür. Yalnızca
+    @cached_stat ile işaretli fonksiyonlara bakılır; dönen sözlük sadece
+    cache'te bulunan anahtarları içerir.
+    """
+    cache_keys = {
+        fn.cache_key: key
+        for key, (fn, _) in stats.items()
+        if getattr(fn, 'cache_key', None)
+    }
+    if not cache_keys:
+        return {}
+    return {
+        cache_keys[cache_key]: value
+        for cache_key, value in cache.get_many(list(cache_keys)).items()
+    }
+
+
+def invalidate_stats_cache(model_label):
+    """
+    Verilen modele bağlı dashboard istatistiklerini cache'den siler.
+    """
+    keys = STATS_CACHE_DEPENDENCIES.get(model_label, [])
+    if keys:
+        cache.delete_many([f'{STATS_CACHE_PREFIX}:{key}' for key in keys])
+
 
 class DashboardStatisticsService:
     """
@@ -18,131 +107,160 @@ class DashboardStatisticsService:
     """
     
     @staticmethod
+    @cached_stat('user_stats')
     def get_user_stats():
         """
         Kullanıcı istatistikleri.
         """
-        users = User.objects.all()
+        now = timezone.now()
+        today = timezone.localdate(now)
+        week_ago = now - timedelta(days=7)
+        month_start, next_month_start = _current_month_range(now)
         
-        return {
-            'total': users.count(),
-            'admins': users.filter(user_type='admin').count(),
-            'salespersons': users.filter(user_type='salesperson').count(),
-            'customers': users.filter(user_type='customer').count(),
-            'active_today': users.filter(
-                last_activity__date=timezone.now().date()
-            ).count(),
-            'active_week': users.filter(
-                last_activity__gte=timezone.now() - timedelta(days=7)
-            ).count(),
-            'new_this_month': users.filter(
-                date_joined__month=timezone.now().month,
-                date_joined__year=timezone.now().year
-            ).count(),
-        }
+        return User.objects.aggregate(
+            total=Count('id'),
+            admins=Count('id', filter=Q(user_type='admin')),
+            salespersons=Count('id', filter=Q(user_type='salesperson')),
+            customers=Count('id', filter=Q(user_type='customer')),
+            active_today=Count('id', filter=Q(last_activity__date=today)),
+            active_week=Count('id', filter=Q(last_activity__gte=week_ago)),
+            new_this_month=Count('id', filter=Q(
+                date_joined__gte=month_start,
+                date_joined__lt=next_month_start
+            )),
+        )
     
     @staticmethod
+    @cached_stat('order_stats')
     def get_order_stats():
         """
         Sipariş istatistikleri.
         """
         from orders.models import Order, OrderStatus
         
-        orders = Order.objects.all()
-        now = timezone.now()
+        month_start, next_month_start = _current_month_range()
         
-        return {
-            'total': orders.count(),
-            'pending_approval': orders.filter(status=OrderStatus.PENDING_APPROVAL).count(),
-            'processing': orders.filter(status=OrderStatus.PROCESSING).count(),
-            'completed': orders.filter(status=OrderStatus.COMPLETED).count(),
-            'this_month': orders.filter(
-                created_at__month=now.month,
-                created_at__year=now.year
-            ).count(),
-            'total_value': orders.aggregate(Sum('equipment_value'))['equipment_value__sum'] or 0,
-            'avg_value': orders.aggregate(Avg('equipment_value'))['equipment_value__avg'] or 0,
-        }
+        stats = Order.objects.aggregate(
+            total=Count('id'),
+            pending_approval=Count('id', filter=Q(status=OrderStatus.PENDING_APPROVAL)),
+            processing=Count('id', filter=Q(status=OrderStatus.PROCESSING)),
+            completed=Count('id', filter=Q(status=OrderStatus.COMPLETED)),
+            this_month=Count('id', filter=Q(
+                created_at__gte=month_start,
+                created_at__lt=next_month_start
+            )),
+            total_value=Sum('equipment_value'),
+            avg_value=Avg('equipment_value'),
+        )
+        stats['total_value'] = stats['total_value'] or 0
+        stats['avg_value'] = stats['avg_value'] or 0
+        
+        return stats
     
     @staticmethod
+    @cached_stat('customer_stats')
     def get_customer_stats():
         """
         Müşteri istatistikleri.
         """
         from customers.models import Customer, CustomerStage
         
-        customers = Customer.objects.all()
-        now = timezone.now()
+        month_start, next_month_start = _current_month_range()
         
-        return {
-            'total': customers.count(),
-            'active': customers.filter(is_active=True).count(),
-            'new_this_month': customers.filter(
-                created_at__month=now.month,
-                created_at__year=now.year
-            ).count(),
-            'by_stage': {
-                stage.value: customers.filter(stage=stage.value).count()
-                for stage in CustomerStage
-            },
-            'won': customers.filter(stage=CustomerStage.WON).count(),
-            'lost': customers.filter(stage=CustomerStage.LOST).count(),
+        stage_counts = {
+            f'stage_{stage.value}': Count('id', filter=Q(stage=stage.value))
+            for stage in CustomerStage
+        }
+        stats = Customer.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True)),
+            new_this_month=Count('id', filter=Q(
+                created_at__gte=month_start,
+                created_at__lt=next_month_start
+            )),
+            **stage_counts
+        )
+        
+        by_stage = {
+            stage.value: stats.pop(f'stage_{stage.value}')
+            for stage in CustomerStage
         }
+        stats['by_stage'] = by_stage
+        stats['won'] = by_stage[CustomerStage.WON.value]
+        stats['lost'] = by_stage[CustomerStage.LOST.value]
+        
+        return stats
     
     @staticmethod
+    @cached_stat('document_stats')
     def get_document_stats():
         """
         Belge istatistikleri.
         """
         from documents.models import UploadedDocument, DocumentStatus
         
-        docs = UploadedDocument.objects.all()
-        
-        return {
-            'total': docs.count(),
-            'pending': docs.filter(status=DocumentStatus.UPLOADED).count(),
-            'reviewing': docs.filter(status=DocumentStatus.REVIEWING).count(),
-            'approved': docs.filter(status=DocumentStatus.APPROVED).count(),
-            'rejected': docs.filter(status=DocumentStatus.REJECTED).count(),
-        }
+        return UploadedDocument.objects.aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(status=DocumentStatus.UPLOADED)),
+            reviewing=Count('id', filter=Q(status=DocumentStatus.REVIEWING)),
+            approved=Count('id', filter=Q(status=DocumentStatus.APPROVED)),
+            rejected=Count('id', filter=Q(status=DocumentStatus.REJECTED)),
+        )
     
     @staticmethod
+    @cached_stat('department_stats')
     def get_department_stats():
         """
         Departman bazlı istatistikler.
         """
         from accounts.models import Department
-        from customers.models import Customer
         from orders.models import Order
         
-        departments = Department.objects.all()
-        stats = []
-        
-        for dept in departments:
-            salespersons = User.objects.filter(department=dept, user_type='salesperson')
-            salesperson_ids = salespersons.values_list('id', flat=True)
-            
-            customers = Customer.objects.filter(salesperson_id__in=salesperson_ids)
-            orders = Order.objects.filter(salesperson_id__in=salesperson_ids)
-            
-            stats.append({
-                'department': dept,
-                'salesperson_count': salespersons.count(),
-                'customer_count': customers.count(),
-                'order_count': orders.count(),
-                'total_value': orders.aggregate(Sum('equipment_value'))['equipment_value__sum'] or 0,
-            })
+        salesperson_filter = Q(users__user_type='salesperson')
         
-        return stats
+        # Sipariş toplamı ayrı bir alt sorguda hesaplanır; aynı sorgudaki
+        # müşteri join'i SUM değerini çoğaltmasın.
+        order_totals = Order.objects.filter(
+            salesperson__department=OuterRef('pk'),
+            salesperson__user_type='salesperson'
+        ).order_by().values('salesperson__department').annotate(
+            total=Sum('equipment_value')
+        ).values('total')
+        
+        departments = Department.objects.annotate(
+            salesperson_count=Count('users', filter=salesperson_filter, distinct=True),
+            customer_count=Count('users__customers', filter=salesperson_filter, distinct=True),
+            order_count=Count('users__handled_orders', filter=salesperson_filter, distinct=True),
+            total_value=Coalesce(
+                Subquery(order_totals),
+                Value(0),
+                output_field=DecimalField(max_digits=15, decimal_places=2)
+            ),
+        )
+        
+        return [
+            {
+                'department': dept,
+                'salesperson_count': dept.salesperson_count,
+                'customer_count': dept.customer_count,
+                'order_count': dept.order_count,
+                'total_value': dept.total_value,
+            }
+            for dept in departments
+        ]
     
     @staticmethod
+    @cached_stat('orders_by_month')
     def get_orders_by_month(months=6):
         """
         Aylık sipariş trendi.
         """
         from orders.models import Order
         
-        start_date = timezone.now() - timedelta(days=months * 30)
+        # Pencere tam ay sınırından başlar: içinde bulunulan ay dahil son N ay
+        start_date, _ = _current_month_range()
+        for _ in range(months - 1):
+            start_date = (start_date - timedelta(days=1)).replace(day=1)
         
         orders = Order.objects.filter(
             created_at__gte=start_date
@@ -150,7 +268,11 @@ class DashboardStatisticsService:
             month=TruncMonth('created_at')
         ).values('month').annotate(
             count=Count('id'),
-            total_value=Sum('equipment_value')
+            total_value=Coalesce(
+                Sum('equipment_value'),
+                Value(0),
+                output_field=DecimalField(max_digits=15, decimal_places=2)
+            )
         ).order_by('month')
         
         return list(orders)
@@ -162,11 +284,16 @@ class DashboardStatisticsService:
         """
         from core.models import ActivityLog
         
-        return ActivityLog.objects.select_related(
+        # Sorgu, çağıran thread'de çalışsın diye liste döndürülür
+        return list(ActivityLog.objects.select_related(
             'user'
-        ).order_by('-created_at')[:limit]
+        ).only(
+            'action_type', 'description', 'created_at',
+            'user__username', 'user__first_name', 'user__last_name'
+        ).order_by('-created_at')[:limit])
     
     @staticmethod
+    @cached_stat('pending_approvals')
     def get_pending_approvals():
         """
         Onay bekleyen işlemler.
@@ -176,24 +303,32 @@ class DashboardStatisticsService:
         
         pending_orders = Order.objects.filter(
             status=OrderStatus.PENDING_APPROVAL
-        ).select_related('customer', 'salesperson').order_by('submitted_at')[:10]
+        ).select_related('customer').only(
+            'equipment_value', 'submitted_at', 'customer__company_name'
+        ).order_by('submitted_at')[:10]
         
         pending_documents = UploadedDocument.objects.filter(
             status__in=[DocumentStatus.UPLOADED, DocumentStatus.REVIEWING]
-        ).select_related('customer', 'uploaded_by').order_by('created_at')[:10]
+        ).select_related('customer').only(
+            'document_type', 'created_at', 'customer__company_name'
+        ).order_by('created_at')[:10]
         
         pending_kvkk = KVKKDocument.objects.filter(
             signed_document__isnull=False,
             status__in=['uploaded', 'pending_approval']
-        ).select_related('customer').order_by('uploaded_at')[:10]
+        ).select_related('customer').only(
+            'uploaded_at', 'customer__company_name'
+        ).order_by('uploaded_at')[:10]
         
+        # Cache'lenebilmesi için querysetler listeye çevrilir
         return {
-            'orders': pending_orders,
-            'documents': pending_documents,
-            'kvkk': pending_kvkk,
+            'orders': list(pending_orders),
+            'documents': list(pending_documents),
+            'kvkk': list(pending_kvkk),
         }
     
     @staticmethod
+    @cached_stat('system_health')
     def get_system_health():
         """
         Sistem sağlığı metrikleri.
@@ -202,97 +337,219 @@ class DashboardStatisticsService:
         
         now = timezone.now()
         last_24h = now - timedelta(hours=24)
+        online_since = now - timedelta(minutes=15)
         
-        ai_requests = AIRequestLog.objects.filter(created_at__gte=last_24h)
+        ai_stats = AIRequestLog.objects.filter(created_at__gte=last_24h).aggregate(
+            total=Count('id'),
+            success=Count('id', filter=Q(status='success')),
+            avg_response_time=Avg('response_time_ms'),
+        )
         
         return {
-            'ai_requests_24h': ai_requests.count(),
+            'ai_requests_24h': ai_stats['total'],
             'ai_success_rate': (
-                ai_requests.filter(status='success').count() / ai_requests.count() * 100
-                if ai_requests.count() > 0 else 100
+                ai_stats['success'] / ai_stats['total'] * 100
+                if ai_stats['total'] > 0 else 100
             ),
-            'ai_avg_response_time': ai_requests.aggregate(
-                Avg('response_time')
-            )['response_time__avg'] or 0,
+            'ai_avg_response_time': ai_stats['avg_response_time'] or 0,
             'total_users_online': User.objects.filter(
-                last_activity__gte=now - timedelta(minutes=15)
+                last_activity__gte=online_since
             ).count(),
         }
     
     @staticmethod
+    @cached_stat('salesperson_performance')
     def get_salesperson_performance():
         """
         Satışçı performans sıralaması.
         """
-        from customers.models import Customer, CustomerStage
+        from customers.models import CustomerStage
         from orders.models import Order, OrderStatus
         
-        salespersons = User.objects.filter(user_type='salesperson')
-        
-        performance = []
-        for sp in salespersons:
-            customers = Customer.objects.filter(salesperson=sp)
-            orders = Order.objects.filter(salesperson=sp)
-            
-            won_customers = customers.filter(stage=CustomerStage.WON).count()
-            total_value = orders.filter(
-                status=OrderStatus.COMPLETED
-            ).aggregate(Sum('equipment_value'))['equipment_value__sum'] or 0
-            
-            performance.append({
-                'user': sp,
-                'customer_count': customers.count(),
-                'won_customers': won_customers,
-                'order_count': orders.count(),
-                'completed_orders': orders.filter(status=OrderStatus.COMPLETED).count(),
-                'total_value': total_value,
-                'conversion_rate': (won_customers / customers.count() * 100) if customers.count() > 0 else 0,
-            })
+        # Tamamlanan sipariş toplamı alt sorguda; müşteri join'i SUM'ı çoğaltmasın.
+        completed_totals = Order.objects.filter(
+            salesperson=OuterRef('pk'),
+            status=OrderStatus.COMPLETED
+        ).order_by().values('salesperson').annotate(
+            total=Sum('equipment_value')
+        ).values('total')
+        
+        salespersons = User.objects.filter(
+            user_type='salesperson'
+        ).select_related('department').annotate(
+            customer_count=Count('customers', distinct=True),
+            won_customers=Count(
+                'customers',
+                filter=Q(customers__stage=CustomerStage.WON),
+                distinct=True
+            ),
+            order_count=Count('handled_orders', distinct=True),
+            completed_orders=Count(
+                'handled_orders',
+                filter=Q(handled_orders__status=OrderStatus.COMPLETED),
+                distinct=True
+            ),
+            total_value=Coalesce(
+                Subquery(completed_totals),
+                Value(0),
+                output_field=DecimalField(max_digits=15, decimal_places=2)
+            ),
+        ).order_by('-total_value')
         
-        # Sort by total value
-        performance.sort(key=lambda x: x['total_value'], reverse=True)
+        performance = [
+            {
+                'user': sp,
+                'customer_count': sp.customer_count,
+                'won_customers': sp.won_customers,
+                'order_count': sp.order_count,
+                'completed_orders': sp.completed_orders,
+                'total_value': sp.total_value,
+                'conversion_rate': (
+                    sp.won_customers / sp.customer_count * 100
+                    if sp.customer_count > 0 else 0
+                ),
+            }
+            for sp in salespersons
+        ]
         
         return performance
     
     @staticmethod
-    def get_customer_proposal_stats(customer):
+    def get_customer_proposal_stats(customer_id):
         """
         Müşteri için teklif istatistikleri.
         """
         from proposals.models import Proposal
         
-        proposals = Proposal.objects.filter(customer=customer)
-        
-        return {
-            'total': proposals.count(),
-            'active': proposals.filter(status__in=['draft', 'sent', 'viewed']).count(),
-            'sent': proposals.filter(status='sent').count(),
-            'accepted': proposals.filter(status='accepted').count(),
-            'rejected': proposals.filter(status='rejected').count(),
-        }
+        return Proposal.objects.filter(customer_id=customer_id).aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(status__in=['draft', 'sent', 'viewed'])),
+            sent=Count('id', filter=Q(status='sent')),
+            accepted=Count('id', filter=Q(status='accepted')),
+            rejected=Count('id', filter=Q(status='rejected')),
+        )
     
     @staticmethod
-    def get_customer_recent_proposals(customer, limit=5):
+    def get_customer_recent_proposals(customer_id, limit=5):
         """
         Müşterinin son teklifleri.
         """
         from proposals.models import Proposal
         
         return Proposal.objects.filter(
-            customer=customer
+            customer_id=customer_id
         ).order_by('-created_at')[:limit]
     
     @staticmethod
-    def get_customer_document_count(customer):
+    def get_customer_document_count(customer_id):
         """
         Müşterinin toplam belge sayısı.
         """
-        from documents.models import UploadedDocument, KVKKDocument
+        from customers.models import Customer
+        
+        counts = Customer.objects.filter(pk=customer_id).aggregate(
+            uploaded=Count('documents', distinct=True),
+            kvkk=Count('kvkk_document', distinct=True),
+        )
+        
+        return counts['uploaded'] + counts['kvkk']
+    
+    @staticmethod
+    def refresh_snapshot():
+        """
+        İstatistikleri yeniden hesaplayıp DashboardSnapshot satırına yazar.
+        """
+        from accounts.models import DashboardSnapshot
         
-        uploaded_docs = UploadedDocument.objects.filter(customer=customer).count()
-        kvkk_docs = KVKKDocument.objects.filter(customer=customer).count()
+        service = DashboardStatisticsService
+        department_stats = [
+            {
+                **stat,
+                'department': {
+                    'id': stat['department'].pk,
+                    'name': stat['department'].name,
+                },
+            }
+            for stat in service.get_department_stats.__wrapped__()
+        ]
+        
+        # Cache'lenmiş değerler yerine doğrudan veritabanından hesapla
+        snapshot, _ = DashboardSnapshot.objects.update_or_create(
+            pk=1,
+            defaults={
+                'user_stats': service.get_user_stats.__wrapped__(),
+                'order_stats': service.get_order_stats.__wrapped__(),
+                'customer_stats': service.get_customer_stats.__wrapped__(),
+                'document_stats': service.get_document_stats.__wrapped__(),
+                'department_stats': department_stats,
+                'system_health': service.get_system_health.__wrapped__(),
+            }
+        )
+        return snapshot
+    
+    @staticmethod
+    def get_snapshot():
+        """
+        Güncel DashboardSnapshot satırını döndürür.
+        DASHBOARD_SNAPSHOT_MAX_AGE saniyeden eskiyse None döner.
+        """
+        from accounts.models import DashboardSnapshot
         
-        return uploaded_docs + kvkk_docs
+        max_age = getattr(settings, 'DASHBOARD_SNAPSHOT_MAX_AGE', 300)
+        return DashboardSnapshot.objects.filter(
+            pk=1,
+            updated_at__gte=timezone.now() - timedelta(seconds=max_age)
+        ).first()
+
+
+def _top_salesperson_performance(limit=10):
+    return DashboardStatisticsService.get_salesperson_performance()[:limit]
 
 
+# Admin dashboard istatistikleri: anahtar -> (fonksiyon, hata durumunda varsayılan).
+# Varsayılanı None olan istatistiklerde hata yukarı iletilir. Kayıt modül
+# yüklenirken kurulur; AccountsConfig.ready() içinde doğrulanır.
+# Fonksiyonlar worker thread'de çalışır; lazy queryset değil, hesaplanmış
+# değer (liste, sözlük) döndürmelidir.
+ADMIN_DASHBOARD_STATS = {
+    'user_stats': (DashboardStatisticsService.get_user_stats, None),
+    'order_stats': (
+        DashboardStatisticsService.get_order_stats,
+        {'total': 0, 'pending_approval': 0, 'processing': 0, 'completed': 0}
+    ),
+    'customer_stats': (DashboardStatisticsService.get_customer_stats, {'total': 0, 'active': 0}),
+    'document_stats': (DashboardStatisticsService.get_document_stats, {'total': 0, 'pending': 0}),
+    'department_stats': (DashboardStatisticsService.get_department_stats, []),
+    'system_health': (
+        DashboardStatisticsService.get_system_health,
+        {'ai_requests_24h': 0, 'ai_success_rate': 100}
+    ),
+    'recent_activities': (
+        partial(DashboardStatisticsService.get_recent_activities, limit=10), []
+    ),
+    'pending_approvals': (
+        DashboardStatisticsService.get_pending_approvals,
+        {'orders': [], 'documents': [], 'kvkk': []}
+    ),
+    'salesperson_performance': (_top_salesperson_performance, []),
+    'orders_by_month': (DashboardStatisticsService.get_orders_by_month, []),
+}
 
+
+def validate_admin_dashboard_stats():
+    """
+    Kayıttaki her girdinin çağrılabilir olduğunu ve DashboardSnapshot
+    alanlarının hepsinin kayıtta bulunduğunu kontrol eder.
+    """
+    from django.core.exceptions import ImproperlyConfigured
+    from accounts.models import DashboardSnapshot
+    
+    for key, (fn, _) in ADMIN_DASHBOARD_STATS.items():
+        if not callable(fn):
+            raise ImproperlyConfigured(f"Dashboard istatistiği çağrılabilir değil: {key}")
+    
+    missing = set(DashboardSnapshot.SNAPSHOT_FIELDS) - set(ADMIN_DASHBOARD_STATS)
+    if missing:
+        raise ImproperlyConfigured(
+            f"Dashboard özet alanları kayıtta yok: {', '.join(sorted(missing))}"
+        )
@@ -0,0 +1,29 @@
+"""
+Accounts signals.
+Invalidates cached dashboard statistics when their source tables change.
+"""
+
+from django.db.models.signals import post_save, post_delete
+
+from .services.dashboard_service import (
+    STATS_CACHE_DEPENDENCIES,
+    invalidate_stats_cache,
+)
+
+
+def invalidate_dashboard_stats(sender, **kwargs):
+    """Drop cached statistics that depend on the sender's table."""
+    invalidate_stats_cache(sender._meta.label_lower)
+
+
+for model_label in STATS_CACHE_DEPENDENCIES:
+    post_save.connect(
+        invalidate_dashboard_stats,
+        sender=model_label,
+        dispatch_uid=f'invalidate_dashboard_stats_save_{model_label}'
+    )
+    post_delete.connect(
+        invalidate_dashboard_stats,
+        sender=model_label,
+        dispatch_uid=f'invalidate_dashboard_stats_delete_{model_label}'
+    )
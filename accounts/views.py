@@ -6,15 +6,59 @@ Authentication, user management, and dashboards.
 from django.shortcuts import render, redirect
 from django.contrib.auth import login, logout, authenticate
 from django.contrib.auth.decorators import login_required
+from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.views import (
     LoginView, LogoutView, 
     PasswordResetView, PasswordResetDoneView,
     PasswordResetConfirmView, PasswordResetCompleteView
 )
+from django.conf import settings
 from django.contrib import messages
 from django.urls import reverse_lazy
 from django.views.generic import TemplateView
-from django.utils import timezone
+from django.db.models import Case, IntegerField, Value, When
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+
+from core.mixins import AdminRequiredMixin
+from core.utils.db import run_with_own_connection
+
+
+logger = logging.getLogger(__name__)
+
+# Kullanıcı tipine göre dashboard URL adları; süper kullanıcılar 'admin' sayılır.
+_DASHBOARD_ROUTES = {
+    'admin': 'admin_dashboard',
+    'salesperson': 'sales_dashboard',
+    'customer': 'customer_dashboard',
+}
+
+
+# Admin dashboard istatistikleri için paylaşılan worker havuzu; ilk
+# kullanımda kurulur, istek başına yeniden oluşturulmaz.
+_stats_executor = None
+_stats_executor_lock = threading.Lock()
+
+
+def _get_stats_executor():
+    """Paylaşılan istatistik havuzunu ilk kullanımda oluşturur."""
+    global _stats_executor
+    if _stats_executor is None:
+        with _stats_executor_lock:
+            if _stats_executor is None:
+                _stats_executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'DASHBOARD_STATS_WORKERS', 10),
+                    thread_name_prefix='dashboard-stats'
+                )
+    return _stats_executor
+
+
+def _dashboard_route(user):
+    """Kullanıcının yönlendirileceği dashboard URL adını döndürür."""
+    return _DASHBOARD_ROUTES.get(
+        'admin' if user.is_superuser else user.user_type, 'customer_dashboard'
+    )
 
 
 class CustomLoginView(LoginView):
@@ -26,20 +70,13 @@ class CustomLoginView(LoginView):
     
     def get_success_url(self):
         """Kullanıcı tipine göre yönlendirme yapar."""
-        user = self.request.user
-        if user.is_superuser or user.user_type == 'admin':
-            return reverse_lazy('admin_dashboard')
-        elif user.user_type == 'salesperson':
-            return reverse_lazy('sales_dashboard')
-        else:
-            return reverse_lazy('customer_dashboard')
+        return reverse_lazy(_dashboard_route(self.request.user))
     
     def form_valid(self, form):
         """Başarılı giriş sonrası işlemler."""
         response = super().form_valid(form)
-        # Update last activity
-        self.request.user.last_activity = timezone.now()
-        self.request.user.save(update_fields=['last_activity'])
+        # last_activity, ActivityTrackingMiddleware tarafından bu isteğin
+        # yanıtında (en fazla 5 dakikada bir) güncellenir.
         messages.success(self.request, f'Hoş geldiniz, {self.request.user.full_name}!')
         return response
     
@@ -107,92 +144,68 @@ class CustomPasswordResetCompleteView(PasswordResetCompleteView):
 
 # Dashboard Views
 
-class DashboardRedirectView(TemplateView):
+class DashboardRedirectView(LoginRequiredMixin, TemplateView):
     """
     Kullanıcı tipine göre uygun dashboard'a yönlendirir.
     """
     
     def get(self, request, *args, **kwargs):
-        if not request.user.is_authenticated:
-            return redirect('accounts:login')
-        
-        user = request.user
-        if user.is_superuser or user.user_type == 'admin':
-            return redirect('admin_dashboard')
-        elif user.user_type == 'salesperson':
-            return redirect('sales_dashboard')
-        else:
-            return redirect('customer_dashboard')
+        return redirect(_dashboard_route(request.user))
 
 
-class AdminDashboardView(TemplateView):
+class AdminDashboardView(AdminRequiredMixin, TemplateView):
     """
     Admin dashboard görünümü.
     """
     template_name = 'dashboard/admin_dashboard.html'
     
-    def dispatch(self, request, *args, **kwargs):
-        """Admin kontrolü yap."""
-        if not request.user.is_authenticated:
-            return redirect('accounts:login')
-        if not (request.user.is_superuser or request.user.user_type == 'admin'):
-            messages.error(request, 'Bu sayfaya erişim yetkiniz yok.')
-            return redirect('dashboard')
-        return super().dispatch(request, *args, **kwargs)
-    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['page_title'] = 'Yönetici Paneli'
         
-        from .services import DashboardStatisticsService
-        
-        # Get all statistics
-        context['user_stats'] = DashboardStatisticsService.get_user_stats()
-        
-        try:
-            context['order_stats'] = DashboardStatisticsService.get_order_stats()
-        except Exception:
-            context['order_stats'] = {'total': 0, 'pending_approval': 0, 'processing': 0, 'completed': 0}
-        
-        try:
-            context['customer_stats'] = DashboardStatisticsService.get_customer_stats()
-        except Exception:
-            context['customer_stats'] = {'total': 0, 'active': 0}
-        
-        try:
-            context['document_stats'] = DashboardStatisticsService.get_document_stats()
-        except Exception:
-            context['document_stats'] = {'total': 0, 'pending': 0}
-        
-        try:
-            context['department_stats'] = DashboardStatisticsService.get_department_stats()
-        except Exception:
-            context['department_stats'] = []
-        
-        try:
-            context['recent_activities'] = DashboardStatisticsService.get_recent_activities(limit=10)
-        except Exception:
-            context['recent_activities'] = []
-        
-        try:
-            context['pending_approvals'] = DashboardStatisticsService.get_pending_approvals()
-        except Exception:
-            context['pending_approvals'] = {'orders': [], 'documents': [], 'kvkk': []}
-        
-        try:
-            context['system_health'] = DashboardStatisticsService.get_system_health()
-        except Exception:
-            context['system_health'] = {'ai_requests_24h': 0, 'ai_success_rate': 100}
-        
-        try:
-            context['salesperson_performance'] = DashboardStatisticsService.get_salesperson_performance()[:10]
-        except Exception:
-            context['salesperson_performance'] = []
+        from .services import (
+            DashboardStatisticsService, ADMIN_DASHBOARD_STATS, get_cached_stats
+        )
         
-        try:
-            context['orders_by_month'] = DashboardStatisticsService.get_orders_by_month()
-        except Exception:
-            context['orders_by_month'] = []
+        stat_tasks = dict(ADMIN_DASHBOARD_STATS)
+        
+        # Önceden hesaplanmış özet varsa onu kullan, kalanları canlı hesapla
+        snapshot = DashboardStatisticsService.get_snapshot()
+        if snapshot:
+            snapshot_context = snapshot.to_context()
+            context.update(snapshot_context)
+            for key in snapshot_context:
+                stat_tasks.pop(key, None)
+        
+        # Cache'te hazır olanlar istek thread'inde alınır; havuza yalnızca
+        # hesaplanması gerekenler gönderilir
+        cached = get_cached_stats(stat_tasks)
+        context.update(cached)
+        for key in cached:
+            stat_tasks.pop(key)
+        
+        # Birbirinden bağımsız sorgular paralel çalıştırılır. Worker thread'ler
+        # kendi bağlantılarını açtığından, test transaction'ı içindeki veriyi
+        # göremezler; testlerde DASHBOARD_PARALLEL_STATS = False kullanılmalıdır.
+        if getattr(settings, 'DASHBOARD_PARALLEL_STATS', True) and len(stat_tasks) > 1:
+            executor = _get_stats_executor()
+            futures = {
+                key: executor.submit(run_with_own_connection, fn)
+                for key, (fn, _) in stat_tasks.items()
+            }
+            results = {key: future.result for key, future in futures.items()}
+        else:
+            results = {key: fn for key, (fn, _) in stat_tasks.items()}
+        
+        for key, result in results.items():
+            default = stat_tasks[key][1]
+            try:
+                context[key] = result()
+            except Exception:
+                if default is None:
+                    raise
+                logger.exception("Dashboard istatistiği hesaplanamadı: %s", key)
+                context[key] = default
         
         return context
 
@@ -212,17 +225,29 @@ class SalesDashboardView(TemplateView):
         # Import services
         from customers.services import CustomerService
         from tasks.services import TaskService
-        from customers.models import CustomerNote
-        from documents.models import KVKKDocument
+        from customers.models import Customer, CustomerNote
+        from documents.models import KVKKDocument, KVKKStatus, KVKK_STATUS_CLASSES
+        
+        # Satışçının müşteri id'leri bir kez çekilir; aşağıdaki sorgular
+        # alt sorguyu tekrar çalıştırmak yerine bu listeyi kullanır.
+        customer_ids = list(
+            Customer.objects.filter(salesperson=user).values_list('id', flat=True)
+        )
         
         # Customer statistics
         context['customer_stats'] = CustomerService.get_dashboard_stats(user)
         
         # Pending customer requests (revision requests from customers)
-        context['pending_customer_requests'] = CustomerNote.objects.filter(
-            customer__salesperson=user,
-            note_type='customer_request'
-        ).select_related('customer', 'created_by').order_by('-created_at')[:5]
+        # Tek sorgu; hem context'te hem de pending_actions içinde kullanılır.
+        customer_requests = list(
+            CustomerNote.objects.filter(
+                customer_id__in=customer_ids,
+                note_type='customer_request'
+            ).order_by('-created_at').values(
+                'content', 'created_at', 'customer_id', 'customer__company_name'
+            )[:5]
+        )
+        context['pending_customer_requests'] = customer_requests
         context['stage_summary'] = CustomerService.get_stage_summary(user)
         
         # Task statistics
@@ -230,28 +255,43 @@ class SalesDashboardView(TemplateView):
         
         # Today's priorities - Combined list of all pending actions
         pending_actions = []
+        pending_actions_limit = 8
         
         # 1. KVKK documents needing action (pending_approval, uploaded, revision_requested)
+        # Öncelik SQL'de hesaplanır; listeye en fazla limit kadar belge girebileceği
+        # için gerisi veritabanından hiç çekilmez.
         kvkk_docs = KVKKDocument.objects.filter(
-            customer__salesperson=user,
+            customer_id__in=customer_ids,
             status__in=['pending_approval', 'uploaded', 'revision_requested', 'pending_signature']
-        ).select_related('customer')
-        
+        ).annotate(
+            priority=Case(
+                When(status='pending_approval', then=Value(90)),
+                When(status='uploaded', then=Value(85)),
+                default=Value(80),
+                output_field=IntegerField()
+            )
+        ).order_by('-priority', '-created_at').values(
+            'status', 'priority', 'created_at', 'customer_id', 'customer__company_name'
+        )[:pending_actions_limit]
+        
+        # Satırlar sözlük olarak gelir; model örneği oluşturulmaz. Şablon
+        # yalnızca müşterinin pk ve company_name alanlarını kullanır.
         for kvkk in kvkk_docs:
-            priority = 90 if kvkk.status == 'pending_approval' else 85 if kvkk.status == 'uploaded' else 80
-            action_type = 'kvkk_approval' if kvkk.status == 'pending_approval' else 'kvkk_review' if kvkk.status == 'uploaded' else 'kvkk_pending'
+            status = kvkk['status']
+            status_display = KVKKStatus(status).label
+            action_type = 'kvkk_approval' if status == 'pending_approval' else 'kvkk_review' if status == 'uploaded' else 'kvkk_pending'
             pending_actions.append({
                 'type': 'kvkk',
                 'action_type': action_type,
-                'priority': priority,
-                'title': f"KVKK - {kvkk.customer.company_name}",
-                'description': kvkk.get_status_display(),
-                'customer': kvkk.customer,
-                'url': f"/customers/{kvkk.customer.pk}/",
-                'status': kvkk.status,
-                'status_display': kvkk.get_status_display(),
-                'status_class': kvkk.status_display_class,
-                'created_at': kvkk.created_at,
+                'priority': kvkk['priority'],
+                'title': f"KVKK - {kvkk['customer__company_name']}",
+                'description': status_display,
+                'customer': {'pk': kvkk['customer_id'], 'company_name': kvkk['customer__company_name']},
+                'url': f"/customers/{kvkk['customer_id']}/",
+                'status': status,
+                'status_display': status_display,
+                'status_class': KVKK_STATUS_CLASSES.get(status, 'bg-slate-100 text-slate-700'),
+                'created_at': kvkk['created_at'],
             })
         
         # 2. Tasks with high priority
@@ -274,28 +314,24 @@ class SalesDashboardView(TemplateView):
             })
         
         # 3. Customer requests
-        customer_requests = CustomerNote.objects.filter(
-            customer__salesperson=user,
-            note_type='customer_request'
-        ).select_related('customer', 'created_by').order_by('-created_at')[:5]
-        
         for req in customer_requests:
+            content = req['content']
             pending_actions.append({
                 'type': 'customer_request',
                 'action_type': 'customer_request',
                 'priority': 88,  # High priority for customer requests
-                'title': f"Müşteri İsteği - {req.customer.company_name}",
-                'description': req.content[:100] + '...' if len(req.content) > 100 else req.content,
-                'customer': req.customer,
-                'url': f"/customers/{req.customer.pk}/",
-                'created_at': req.created_at,
+                'title': f"Müşteri İsteği - {req['customer__company_name']}",
+                'description': content[:100] + '...' if len(content) > 100 else content,
+                'customer': {'pk': req['customer_id'], 'company_name': req['customer__company_name']},
+                'url': f"/customers/{req['customer_id']}/",
+                'created_at': req['created_at'],
             })
         
         # Sort by priority descending
         pending_actions.sort(key=lambda x: x['priority'], reverse=True)
         
-        # Take top 8 items
-        context['pending_actions'] = pending_actions[:8]
+        # Take top items
+        context['pending_actions'] = pending_actions[:pending_actions_limit]
         
         # Legacy - keep todays_priorities for backward compatibility
         context['todays_priorities'] = tasks[:5]
@@ -331,14 +367,17 @@ class CustomerDashboardView(TemplateView):
             # Import services
             from .services import DashboardStatisticsService
             
+            # Servisler yalnızca müşteri ID'si ile filtreler
+            customer_id = customer.pk
+            
             # Proposal statistics
-            context['proposal_stats'] = DashboardStatisticsService.get_customer_proposal_stats(customer)
+            context['proposal_stats'] = DashboardStatisticsService.get_customer_proposal_stats(customer_id)
             
             # Recent proposals
-            context['recent_proposals'] = DashboardStatisticsService.get_customer_recent_proposals(customer)
+            context['recent_proposals'] = DashboardStatisticsService.get_customer_recent_proposals(customer_id)
             
             # Document count
-            context['document_count'] = DashboardStatisticsService.get_customer_document_count(customer)
+            context['document_count'] = DashboardStatisticsService.get_customer_document_count(customer_id)
             
             # Customer's salesperson
             context['salesperson'] = customer.salesperson
@@ -3,6 +3,9 @@ AI Services configuration.
 System prompts and service-specific settings.
 """
 
+from types import MappingProxyType
+from typing import NamedTuple
+
 # Document Validation System Prompt
 DOCUMENT_VALIDATION_SYSTEM_PROMPT = """Sen bir belge validasyon asistanısın. Görevin yüklenen belgeleri analiz edip gerekli alanların dolu olup olmadığını kontrol etmek.
 
@@ -126,7 +129,14 @@ Yanıtını JSON formatında ver:
 }"""
 
 # Service-specific settings
-AI_SERVICE_SETTINGS = {
+class AIServiceSettings(NamedTuple):
+    """Settings for a single AI service (read-only)."""
+    max_tokens: int
+    temperature: float
+    timeout: int
+
+
+_RAW_AI_SERVICE_SETTINGS = {
     'document_validation': {
         'max_tokens': 2048,
         'temperature': 0.3,  # More deterministic
@@ -154,3 +164,8 @@ AI_SERVICE_SETTINGS = {
     }
 }
 
+# Read-only: AI_SERVICE_SETTINGS['document_validation'].max_tokens
+AI_SERVICE_SETTINGS = MappingProxyType({
+    name: AIServiceSettings(**values)
+    for name, values in _RAW_AI_SERVICE_SETTINGS.items()
+})
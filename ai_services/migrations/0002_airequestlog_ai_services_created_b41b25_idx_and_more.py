@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-16 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_services', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='airequestlog',
+            index=models.Index(fields=['-created_at', 'status'], name='ai_services_created_b41b25_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='airequestlog',
+            index=models.Index(fields=['service_type', 'status'], name='ai_services_service_db1b34_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='airequestlog',
+            index=models.Index(condition=models.Q(('status', 'success')), fields=['created_at'], name='ai_success_recent_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0 on 2026-10-16 13:30
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import ExpressionWrapper, F
+
+
+def backfill_estimated_cost(apps, schema_editor):
+    """Mevcut loglar için tahmini maliyeti token sayılarından hesapla."""
+    AIRequestLog = apps.get_model('ai_services', 'AIRequestLog')
+    AIRequestLog.objects.update(
+        estimated_cost_stored=ExpressionWrapper(
+            F('prompt_tokens') * Decimal('0.000003')
+            + F('completion_tokens') * Decimal('0.000015'),
+            output_field=models.DecimalField(max_digits=12, decimal_places=6)
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_services', '0002_airequestlog_ai_services_created_b41b25_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='airequestlog',
+            name='estimated_cost_stored',
+            field=models.DecimalField(decimal_places=6, default=Decimal('0'), max_digits=12, verbose_name='Tahmini Maliyet (USD)'),
+        ),
+        migrations.RunPython(backfill_estimated_cost, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-10-16 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_services', '0003_airequestlog_estimated_cost_stored'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='aivalidationresult',
+            name='document_id',
+            field=models.PositiveIntegerField(verbose_name='Belge ID'),
+        ),
+        migrations.AddIndex(
+            model_name='aivalidationresult',
+            index=models.Index(fields=['document_id', '-created_at'], name='ai_services_documen_107cfc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aivalidationresult',
+            index=models.Index(fields=['document_type'], name='ai_services_documen_9d5944_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0 on 2026-10-16 14:00
+
+from django.db import migrations
+
+
+BRIN_INDEX_NAME = 'ai_requestlog_created_brin'
+
+
+def create_brin_index(apps, schema_editor):
+    """Sadece PostgreSQL'de created_at için BRIN index oluştur."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {BRIN_INDEX_NAME} '
+        f'ON ai_services_airequestlog USING brin (created_at) '
+        f'WITH (pages_per_range = 32)'
+    )
+
+
+def drop_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {BRIN_INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_services', '0004_alter_aivalidationresult_document_id_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_brin_index, drop_brin_index),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-16 14:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_services', '0005_airequestlog_created_at_brin'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='airequestlog',
+            index=models.Index(fields=['service_type', 'created_at'], name='ai_services_service_46d561_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-16 15:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_services', '0006_airequestlog_ai_services_service_46d561_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='airequestlog',
+            name='service_type',
+            field=models.CharField(choices=[('document_validation', 'Belge Validasyonu'), ('task_prioritization', 'Görev Önceliklendirme'), ('proposal_generation', 'Teklif Oluşturma'), ('customer_research', 'Müşteri Araştırması'), ('signature_detection', 'İmza Tespiti'), ('form_validation', 'Form Validasyonu'), ('asset_analysis', 'Varlık Analizi'), ('local_check', 'Yerel Kontrol')], max_length=30, verbose_name='Servis Tipi'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-16 18:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_services', '0007_alter_airequestlog_service_type'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='airequestlog',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='Oluşturulma Tarihi'),
+        ),
+    ]
@@ -5,7 +5,14 @@ Models for storing AI-related data like responses and logs.
 
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
+from decimal import Decimal
+
+
+# Claude Sonnet 4 pricing (approximate, USD per token)
+INPUT_COST_PER_TOKEN = Decimal('3.0') / 1_000_000
+OUTPUT_COST_PER_TOKEN = Decimal('15.0') / 1_000_000
 
 
 class AIRequestLog(models.Model):
@@ -22,6 +29,7 @@ class AIRequestLog(models.Model):
         SIGNATURE_DETECTION = 'signature_detection', _('İmza Tespiti')
         FORM_VALIDATION = 'form_validation', _('Form Validasyonu')
         ASSET_ANALYSIS = 'asset_analysis', _('Varlık Analizi')
+        LOCAL_CHECK = 'local_check', _('Yerel Kontrol')
     
     class Status(models.TextChoices):
         PENDING = 'pending', _('Bekliyor')
@@ -91,33 +99,64 @@ class AIRequestLog(models.Model):
         blank=True
     )
     
+    estimated_cost_stored = models.DecimalField(
+        _('Tahmini Maliyet (USD)'),
+        max_digits=12,
+        decimal_places=6,
+        default=Decimal('0')
+    )
+    
+    # auto_now_add yerine default: satırlar arka planda toplu yazıldığında
+    # zaman damgası yazma anını değil, olayın oluştuğu anı gösterir
     created_at = models.DateTimeField(
         _('Oluşturulma Tarihi'),
-        auto_now_add=True
+        default=timezone.now,
+        editable=False
     )
     
     class Meta:
         verbose_name = _('AI İstek Logu')
         verbose_name_plural = _('AI İstek Logları')
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', 'status']),
+            models.Index(fields=['service_type', 'status']),
+            models.Index(fields=['service_type', 'created_at']),
+            # Başarı oranı hesaplaması için sadece başarılı istekler
+            models.Index(
+                fields=['created_at'],
+                condition=models.Q(status='success'),
+                name='ai_success_recent_idx'
+            ),
+        ]
     
     def __str__(self):
         return f"{self.service_type} - {self.status} - {self.created_at}"
     
-    @property
-    def estimated_cost(self) -> float:
+    @staticmethod
+    def calculate_cost(prompt_tokens: int, completion_tokens: int) -> Decimal:
         """
         Calculate estimated cost based on token usage.
         Uses Claude Sonnet pricing (approximate).
         """
-        # Claude Sonnet 4 pricing (approximate, per 1M tokens)
-        input_cost_per_million = 3.0
-        output_cost_per_million = 15.0
-        
-        input_cost = (self.prompt_tokens / 1_000_000) * input_cost_per_million
-        output_cost = (self.completion_tokens / 1_000_000) * output_cost_per_million
+        input_cost = prompt_tokens * INPUT_COST_PER_TOKEN
+        output_cost = completion_tokens * OUTPUT_COST_PER_TOKEN
         
-        return round(input_cost + output_cost, 6)
+        return (input_cost + output_cost).quantize(Decimal('0.000001'))
+    
+    def save(self, *args, **kwargs):
+        self.estimated_cost_stored = self.calculate_cost(
+            self.prompt_tokens, self.completion_tokens
+        )
+        super().save(*args, **kwargs)
+    
+    @property
+    def estimated_cost(self) -> float:
+        """
+        Estimated cost stored at save time.
+        Aggregate reports should use Sum('estimated_cost_stored') instead.
+        """
+        return float(self.estimated_cost_stored)
 
 
 class AIValidationResult(models.Model):
@@ -126,8 +165,7 @@ class AIValidationResult(models.Model):
     """
     
     document_id = models.PositiveIntegerField(
-        _('Belge ID'),
-        db_index=True
+        _('Belge ID')
     )
     document_type = models.CharField(
         _('Belge Tipi'),
@@ -187,6 +225,11 @@ class AIValidationResult(models.Model):
         verbose_name = _('AI Validasyon Sonucu')
         verbose_name_plural = _('AI Validasyon Sonuçları')
         ordering = ['-created_at']
+        indexes = [
+            # Belgenin en son validasyon sonucu; document_id aramalarını da karşılar
+            models.Index(fields=['document_id', '-created_at']),
+            models.Index(fields=['document_type']),
+        ]
     
     def __str__(self):
         status = "Geçerli" if self.is_valid else "Geçersiz"
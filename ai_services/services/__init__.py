@@ -1,5 +1,6 @@
-from .claude import ClaudeService
+from .claude import ClaudeService, get_shared_claude
 from .document_validator import DocumentValidator
 from .signature_validator import SignatureValidator
+from .orchestrator import ValidationOrchestrator
 
-__all__ = ['ClaudeService', 'DocumentValidator', 'SignatureValidator']
+__all__ = ['ClaudeService', 'get_shared_claude', 'DocumentValidator', 'SignatureValidator', 'ValidationOrchestrator']
@@ -0,0 +1,149 @@
+"""
+JSON helpers for Claude responses.
+Uses jiter (installed with the anthropic SDK) when available.
+"""
+
+import copy
+import json
+import re
+
+try:
+    import jiter
+    JITER_AVAILABLE = True
+except ImportError:
+    JITER_AVAILABLE = False
+
+
+def loads(data):
+    """
+    Parse JSON text or bytes.
+    Raises ValueError (json.JSONDecodeError is a subclass) on invalid input.
+    """
+    if not JITER_AVAILABLE:
+        return json.loads(data)
+    if isinstance(data, str):
+        data = data.encode()
+    return jiter.from_json(data)
+
+
+def loads_partial(data):
+    """
+    Parse a possibly incomplete JSON document (e.g. a streamed response),
+    returning whatever has been received so far. Needs jiter; returns None
+    when it is not available or nothing can be parsed yet.
+    """
+    if not JITER_AVAILABLE:
+        return None
+    if isinstance(data, str):
+        data = data.encode()
+    try:
+        return jiter.from_json(data, partial_mode='trailing-strings')
+    except ValueError:
+        return None
+
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
+
+def find_json_span(text: str):
+    """
+    Locate the first complete JSON object or array in text with a
+    single-pass bracket counter that skips brackets inside strings.
+    Returns (start, end) with end exclusive, or None if there is no
+    balanced value.
+    """
+    starts = [i for i in (text.find('{'), text.find('[')) if i != -1]
+    if not starts:
+        return None
+    
+    start = min(starts)
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in '{[':
+            depth += 1
+        elif char in '}]':
+            depth -= 1
+            if depth == 0:
+                return start, i + 1
+    return None
+
+
+def _balanced_slice(text: str):
+    """
+    Return the first complete JSON object or array in text, or None.
+    """
+    span = find_json_span(text)
+    return text[span[0]:span[1]] if span else None
+
+
+def _candidates(text: str):
+    """
+    Yield progressively repaired versions of an LLM response.
+    The cheapest candidate (the stripped text itself) comes first.
+    """
+    text = text.strip()
+    yield text
+    
+    # Markdown code fence
+    match = _FENCE_RE.search(text)
+    if match:
+        text = match.group(1).strip()
+        yield text
+    
+    # Surrounding prose: slice out the first balanced object/array
+    sliced = _balanced_slice(text)
+    if sliced is not None:
+        text = sliced
+        yield text
+    
+    # Trailing commas
+    yield _TRAILING_COMMA_RE.sub(r"\1", text)
+
+
+def extract_json(text: str):
+    """
+    Extract the JSON value from an LLM response.
+    Handles markdown fences, surrounding prose and trailing commas.
+    Raises ValueError if no candidate parses.
+    """
+    error = None
+    for candidate in _candidates(text or ""):
+        try:
+            return loads(candidate)
+        except ValueError as e:
+            error = e
+    raise error
+
+
+def parse_llm_json(response: str, default=None):
+    """
+    Parse a JSON object from an LLM response.
+    Returns a copy of default if the response holds no valid JSON object.
+    """
+    try:
+        result = extract_json(response)
+    except ValueError:
+        result = None
+    return as_object(result, default)
+
+
+def as_object(value, default=None):
+    """
+    Return value if it is a JSON object (dict), else a copy of default.
+    """
+    if isinstance(value, dict):
+        return value
+    return copy.deepcopy(default)
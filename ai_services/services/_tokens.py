@@ -0,0 +1,45 @@
+"""
+Token budget helpers.
+Cheap local token estimates for trimming document text before it is sent
+to Claude. Turkish text averages roughly 3.5 UTF-8 bytes per token, so
+characters like 'ş', 'ğ' and 'İ' count more than plain ASCII.
+"""
+
+BYTES_PER_TOKEN = 3.5
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in text.
+    """
+    return int(len(text.encode('utf-8')) / BYTES_PER_TOKEN)
+
+
+def fit_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Return the longest prefix of text that fits in max_tokens.
+    """
+    limit = int(max_tokens * BYTES_PER_TOKEN)
+    # A character is at most 4 bytes; short texts need no encoding
+    if len(text) * 4 <= limit:
+        return text
+    
+    data = text.encode('utf-8')
+    if len(data) <= limit:
+        return text
+    return data[:limit].decode('utf-8', errors='ignore')
+
+
+def fit_to_tokens_tail(text: str, max_tokens: int) -> str:
+    """
+    Return the longest suffix of text that fits in max_tokens.
+    Used where the relevant part is at the end (signatures, seals).
+    """
+    limit = int(max_tokens * BYTES_PER_TOKEN)
+    if len(text) * 4 <= limit:
+        return text
+    
+    data = text.encode('utf-8')
+    if len(data) <= limit:
+        return text
+    return data[-limit:].decode('utf-8', errors='ignore')
@@ -0,0 +1,170 @@
+"""
+Claude Message Batches Service.
+Submits non-latency-sensitive requests through the Message Batches API.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from django.conf import settings
+
+from core.services.base import ServiceResult
+from ..models import AIRequestLog
+from .claude import ClaudeService
+
+
+@dataclass
+class BatchJob:
+    """A single request in a message batch."""
+    id: str
+    prompt: str
+    system_prompt: Optional[str] = None
+    max_tokens: Optional[int] = None
+    temperature: float = 0.7
+
+
+class BatchValidator(ClaudeService):
+    """
+    Sends many requests as a single Message Batch.
+    Batches are processed asynchronously by Anthropic at a lower price,
+    so this is meant for bulk work such as dossier revalidation.
+    """
+    
+    POLL_INITIAL_DELAY = 5  # seconds
+    POLL_MAX_DELAY = 60  # seconds
+    
+    def _build_params(self, job: BatchJob) -> Dict:
+        """
+        Build the Messages API parameters for a job.
+        """
+        return {
+            'model': self.model,
+            'max_tokens': job.max_tokens or self.max_tokens,
+            'system': self._build_system(job.system_prompt),
+            'messages': [{'role': 'user', 'content': job.prompt}],
+            'temperature': job.temperature,
+        }
+    
+    def submit(self, jobs: List[BatchJob]) -> str:
+        """
+        Submit jobs as a message batch and return the batch id.
+        """
+        batch = self.client.messages.batches.create(
+            requests=[
+                {'custom_id': job.id, 'params': self._build_params(job)}
+                for job in jobs
+            ]
+        )
+        self.log_info("Message batch submitted: %s (%d requests)", batch.id, len(jobs))
+        return batch.id
+    
+    def cancel(self, batch_id: str):
+        """
+        Cancel a batch that is still processing.
+        """
+        try:
+            self.client.messages.batches.cancel(batch_id)
+        except Exception as e:
+            self.log_warning("Failed to cancel message batch %s: %s", batch_id, e)
+    
+    def wait(self, batch_id: str, timeout: Optional[int] = None):
+        """
+        Poll the batch with exponential backoff until processing has ended.
+        """
+        delay = self.POLL_INITIAL_DELAY
+        deadline = time.monotonic() + timeout if timeout else None
+        
+        while True:
+            batch = self.client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == 'ended':
+                return batch
+            
+            if deadline and time.monotonic() + delay > deadline:
+                raise TimeoutError(f"Message batch {batch_id} did not finish in {timeout}s")
+            
+            time.sleep(delay)
+            delay = min(delay * 2, self.POLL_MAX_DELAY)
+    
+    def collect(self, batch_id: str, service_type: str = "batch") -> Dict[str, ServiceResult]:
+        """
+        Read the results of an ended batch.
+        All request logs are written with a single bulk_create.
+        
+        Returns:
+            custom_id -> ServiceResult
+        """
+        results = {}
+        logs = []
+        
+        for entry in self.client.messages.batches.results(batch_id):
+            result = entry.result
+            extra_data = {'model': self.model, 'batch_id': batch_id, 'custom_id': entry.custom_id}
+            
+            if result.type == 'succeeded':
+                message = result.message
+                usage = message.usage
+                logs.append(AIRequestLog(
+                    user=self.user,
+                    service_type=service_type,
+                    model_name=self.model,
+                    prompt_tokens=usage.input_tokens,
+                    completion_tokens=usage.output_tokens,
+                    total_tokens=usage.input_tokens + usage.output_tokens,
+                    # bulk_create save() çağırmaz; maliyet burada hesaplanır
+                    estimated_cost_stored=AIRequestLog.calculate_cost(
+                        usage.input_tokens, usage.output_tokens
+                    ),
+                    status=AIRequestLog.Status.SUCCESS,
+                    extra_data=extra_data
+                ))
+                results[entry.custom_id] = ServiceResult.ok(
+                    data={
+                        'content': message.content[0].text if message.content else "",
+                        'tokens': {
+                            'input': usage.input_tokens,
+                            'output': usage.output_tokens,
+                            'total': usage.input_tokens + usage.output_tokens
+                        },
+                    },
+                    message="AI yanıtı alındı"
+                )
+            else:
+                # errored / canceled / expired
+                error_msg = str(getattr(result, 'error', '') or result.type)
+                logs.append(AIRequestLog(
+                    user=self.user,
+                    service_type=service_type,
+                    model_name=self.model,
+                    status=AIRequestLog.Status.FAILED,
+                    error_message=error_msg,
+                    extra_data=extra_data
+                ))
+                results[entry.custom_id] = ServiceResult.fail(
+                    message="AI servisinden yanıt alınamadı",
+                    errors={'batch': error_msg},
+                    code="AI_ERROR"
+                )
+        
+        AIRequestLog.objects.bulk_create(
+            logs, batch_size=getattr(settings, 'BULK_CREATE_BATCH_SIZE', 500)
+        )
+        return results
+    
+    def run(
+        self,
+        jobs: List[BatchJob],
+        service_type: str = "batch",
+        timeout: Optional[int] = None
+    ) -> Dict[str, ServiceResult]:
+        """
+        Submit jobs, wait for the batch to end and return its results.
+        If the batch does not end within timeout it is canceled and
+        TimeoutError is raised.
+        """
+        batch_id = self.submit(jobs)
+        try:
+            self.wait(batch_id, timeout=timeout)
+        except TimeoutError:
+            self.cancel(batch_id)
+            raise
+        return self.collect(batch_id, service_type=service_type)
@@ -0,0 +1,47 @@
+"""
+LLM Response Cache.
+Exact-match cache for Claude responses, backed by Django's cache.
+"""
+
+from typing import Any, Dict, Optional
+from django.conf import settings
+from django.core.cache import cache
+
+
+LLM_CACHE_PREFIX = 'llm_response'
+DEFAULT_LLM_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+
+
+class LLMCache:
+    """
+    Caches successful Claude responses by request hash.
+    Keys are namespaced by service type and user so that cached
+    responses are never shared between users.
+    """
+    
+    @staticmethod
+    def make_key(request_hash: str, service_type: str, user_id: Optional[int] = None) -> str:
+        """
+        Build the cache key for a request.
+        """
+        return f"{LLM_CACHE_PREFIX}:{service_type}:{user_id or 'anon'}:{request_hash}"
+    
+    @staticmethod
+    def get(request_hash: str, service_type: str, user_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached response data, or None on a miss.
+        """
+        return cache.get(LLMCache.make_key(request_hash, service_type, user_id))
+    
+    @staticmethod
+    def set(
+        request_hash: str,
+        service_type: str,
+        data: Dict[str, Any],
+        user_id: Optional[int] = None
+    ) -> None:
+        """
+        Store response data for the request.
+        """
+        timeout = getattr(settings, 'AI_CACHE_TTL', DEFAULT_LLM_CACHE_TTL)
+        cache.set(LLMCache.make_key(request_hash, service_type, user_id), data, timeout)
@@ -7,15 +7,150 @@ import json
 import time
 import hashlib
 import logging
-from typing import Any, Dict, List, Optional, Union
+import re
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, Count, Q, Sum
+from django.utils import timezone
 
 from core.services.base import BaseService, ServiceResult
+from core.utils.db import run_with_own_connection
 from ..models import AIRequestLog
+from . import _json
+from ._tokens import estimate_tokens
+from .cache import LLMCache
+from .log_buffer import ai_request_log_buffer
 
 
 logger = logging.getLogger(__name__)
 
+# First key of a streamed JSON object (optionally inside a markdown fence)
+_FIRST_JSON_KEY_RE = re.compile(r'^\s*(?:```(?:json)?\s*)?\{\s*"([^"]*)"\s*:')
+
+
+# Usage statistics are cached for this many seconds
+USAGE_STATS_CACHE_TTL = 60
+
+# Deterministic checks whose responses are served from the response
+# cache by default; creative generators always get a fresh response
+CACHEABLE_SERVICE_TYPES = frozenset({
+    'document_validation',
+    'signature_detection',
+    'form_validation',
+})
+
+_JSON_INSTRUCTION = "\n\nYanıtınızı geçerli JSON formatında verin."
+
+
+@lru_cache(maxsize=256)
+def _digest(text: str) -> bytes:
+    """
+    SHA-256 digest of a string, memoized.
+    System prompts are static, so their digest is computed once per process.
+    """
+    return hashlib.sha256(text.encode()).digest()
+
+
+@lru_cache(maxsize=64)
+def _json_system_prompt(system_prompt: str) -> str:
+    """
+    System prompt with the JSON instruction appended.
+    Memoized so the same string object (and its digest) is reused.
+    """
+    return system_prompt + _JSON_INSTRUCTION
+
+
+# Process-wide Anthropic client; the SDK client is thread-safe and keeps
+# its HTTP connection pool warm across services and requests.
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def _get_shared_client(timeout: int):
+    """
+    Create the shared Anthropic client on first use.
+    """
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                try:
+                    import anthropic
+                    import httpx
+                except ImportError:
+                    raise ImportError("anthropic package is not installed")
+                
+                api_key = getattr(settings, 'ANTHROPIC_API_KEY', '')
+                if not api_key:
+                    raise ValueError("ANTHROPIC_API_KEY is not configured")
+                
+                _shared_client = anthropic.Anthropic(
+                    api_key=api_key,
+                    max_retries=getattr(settings, 'AI_MAX_RETRIES', 3),
+                    timeout=httpx.Timeout(timeout, connect=5.0),
+                    http_client=anthropic.DefaultHttpxClient(
+                        limits=httpx.Limits(
+                            max_connections=getattr(settings, 'AI_HTTP_MAX_CONNECTIONS', 50),
+                            max_keepalive_connections=20,
+                            keepalive_expiry=getattr(settings, 'AI_HTTP_KEEPALIVE', 60),
+                        )
+                    )
+                )
+    return _shared_client
+
+
+class _RateLimitGate:
+    """
+    Holds new requests back while the API reports an exhausted rate limit.
+    Anthropic's rate limits are token buckets; every response carries the
+    remaining budget and its reset time, so we wait for the refill instead
+    of sending a request that is certain to be rejected with 429.
+    """
+    
+    BUCKETS = ('requests', 'tokens')
+    MAX_WAIT_SECONDS = 60
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+    
+    def wait(self) -> None:
+        """
+        Sleep until the exhausted bucket is refilled, if any.
+        """
+        delay = self._blocked_until - time.time()
+        if delay > 0:
+            time.sleep(min(delay, self.MAX_WAIT_SECONDS))
+    
+    def update(self, headers) -> None:
+        """
+        Record the rate-limit state reported in response headers.
+        """
+        for bucket in self.BUCKETS:
+            remaining = headers.get(f'anthropic-ratelimit-{bucket}-remaining')
+            reset = headers.get(f'anthropic-ratelimit-{bucket}-reset')
+            if remaining is None or reset is None:
+                continue
+            
+            try:
+                if int(remaining) > 0:
+                    continue
+                reset_at = datetime.fromisoformat(reset.replace('Z', '+00:00')).timestamp()
+            except ValueError:
+                continue
+            
+            with self._lock:
+                self._blocked_until = max(self._blocked_until, reset_at)
+
+
+_rate_limit = _RateLimitGate()
+
 
 class ClaudeService(BaseService):
     """
@@ -29,30 +164,47 @@ class ClaudeService(BaseService):
         self.model = getattr(settings, 'AI_MODEL', 'claude-sonnet-4-20250514')
         self.max_tokens = getattr(settings, 'AI_MAX_TOKENS', 4096)
         self.timeout = getattr(settings, 'AI_TIMEOUT', 30)
+        self.cache_min_tokens = getattr(settings, 'AI_CACHE_MIN_TOKENS', 1024)
         self._client = None
     
     @property
     def client(self):
         """
-        Lazy-load the Anthropic client.
+        Lazy-load the shared Anthropic client.
         """
         if self._client is None:
-            try:
-                import anthropic
-                api_key = getattr(settings, 'ANTHROPIC_API_KEY', '')
-                if not api_key:
-                    raise ValueError("ANTHROPIC_API_KEY is not configured")
-                self._client = anthropic.Anthropic(api_key=api_key)
-            except ImportError:
-                raise ImportError("anthropic package is not installed")
+            self._client = _get_shared_client(self.timeout)
         return self._client
     
-    def _create_request_hash(self, prompt: str, **kwargs) -> str:
+    def _create_request_hash(self, prompt: str, system: Optional[str] = None, **kwargs) -> str:
         """
         Create a hash of the request for caching/deduplication.
+        The static system prompt contributes its memoized digest; only the
+        prompt and the small kwargs are hashed on every call.
         """
-        content = f"{prompt}{json.dumps(kwargs, sort_keys=True)}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        h = hashlib.sha256(_digest(system or ""))
+        h.update(prompt.encode())
+        h.update(json.dumps(kwargs, sort_keys=True).encode())
+        return h.hexdigest()
+    
+    def _build_system(self, system_prompt: Optional[str], cache: bool = True) -> Union[str, List[Dict]]:
+        """
+        Build the `system` parameter for the API call.
+        Long system prompts are sent as a text block marked for prompt caching,
+        so repeated calls reuse the cached prefix instead of re-processing it.
+        """
+        if not system_prompt:
+            return ""
+        
+        # Shorter prompts cannot be cached
+        if not cache or estimate_tokens(system_prompt) < self.cache_min_tokens:
+            return system_prompt
+        
+        return [{
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"}
+        }]
     
     def _log_request(
         self,
@@ -64,22 +216,38 @@ class ClaudeService(BaseService):
         error_message: str = "",
         request_hash: str = "",
         extra_data: Dict = None
-    ) -> AIRequestLog:
+    ) -> str:
         """
         Log an AI request.
+        The row is written in the background by ai_request_log_buffer; the returned
+        reference is stored in extra_data['log_ref'] to find it later.
         """
-        return AIRequestLog.objects.create(
+        log_ref = uuid.uuid4().hex
+        ai_request_log_buffer.enqueue(AIRequestLog(
             user=self.user,
             service_type=service_type,
             model_name=self.model,
             prompt_tokens=prompt_tokens,
             completion_tokens=completion_tokens,
             total_tokens=prompt_tokens + completion_tokens,
+            # bulk_create does not call save(); store the cost here
+            estimated_cost_stored=AIRequestLog.calculate_cost(prompt_tokens, completion_tokens),
             status=status,
             response_time_ms=response_time_ms,
             error_message=error_message,
             request_hash=request_hash,
-            extra_data=extra_data or {}
+            extra_data={**(extra_data or {}), 'log_ref': log_ref}
+        ))
+        return log_ref
+    
+    def log_local_check(self, extra_data: Dict = None) -> str:
+        """
+        Log a request that was answered by local checks without calling the API.
+        """
+        return self._log_request(
+            service_type=AIRequestLog.ServiceType.LOCAL_CHECK,
+            status=AIRequestLog.Status.SUCCESS,
+            extra_data=extra_data
         )
     
     def send_message(
@@ -89,6 +257,8 @@ class ClaudeService(BaseService):
         service_type: str = "general",
         max_tokens: Optional[int] = None,
         temperature: float = 0.7,
+        cache_system_prompt: bool = True,
+        use_cache: Optional[bool] = None,
         **kwargs
     ) -> ServiceResult:
         """
@@ -100,25 +270,46 @@ class ClaudeService(BaseService):
             service_type: Type of service for logging
             max_tokens: Maximum tokens in response
             temperature: Response randomness (0-1)
+            cache_system_prompt: Use prompt caching for long system prompts
+            use_cache: Serve identical requests from the response cache
+                (default: only for CACHEABLE_SERVICE_TYPES)
         
         Returns:
             ServiceResult with the AI response
         """
-        request_hash = self._create_request_hash(prompt, system=system_prompt)
+        max_tokens = max_tokens or self.max_tokens
+        if use_cache is None:
+            use_cache = service_type in CACHEABLE_SERVICE_TYPES
+        request_hash = self._create_request_hash(
+            prompt,
+            system=system_prompt,
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+        user_id = getattr(self.user, 'pk', None)
         start_time = time.time()
         
+        if use_cache:
+            cached = LLMCache.get(request_hash, service_type, user_id)
+            if cached is not None:
+                return self._cached_result(cached, service_type, request_hash, start_time)
+        
         try:
             # Build messages
             messages = [{"role": "user", "content": prompt}]
             
             # Make API call
-            response = self.client.messages.create(
+            _rate_limit.wait()
+            raw_response = self.client.messages.with_raw_response.create(
                 model=self.model,
-                max_tokens=max_tokens or self.max_tokens,
-                system=system_prompt or "",
+                max_tokens=max_tokens,
+                system=self._build_system(system_prompt, cache=cache_system_prompt),
                 messages=messages,
                 temperature=temperature
             )
+            _rate_limit.update(raw_response.headers)
+            response = raw_response.parse()
             
             # Calculate response time
             response_time_ms = int((time.time() - start_time) * 1000)
@@ -126,28 +317,163 @@ class ClaudeService(BaseService):
             # Extract response content
             content = response.content[0].text if response.content else ""
             
+            # Prompt cache usage (hit rate monitoring)
+            usage = response.usage
+            cache_read_tokens = getattr(usage, 'cache_read_input_tokens', None) or 0
+            cache_creation_tokens = getattr(usage, 'cache_creation_input_tokens', None) or 0
+            
             # Log successful request
-            log = self._log_request(
+            log_ref = self._log_request(
                 service_type=service_type,
                 status=AIRequestLog.Status.SUCCESS,
                 prompt_tokens=response.usage.input_tokens,
                 completion_tokens=response.usage.output_tokens,
                 response_time_ms=response_time_ms,
                 request_hash=request_hash,
-                extra_data={'model': self.model, 'temperature': temperature}
+                extra_data={
+                    'model': self.model,
+                    'temperature': temperature,
+                    'cache_read_input_tokens': cache_read_tokens,
+                    'cache_creation_input_tokens': cache_creation_tokens,
+                }
+            )
+            
+            self.log_info("AI request successful: %s (%dms)", service_type, response_time_ms)
+            
+            data = {
+                'content': content,
+                'tokens': {
+                    'input': response.usage.input_tokens,
+                    'output': response.usage.output_tokens,
+                    'total': response.usage.input_tokens + response.usage.output_tokens
+                },
+            }
+            if use_cache:
+                LLMCache.set(request_hash, service_type, data, user_id)
+            
+            return ServiceResult.ok(
+                data={**data, 'log_ref': log_ref},
+                message="AI yanıtı alındı"
+            )
+            
+        except Exception as e:
+            response_time_ms = int((time.time() - start_time) * 1000)
+            error_msg = str(e)
+            
+            # Determine status based on error type
+            status = AIRequestLog.Status.FAILED
+            if 'timeout' in error_msg.lower():
+                status = AIRequestLog.Status.TIMEOUT
+            
+            # Log failed request
+            self._log_request(
+                service_type=service_type,
+                status=status,
+                response_time_ms=response_time_ms,
+                error_message=error_msg,
+                request_hash=request_hash
+            )
+            
+            self.log_error(f"AI request failed: {error_msg}", exc=e)
+            
+            return ServiceResult.fail(
+                message="AI servisinden yanıt alınamadı",
+                errors={'exception': error_msg},
+                code="AI_ERROR"
+            )
+    
+    def send_message_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        service_type: str = "general",
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+        expected_keys: Optional[Iterable[str]] = None,
+        on_text: Optional[Callable[[str], None]] = None
+    ) -> ServiceResult:
+        """
+        Stream a message from Claude.
+        
+        Args:
+            prompt: The user message/prompt
+            system_prompt: Optional system prompt for context
+            service_type: Type of service for logging
+            max_tokens: Maximum tokens in response
+            temperature: Response randomness (0-1)
+            expected_keys: Allowed first keys of a JSON response; the stream is
+                aborted as soon as the response starts with another key
+            on_text: Called with the text received so far after every chunk
+        
+        Returns:
+            ServiceResult with the AI response (same shape as send_message)
+        """
+        max_tokens = max_tokens or self.max_tokens
+        request_hash = self._create_request_hash(
+            prompt,
+            system=system_prompt,
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+        expected_keys = set(expected_keys) if expected_keys else None
+        start_time = time.time()
+        content = ""
+        
+        try:
+            _rate_limit.wait()
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                system=self._build_system(system_prompt),
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature
+            ) as stream:
+                _rate_limit.update(stream.response.headers)
+                key_checked = expected_keys is None
+                for text in stream.text_stream:
+                    content += text
+                    
+                    if not key_checked:
+                        match = _FIRST_JSON_KEY_RE.match(content)
+                        if match:
+                            key_checked = True
+                            if match.group(1) not in expected_keys:
+                                # Stop generating off-schema output
+                                stream.close()
+                                raise ValueError(
+                                    f"Unexpected response schema (first key: {match.group(1)})"
+                                )
+                    
+                    if on_text:
+                        on_text(content)
+                
+                message = stream.get_final_message()
+            
+            response_time_ms = int((time.time() - start_time) * 1000)
+            usage = message.usage
+            
+            log_ref = self._log_request(
+                service_type=service_type,
+                status=AIRequestLog.Status.SUCCESS,
+                prompt_tokens=usage.input_tokens,
+                completion_tokens=usage.output_tokens,
+                response_time_ms=response_time_ms,
+                request_hash=request_hash,
+                extra_data={'model': self.model, 'temperature': temperature, 'stream': True}
             )
             
-            self.log_info(f"AI request successful: {service_type} ({response_time_ms}ms)")
+            self.log_info("AI stream successful: %s (%dms)", service_type, response_time_ms)
             
             return ServiceResult.ok(
                 data={
                     'content': content,
                     'tokens': {
-                        'input': response.usage.input_tokens,
-                        'output': response.usage.output_tokens,
-                        'total': response.usage.input_tokens + response.usage.output_tokens
+                        'input': usage.input_tokens,
+                        'output': usage.output_tokens,
+                        'total': usage.input_tokens + usage.output_tokens
                     },
-                    'log_id': log.id
+                    'log_ref': log_ref
                 },
                 message="AI yanıtı alındı"
             )
@@ -156,21 +482,20 @@ class ClaudeService(BaseService):
             response_time_ms = int((time.time() - start_time) * 1000)
             error_msg = str(e)
             
-            # Determine status based on error type
             status = AIRequestLog.Status.FAILED
             if 'timeout' in error_msg.lower():
                 status = AIRequestLog.Status.TIMEOUT
             
-            # Log failed request
             self._log_request(
                 service_type=service_type,
                 status=status,
                 response_time_ms=response_time_ms,
                 error_message=error_msg,
-                request_hash=request_hash
+                request_hash=request_hash,
+                extra_data={'model': self.model, 'stream': True}
             )
             
-            self.log_error(f"AI request failed: {error_msg}", exc=e)
+            self.log_error(f"AI stream failed: {error_msg}", exc=e)
             
             return ServiceResult.fail(
                 message="AI servisinden yanıt alınamadı",
@@ -178,6 +503,61 @@ class ClaudeService(BaseService):
                 code="AI_ERROR"
             )
     
+    def send_many(
+        self,
+        jobs: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[ServiceResult]:
+        """
+        Send several independent messages concurrently.
+        
+        Args:
+            jobs: List of send_message keyword arguments
+            max_workers: Maximum concurrent requests (AI_MAX_CONCURRENCY)
+        
+        Returns:
+            ServiceResults in the same order as jobs
+        """
+        if not jobs:
+            return []
+        
+        max_workers = max_workers or getattr(settings, 'AI_MAX_CONCURRENCY', 10)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            futures = [
+                executor.submit(run_with_own_connection, self.send_message, **job)
+                for job in jobs
+            ]
+        
+        return [future.result() for future in futures]
+    
+    def _cached_result(
+        self,
+        cached: Dict[str, Any],
+        service_type: str,
+        request_hash: str,
+        start_time: float
+    ) -> ServiceResult:
+        """
+        Build the result for a response served from the cache.
+        The request is still logged, with zero tokens.
+        """
+        response_time_ms = int((time.time() - start_time) * 1000)
+        
+        log_ref = self._log_request(
+            service_type=service_type,
+            status=AIRequestLog.Status.SUCCESS,
+            response_time_ms=response_time_ms,
+            request_hash=request_hash,
+            extra_data={'model': self.model, 'cache_hit': True}
+        )
+        
+        self.log_info("AI request served from cache: %s", service_type)
+        
+        return ServiceResult.ok(
+            data={**cached, 'log_ref': log_ref, 'cached': True},
+            message="AI yanıtı (cache)"
+        )
+    
     def send_json_message(
         self,
         prompt: str,
@@ -190,7 +570,7 @@ class ClaudeService(BaseService):
         Automatically parses the JSON from the response.
         """
         # Add JSON instruction to system prompt
-        json_system = (system_prompt or "") + "\n\nYanıtınızı geçerli JSON formatında verin."
+        json_system = _json_system_prompt(system_prompt or "")
         
         result = self.send_message(
             prompt=prompt,
@@ -203,34 +583,34 @@ class ClaudeService(BaseService):
             return result
         
         try:
-            # Extract JSON from response
-            content = result.data['content']
-            
-            # Try to find JSON in the response
-            json_start = content.find('{')
-            json_end = content.rfind('}') + 1
-            
-            if json_start == -1 or json_end == 0:
-                # Try array
-                json_start = content.find('[')
-                json_end = content.rfind(']') + 1
-            
-            if json_start != -1 and json_end > json_start:
-                json_str = content[json_start:json_end]
-                parsed = json.loads(json_str)
-                result.data['parsed'] = parsed
-            else:
-                # Try to parse the entire content
-                result.data['parsed'] = json.loads(content)
-            
+            result.data['parsed'] = _json.extract_json(result.data['content'])
             return result
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             self.log_error(f"Failed to parse JSON response: {e}")
             result.data['parsed'] = None
             result.data['parse_error'] = str(e)
             return result
     
+    def call_api(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        service_type: str = "general",
+        **kwargs
+    ) -> str:
+        """
+        Send a message and return the raw response text.
+        Returns an empty string if the request fails.
+        """
+        result = self.send_message(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            service_type=service_type,
+            **kwargs
+        )
+        return result.data['content'] if result.success else ""
+    
     def is_available(self) -> bool:
         """
         Check if the AI service is available.
@@ -249,19 +629,27 @@ class ClaudeService(BaseService):
     def get_usage_stats(self, days: int = 30) -> Dict[str, Any]:
         """
         Get usage statistics for the past N days.
+        Cached briefly so dashboards can poll without hitting the database.
+        """
+        return cache.get_or_set(
+            f"ai_stats:{days}",
+            lambda: self._compute_usage_stats(days),
+            timeout=USAGE_STATS_CACHE_TTL
+        )
+    
+    def _compute_usage_stats(self, days: int) -> Dict[str, Any]:
+        """
+        Aggregate usage statistics from the request log.
         """
-        from django.utils import timezone
-        from django.db.models import Sum, Count, Avg
-        from datetime import timedelta
-        
         start_date = timezone.now() - timedelta(days=days)
         
         logs = AIRequestLog.objects.filter(created_at__gte=start_date)
         
         stats = logs.aggregate(
             total_requests=Count('id'),
-            successful_requests=Count('id', filter={'status': AIRequestLog.Status.SUCCESS}),
+            successful_requests=Count('id', filter=Q(status=AIRequestLog.Status.SUCCESS)),
             total_tokens=Sum('total_tokens'),
+            total_cost=Sum('estimated_cost_stored'),
             avg_response_time=Avg('response_time_ms')
         )
         
@@ -280,7 +668,16 @@ class ClaudeService(BaseService):
                 if stats['total_requests'] else 0
             ),
             'total_tokens': stats['total_tokens'] or 0,
+            'estimated_cost': float(stats['total_cost'] or 0),
             'avg_response_time_ms': round(stats['avg_response_time'] or 0, 2),
             'by_service': list(by_service)
         }
 
+
+@lru_cache(maxsize=1)
+def get_shared_claude() -> ClaudeService:
+    """
+    Process-wide ClaudeService without a user, for stateless callers
+    such as the document and signature validators.
+    """
+    return ClaudeService()
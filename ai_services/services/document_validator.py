@@ -3,10 +3,14 @@ AI Document Validator Service.
 Uses Claude API to validate uploaded documents.
 """
 
-import json
-from typing import Dict, List, Any, Optional
+import re
+from difflib import SequenceMatcher
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from django.conf import settings
-from .claude import ClaudeService
+from . import _json
+from ._tokens import estimate_tokens, fit_to_tokens
+from .claude import get_shared_claude
+from .local_checks import FIELD_VALIDATORS, find_labeled_values
 
 
 class DocumentValidator:
@@ -88,8 +92,22 @@ class DocumentValidator:
         },
     }
     
+    # Validasyon yanıtının üst seviye anahtarları
+    VALIDATION_RESPONSE_KEYS = (
+        'is_valid', 'overall_score', 'fields', 'warnings', 'errors', 'recommendations'
+    )
+    
+    # Birden fazla belge tek istekte gönderildiğinde sistem promptuna eklenir
+    PACK_SYSTEM_PROMPT_SUFFIX = """
+
+Birden fazla belge verildiğinde yanıtını SADECE bir JSON dizisi olarak ver.
+Dizide her belge için yukarıdaki formatta bir nesne olsun ve her nesneye
+belgenin numarasını "doc_index" alanı olarak ekle:
+[{"doc_index": 1, "is_valid": ...}, {"doc_index": 2, "is_valid": ...}]"""
+    
     def __init__(self):
-        self.claude = ClaudeService()
+        self.claude = get_shared_claude()
+        self.max_document_tokens = getattr(settings, 'AI_DOC_MAX_TOKENS', 1500)
     
     def validate_document(
         self,
@@ -115,73 +133,285 @@ class DocumentValidator:
             # Generic validation
             return self._validate_generic(document_text)
         
+        local_result = self._local_precheck(document_text, document_type)
+        if local_result is not None:
+            return local_result
+        
         prompt = self._build_validation_prompt(
             document_text,
-            requirements,
+            document_type,
             additional_context
         )
         
-        response = self.claude.call_api(
+        result = self.claude.send_json_message(
             prompt=prompt,
-            system_prompt=self._get_system_prompt()
+            system_prompt=self._get_system_prompt(),
+            service_type='document_validation'
         )
         
-        return self._parse_validation_response(response, required_fields)
+        parsed = result.data['parsed'] if result.success else None
+        return self._normalize_validation_result(parsed, document_type)
     
-    def _get_system_prompt(self) -> str:
-        """AI sistem promptu."""
-        return """Sen bir belge validasyon uzmanısın. Türkçe belgeleri analiz ediyorsun.
-
-Görevin:
-1. Belgede gerekli alanların bulunup bulunmadığını kontrol et
-2. Bulunan alanların değerlerini çıkar
-3. Eksik veya okunamayan alanları belirle
-4. Her alan için güven skoru (0-100) ver
-
-Yanıtını SADECE aşağıdaki JSON formatında ver:
-{
-    "is_valid": true/false,
-    "overall_score": 0-100,
-    "fields": [
-        {
-            "field_id": "alan_adi",
-            "found": true/false,
-            "value": "bulunan değer veya null",
-            "confidence": 0-100,
-            "issue": "sorun varsa açıklama"
+    def validate_document_stream(
+        self,
+        document_text: str,
+        document_type: str,
+        on_field: Optional[Callable[[Dict[str, Any]], None]] = None,
+        additional_context: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Belgeyi yanıtı akış halinde alarak validate et.
+        Her alan sonucu tamamlandığı anda on_field ile bildirilir; yanıt
+        beklenen şemayla başlamazsa akış erkenden kesilir.
+        Kısmi JSON ayrıştırma jiter gerektirir; jiter yoksa alanlar yanıt
+        tamamlandıktan sonra topluca bildirilir.
+        
+        Args:
+            document_text: Belgeden çıkarılan metin
+            document_type: Belge tipi
+            on_field: Tamamlanan her alan sonucu için çağrılır
+            additional_context: Ek bağlam bilgisi
+            
+        Returns:
+            Validation sonuçları (validate_document ile aynı yapı)
+        """
+        requirements = self.DOCUMENT_REQUIREMENTS.get(document_type, {})
+        required_fields = requirements.get('required_fields', [])
+        
+        if not required_fields:
+            return self._validate_generic(document_text)
+        
+        local_result = self._local_precheck(document_text, document_type)
+        if local_result is not None:
+            if on_field:
+                for field in local_result['fields']:
+                    on_field(field)
+            return local_result
+        
+        prompt = self._build_validation_prompt(
+            document_text,
+            document_type,
+            additional_context
+        )
+        
+        reported = 0
+        parsed_upto = 0
+        
+        def report_fields(content: str):
+            nonlocal reported, parsed_upto
+            # Yeni bir alan ancak yeni gelen metinde süslü parantez varsa
+            # tamamlanmış olabilir; her parçada tüm tamponu ayrıştırmamak için
+            # diğer parçalar atlanır.
+            new_text = content[parsed_upto:]
+            if '{' not in new_text and '}' not in new_text:
+                return
+            parsed_upto = len(content)
+            
+            start = content.find('{')
+            partial = _json.loads_partial(content[start:]) if start != -1 else None
+            if not isinstance(partial, dict):
+                return
+            fields = partial.get('fields') or []
+            # Son eleman henüz yazılıyor olabilir; yalnızca kapanmış olanlar bildirilir
+            while reported < len(fields) - 1:
+                on_field(fields[reported])
+                reported += 1
+        
+        result = self.claude.send_message_stream(
+            prompt=prompt,
+            system_prompt=self._get_system_prompt(),
+            service_type='document_validation',
+            expected_keys=self.VALIDATION_RESPONSE_KEYS,
+            on_text=report_fields if on_field and _json.JITER_AVAILABLE else None
+        )
+        
+        response = result.data['content'] if result.success else ""
+        validation_result = self._parse_validation_response(response, document_type)
+        
+        if on_field and result.success:
+            for field in validation_result['fields'][reported:]:
+                on_field(field)
+        
+        return validation_result
+    
+    def validate_documents(
+        self,
+        documents: List[Tuple[str, str]],
+        pack_size: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Kısa belgeleri tek bir Claude isteğinde birlikte validate et.
+        En fazla pack_size belge, toplam girdi AI_BATCH_MAX_INPUT_TOKENS
+        sınırını aşmayacak şekilde aynı prompta numaralandırılarak eklenir.
+        
+        Args:
+            documents: (belge metni, belge tipi) listesi
+            pack_size: Bir istekteki en fazla belge sayısı
+            
+        Returns:
+            Belgelerle aynı sırada validation sonuçları
+        """
+        max_input_tokens = getattr(settings, 'AI_BATCH_MAX_INPUT_TOKENS', 40000)
+        
+        results = [None] * len(documents)
+        packs = []
+        pack, pack_tokens = [], 0
+        
+        for index, (document_text, document_type) in enumerate(documents):
+            requirements = self.DOCUMENT_REQUIREMENTS.get(document_type, {})
+            text = fit_to_tokens(document_text, self.max_document_tokens)
+            text_tokens = estimate_tokens(text)
+            
+            local_result = self._local_precheck(document_text, document_type)
+            if local_result is not None:
+                results[index] = local_result
+                continue
+            
+            # Alan listesi olmayan veya tek başına sınırı aşan belgeler ayrı gönderilir
+            if not requirements.get('required_fields') or text_tokens > max_input_tokens:
+                results[index] = self.validate_document(document_text, document_type)
+                continue
+            
+            if pack and (len(pack) >= pack_size or pack_tokens + text_tokens > max_input_tokens):
+                packs.append(pack)
+                pack, pack_tokens = [], 0
+            pack.append((index, text, document_type))
+            pack_tokens += text_tokens
+        
+        if pack:
+            packs.append(pack)
+        
+        for pack in packs:
+            if len(pack) == 1:
+                index = pack[0][0]
+                results[index] = self.validate_document(*documents[index])
+                continue
+            
+            for index, result in self._validate_pack(pack).items():
+                results[index] = result
+        
+        return results
+    
+    def _validate_pack(self, pack: List[Tuple[int, str, str]]) -> Dict[int, Dict[str, Any]]:
+        """Bir belge paketini tek istekte validate et."""
+        sections = []
+        for number, (_, text, document_type) in enumerate(pack, start=1):
+            sections.append(
+                f"Belge {number} ({self.DOCUMENT_REQUIREMENTS[document_type]['name']}):\n"
+                f"Kontrol Edilecek Alanlar:\n{_FIELDS_PROMPT_CACHE[document_type]}\n"
+                f"---\n{text}\n---"
+            )
+        
+        prompt = (
+            f"Aşağıda {len(pack)} belge var. Her belgeyi ayrı ayrı analiz et ve "
+            f"her alanın durumunu raporla.\n\n" + "\n\n".join(sections)
+        )
+        
+        result = self.claude.send_json_message(
+            prompt=prompt,
+            system_prompt=self._get_system_prompt(packed=True),
+            service_type='document_validation'
+        )
+        
+        parsed = result.data.get('parsed') if result.success else None
+        by_number = {}
+        if isinstance(parsed, list):
+            by_number = {
+                item.get('doc_index'): item
+                for item in parsed if isinstance(item, dict)
+            }
+        
+        return {
+            index: self._normalize_validation_result(by_number.get(number), document_type)
+            for number, (index, _, document_type) in enumerate(pack, start=1)
         }
-    ],
-    "warnings": ["uyarı mesajları"],
-    "errors": ["hata mesajları"],
-    "recommendations": ["öneriler"]
-}"""
+    
+    def validate_many(
+        self,
+        documents: List[Tuple[str, str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Birden fazla belgeyi validate et.
+        AI_BATCH_THRESHOLD ve üzeri belge sayısında istekler Message Batches
+        API üzerinden tek seferde gönderilir. Batch AI_BATCH_TIMEOUT saniye
+        içinde bitmezse iptal edilir ve ilgili belgeler başarısız döner.
+        
+        Args:
+            documents: (belge metni, belge tipi) listesi
+            
+        Returns:
+            Belgelerle aynı sırada validation sonuçları
+        """
+        threshold = getattr(settings, 'AI_BATCH_THRESHOLD', 10)
+        if len(documents) < threshold:
+            return [
+                self.validate_document(document_text, document_type)
+                for document_text, document_type in documents
+            ]
+        
+        from .batch import BatchJob, BatchValidator
+        
+        results = [None] * len(documents)
+        jobs = []
+        system_prompt = self._get_system_prompt()
+        
+        for index, (document_text, document_type) in enumerate(documents):
+            requirements = self.DOCUMENT_REQUIREMENTS.get(document_type, {})
+            if not requirements.get('required_fields'):
+                results[index] = self._validate_generic(document_text)
+                continue
+            
+            local_result = self._local_precheck(document_text, document_type)
+            if local_result is not None:
+                results[index] = local_result
+                continue
+            
+            jobs.append(BatchJob(
+                id=f"doc-{index}",
+                prompt=self._build_validation_prompt(document_text, document_type, None),
+                system_prompt=system_prompt
+            ))
+        
+        if jobs:
+            timed_out = False
+            try:
+                batch_results = BatchValidator().run(
+                    jobs,
+                    service_type='document_validation',
+                    timeout=getattr(settings, 'AI_BATCH_TIMEOUT', 600)
+                )
+            except TimeoutError as e:
+                self.claude.log_warning("Belge batch validasyonu zaman aşımına uğradı: %s", e)
+                batch_results = {}
+                timed_out = True
+            
+            for job in jobs:
+                index = int(job.id.split('-', 1)[1])
+                result = batch_results.get(job.id)
+                response = result.data['content'] if result and result.success else ""
+                results[index] = self._parse_validation_response(response, documents[index][1])
+                if timed_out:
+                    results[index]['errors'].append('Belge analizi zaman aşımına uğradı.')
+        
+        return results
+    
+    def _get_system_prompt(self, packed: bool = False) -> str:
+        """AI sistem promptu (modül seviyesinde bir kez oluşturulur)."""
+        return _PACKED_SYSTEM_PROMPT if packed else _SYSTEM_PROMPT
     
     def _build_validation_prompt(
         self,
         document_text: str,
-        requirements: Dict,
+        document_type: str,
         additional_context: Optional[str]
     ) -> str:
         """Validasyon promptu oluştur."""
-        fields_list = "\n".join([
-            f"- {f['label']} ({f['field']})" + 
-            (f" [Pattern: {f.get('pattern', '')}]" if f.get('pattern') else "") +
-            (" [İMZA GEREKLİ]" if f.get('is_signature') else "")
-            for f in requirements.get('required_fields', [])
-        ])
-        
-        prompt = f"""Belge Tipi: {requirements.get('name', 'Belge')}
-
-Kontrol Edilecek Alanlar:
-{fields_list}
-
-Belge İçeriği:
----
-{document_text[:5000]}  # Limit text length
----
-
-Bu belgeyi analiz et ve her alanın durumunu raporla."""
-
+        prompt = _PROMPT_TEMPLATE.format(
+            name=self.DOCUMENT_REQUIREMENTS[document_type]['name'],
+            fields=_FIELDS_PROMPT_CACHE[document_type],
+            text=fit_to_tokens(document_text, self.max_document_tokens)
+        )
+        
         if additional_context:
             prompt += f"\n\nEk Bilgi:\n{additional_context}"
         
@@ -190,29 +420,31 @@ Bu belgeyi analiz et ve her alanın durumunu raporla."""
     def _parse_validation_response(
         self,
         response: str,
-        required_fields: List[Dict]
+        document_type: str
     ) -> Dict[str, Any]:
         """AI yanıtını parse et."""
-        try:
-            # Extract JSON from response
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-            if start_idx != -1 and end_idx > start_idx:
-                json_str = response[start_idx:end_idx]
-                result = json.loads(json_str)
-                
-                # Ensure required structure
-                result.setdefault('is_valid', False)
-                result.setdefault('overall_score', 0)
-                result.setdefault('fields', [])
-                result.setdefault('warnings', [])
-                result.setdefault('errors', [])
-                result.setdefault('recommendations', [])
-                
-                return result
-                
-        except (json.JSONDecodeError, ValueError):
-            pass
+        result = _json.parse_llm_json(response)
+        return self._normalize_validation_result(result, document_type)
+    
+    def _normalize_validation_result(
+        self,
+        result: Any,
+        document_type: str
+    ) -> Dict[str, Any]:
+        """Parse edilmiş sonucu beklenen yapıya getir."""
+        required_fields = self.DOCUMENT_REQUIREMENTS[document_type]['required_fields']
+        
+        if isinstance(result, dict):
+            # Ensure required structure
+            result.setdefault('is_valid', False)
+            result.setdefault('overall_score', 0)
+            result.setdefault('fields', [])
+            result.setdefault('warnings', [])
+            result.setdefault('errors', [])
+            result.setdefault('recommendations', [])
+            
+            self._check_field_patterns(result, document_type)
+            return result
         
         # Fallback
         return {
@@ -227,11 +459,87 @@ Bu belgeyi analiz et ve her alanın durumunu raporla."""
             'recommendations': ['Belgeyi tekrar yükleyin veya daha net bir kopya deneyin.']
         }
     
+    def _check_field_patterns(self, result: Dict[str, Any], document_type: str) -> None:
+        """
+        AI'nın bulduğu değerleri derlenmiş desenlerle yerel olarak doğrula
+        (TC kimlik no, vergi no vb.). Uymayan alanlar için uyarı eklenir.
+        """
+        patterns = _FIELD_PATTERNS.get(document_type)
+        if not patterns:
+            return
+        
+        for field in result['fields']:
+            pattern = patterns.get(field.get('field_id'))
+            value = field.get('value')
+            if pattern is None or not value:
+                continue
+            
+            if not pattern.fullmatch(str(value).replace(' ', '')):
+                field['issue'] = field.get('issue') or 'Değer beklenen formatta değil'
+                result['warnings'].append(
+                    f"{field['field_id']} alanının değeri beklenen formatta değil: {value}"
+                )
+    
+    def _local_precheck(self, document_text: str, document_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Sağlama algoritması olan alanları Claude'a gitmeden yerel olarak kontrol et.
+        
+        Yalnızca etiketinin hemen ardından gelen değerler (ör. "TC Kimlik No: ...")
+        aday sayılır. Bir alanın etiketli adayları bulunup hiçbiri sağlama
+        kontrolünden geçmiyorsa belge doğrudan geçersiz sayılır; diğer tüm
+        durumlarda karar Claude'a bırakılır.
+        
+        Returns:
+            Validation sonucu veya karar verilemiyorsa None (Claude'a gidilir)
+        """
+        patterns = _FIELD_PATTERNS.get(document_type)
+        if not patterns:
+            return None
+        
+        candidates = find_labeled_values(document_text, patterns.keys())
+        
+        malformed = {}
+        for field_id, values in candidates.items():
+            validator = FIELD_VALIDATORS.get(field_id)
+            if validator is None or not values:
+                continue
+            if not any(validator(v) for v in values):
+                malformed[field_id] = values[0]
+        
+        if not malformed:
+            return None
+        
+        required_fields = self.DOCUMENT_REQUIREMENTS[document_type]['required_fields']
+        self.claude.log_local_check(
+            extra_data={'document_type': document_type, 'outcome': 'malformed'}
+        )
+        return {
+            'is_valid': False,
+            'overall_score': 0,
+            'fields': [
+                {
+                    'field_id': f['field'],
+                    'found': f['field'] in malformed,
+                    'value': malformed.get(f['field']),
+                    'confidence': 100 if f['field'] in malformed else 0,
+                    'issue': 'Değer doğrulama kontrolünden geçmedi' if f['field'] in malformed else None,
+                }
+                for f in required_fields
+            ],
+            'warnings': [],
+            'errors': [
+                f"{field_id} alanının değeri geçersiz: {value}"
+                for field_id, value in malformed.items()
+            ],
+            'recommendations': ['Belgedeki numaraların doğru olduğunu kontrol edin.'],
+            'local_check': True
+        }
+    
     def _validate_generic(self, document_text: str) -> Dict[str, Any]:
         """Genel belge validasyonu."""
         prompt = f"""Aşağıdaki belgeyi analiz et ve genel bir değerlendirme yap:
 
-{document_text[:3000]}
+{fit_to_tokens(document_text, self.max_document_tokens)}
 
 Şunları değerlendir:
 1. Belgenin okunabilirliği
@@ -251,25 +559,14 @@ JSON formatında yanıt ver:
     "recommendations": []
 }}"""
         
-        response = self.claude.call_api(
+        result = self.claude.send_json_message(
             prompt=prompt,
-            system_prompt="Sen bir belge analiz uzmanısın."
+            system_prompt="Sen bir belge analiz uzmanısın.",
+            service_type='document_validation'
         )
         
-        try:
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-            if start_idx != -1 and end_idx > start_idx:
-                return json.loads(response[start_idx:end_idx])
-        except (json.JSONDecodeError, ValueError):
-            pass
-        
-        return {
-            'is_valid': False,
-            'overall_score': 0,
-            'warnings': ['Belge analizi yapılamadı'],
-            'recommendations': ['Manuel inceleme gerekli']
-        }
+        parsed = result.data['parsed'] if result.success else None
+        return _json.as_object(parsed, default=_FALLBACK_GENERIC_RESULT)
     
     def get_completion_percentage(self, validation_result: Dict) -> float:
         """
@@ -320,34 +617,133 @@ JSON formatında yanıt ver:
         Returns:
             Karşılaştırma sonuçları
         """
-        mismatches = []
-        matches = []
+        # Müşteri verileri bir kez normalize edilir
+        canonical_customer = {
+            key: _canonical(value)
+            for key, value in customer_data.items() if value
+        }
+        get_expected = canonical_customer.get
         
-        for field in validation_result.get('fields', []):
-            field_id = field.get('field_id')
-            found_value = field.get('value')
-            
-            if field_id and found_value:
-                expected_value = customer_data.get(field_id)
-                
-                if expected_value:
-                    if str(found_value).lower().strip() == str(expected_value).lower().strip():
-                        matches.append({
-                            'field': field_id,
-                            'value': found_value
-                        })
-                    else:
-                        mismatches.append({
-                            'field': field_id,
-                            'found': found_value,
-                            'expected': expected_value
-                        })
+        compared = [
+            (field['field_id'], field['value'], get_expected(field['field_id']))
+            for field in validation_result.get('fields', [])
+            if field.get('field_id') and field.get('value')
+        ]
+        
+        matches = []
+        mismatches = []
+        for field_id, found_value, expected in compared:
+            if expected is None:
+                continue
+            found = _canonical(found_value)
+            if found == expected or _is_fuzzy_match(found, expected):
+                matches.append({
+                    'field': field_id,
+                    'value': found_value
+                })
+            else:
+                mismatches.append({
+                    'field': field_id,
+                    'found': found_value,
+                    'expected': customer_data[field_id]
+                })
         
         return {
             'matches': matches,
             'mismatches': mismatches,
-            'match_rate': len(matches) / (len(matches) + len(mismatches)) * 100 if (matches or mismatches) else 100
+            'match_rate': len(matches) / len(compared) * 100 if compared else 100
         }
 
 
+# Genel belge analizi yanıtı parse edilemediğinde dönen sonuç
+_FALLBACK_GENERIC_RESULT = {
+    'is_valid': False,
+    'overall_score': 0,
+    'warnings': ['Belge analizi yapılamadı'],
+    'recommendations': ['Manuel inceleme gerekli']
+}
+
+
+# OCR hatalarını (O/0, l/1 vb.) tolere eden benzerlik eşiği (0-100)
+FUZZY_MATCH_THRESHOLD = 95
+
+
+def _canonical(value: Any) -> str:
+    """Karşılaştırma için değeri normalize et."""
+    return str(value).casefold().strip()
+
+
+def _is_fuzzy_match(found: str, expected: str) -> bool:
+    """Birebir eşleşmeyen değerler için benzerlik kontrolü."""
+    matcher = SequenceMatcher(None, found, expected)
+    # quick_ratio üst sınırdır; eşiğin altındaysa tam hesaplama atlanır
+    if matcher.quick_ratio() * 100 < FUZZY_MATCH_THRESHOLD:
+        return False
+    return matcher.ratio() * 100 >= FUZZY_MATCH_THRESHOLD
+
+
+def _format_fields(requirements: Dict) -> str:
+    """Kontrol edilecek alanların listesini oluştur."""
+    return "\n".join([
+        f"- {f['label']} ({f['field']})" + 
+        (f" [Pattern: {f.get('pattern', '')}]" if f.get('pattern') else "") +
+        (" [İMZA GEREKLİ]" if f.get('is_signature') else "")
+        for f in requirements.get('required_fields', [])
+    ])
+
+
+_PROMPT_TEMPLATE = """Belge Tipi: {name}
+
+Kontrol Edilecek Alanlar:
+{fields}
+
+Belge İçeriği:
+---
+{text}
+---
+
+Bu belgeyi analiz et ve her alanın durumunu raporla."""
+
+# Belge tipine göre modül yüklenirken hazırlanan alan listeleri ve derlenmiş desenler
+_FIELDS_PROMPT_CACHE = {
+    document_type: _format_fields(requirements)
+    for document_type, requirements in DocumentValidator.DOCUMENT_REQUIREMENTS.items()
+}
+_FIELD_PATTERNS = {
+    document_type: {
+        f['field']: re.compile(f['pattern'])
+        for f in requirements['required_fields'] if f.get('pattern')
+    }
+    for document_type, requirements in DocumentValidator.DOCUMENT_REQUIREMENTS.items()
+}
+
+
+# Sabit sistem promptları; aynı nesne her çağrıda kullanıldığı için
+# istek hash'inde özetleri yalnızca bir kez hesaplanır.
+_SYSTEM_PROMPT = """Sen bir belge validasyon uzmanısın. Türkçe belgeleri analiz ediyorsun.
+
+Görevin:
+1. Belgede gerekli alanların bulunup bulunmadığını kontrol et
+2. Bulunan alanların değerlerini çıkar
+3. Eksik veya okunamayan alanları belirle
+4. Her alan için güven skoru (0-100) ver
+
+Yanıtını SADECE aşağıdaki JSON formatında ver:
+{
+    "is_valid": true/false,
+    "overall_score": 0-100,
+    "fields": [
+        {
+            "field_id": "alan_adi",
+            "found": true/false,
+            "value": "bulunan değer veya null",
+            "confidence": 0-100,
+            "issue": "sorun varsa açıklama"
+        }
+    ],
+    "warnings": ["uyarı mesajları"],
+    "errors": ["hata mesajları"],
+    "recommendations": ["öneriler"]
+}"""
 
+_PACKED_SYSTEM_PROMPT = _SYSTEM_PROMPT + DocumentValidator.PACK_SYSTEM_PROMPT_SUFFIX
@@ -0,0 +1,92 @@
+"""
+Yerel alan kontrolleri.
+TC kimlik no ve vergi no gibi deterministik doğrulanabilen alanları
+Claude'a gitmeden kontrol eder.
+"""
+
+import re
+from typing import Callable, Dict, Iterable, List
+
+
+def validate_tc(value: str) -> bool:
+    """TC kimlik numarasını 11 haneli sağlama algoritmasıyla doğrula."""
+    if len(value) != 11 or not value.isdigit() or value[0] == '0':
+        return False
+    
+    digits = [int(c) for c in value]
+    odd = sum(digits[0:9:2])
+    even = sum(digits[1:8:2])
+    if (odd * 7 - even) % 10 != digits[9]:
+        return False
+    return sum(digits[:10]) % 10 == digits[10]
+
+
+def validate_vergi_no(value: str) -> bool:
+    """Vergi kimlik numarasını 10 haneli sağlama algoritmasıyla doğrula."""
+    if len(value) != 10 or not value.isdigit():
+        return False
+    
+    total = 0
+    for i, c in enumerate(value[:9]):
+        tmp = (int(c) + 9 - i) % 10
+        if tmp == 9:
+            total += 9
+        else:
+            total += (tmp * 2 ** (9 - i)) % 9
+    return (10 - total % 10) % 10 == int(value[9])
+
+
+# Sağlama algoritması olan alanlar
+FIELD_VALIDATORS: Dict[str, Callable[[str], bool]] = {
+    'tc_kimlik_no': validate_tc,
+    'vergi_no': validate_vergi_no,
+}
+
+
+# Alan etiketi ve ardından gelen (boşluklarla gruplanmış olabilecek) rakamlar
+_LABELED_VALUE_PATTERNS: Dict[str, re.Pattern] = {
+    'tc_kimlik_no': re.compile(
+        r'T\.?\s?C\.?\s*Kimlik\s*(?:No|Numaras[ıi])\.?\s*[:\-]?\s*(\d+(?: \d+)*)',
+        re.IGNORECASE
+    ),
+    'vergi_no': re.compile(
+        r'(?:Vergi\s*(?:Kimlik\s*)?(?:No|Numaras[ıi])|VKN)\.?\s*[:\-]?\s*(\d+(?: \d+)*)',
+        re.IGNORECASE
+    ),
+}
+
+# Alanların hane sayısı
+_FIELD_LENGTHS: Dict[str, int] = {
+    'tc_kimlik_no': 11,
+    'vergi_no': 10,
+}
+
+
+def find_labeled_values(text: str, fields: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Metinde alan etiketinin hemen ardından gelen değerleri bul
+    (ör. "TC Kimlik No: 1234 5678 950").
+    Etiketsiz sayılar (telefon, IBAN vb.) aday sayılmaz; rakam grupları
+    tam hane sayısını vermiyorsa değer belirsiz kabul edilip atlanır.
+    
+    Returns:
+        Alan adı -> aday değerler (yalnızca rakamlar)
+    """
+    found = {}
+    for field in fields:
+        pattern = _LABELED_VALUE_PATTERNS.get(field)
+        if pattern is None:
+            continue
+        
+        length = _FIELD_LENGTHS[field]
+        values = []
+        for match in pattern.finditer(text):
+            digits = ''
+            for group in match.group(1).split():
+                digits += group
+                if len(digits) >= length:
+                    break
+            if len(digits) == length:
+                values.append(digits)
+        found[field] = values
+    return found
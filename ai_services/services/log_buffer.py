@@ -0,0 +1,15 @@
+"""
+AI Request Log Buffer.
+Collects AIRequestLog rows in memory and writes them in batches.
+"""
+
+from core.utils.log_buffer import LogBuffer
+
+
+ai_request_log_buffer = LogBuffer(
+    model_label='ai_services.AIRequestLog',
+    interval_setting='AI_LOG_FLUSH_INTERVAL_MS',
+    default_interval_ms=500,
+    max_pending=100,
+    name='ai-log-buffer'
+)
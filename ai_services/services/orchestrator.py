@@ -0,0 +1,63 @@
+"""
+Validation Orchestrator.
+Runs independent document checks concurrently.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, Optional
+
+from core.utils.db import run_with_own_connection
+
+from .document_validator import DocumentValidator
+from .signature_validator import SignatureValidator
+
+
+class ValidationOrchestrator:
+    """
+    Belge validasyonu, imza tespiti ve kaşe kontrolünü paralel çalıştırır.
+    Kontroller birbirinden bağımsız olduğu için toplam süre en yavaş
+    kontrolün süresine iner.
+    """
+    
+    CHECKS = ('validation', 'signature', 'seal')
+    
+    def __init__(self):
+        self.document_validator = DocumentValidator()
+        self.signature_validator = SignatureValidator()
+    
+    def run(
+        self,
+        document_text: str,
+        document_type: str,
+        checks: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Seçilen kontrolleri paralel çalıştır.
+        
+        Args:
+            document_text: Belge metni
+            document_type: Belge tipi
+            checks: Çalıştırılacak kontroller (varsayılan: hepsi)
+            
+        Returns:
+            Kontrol adı -> sonuç
+        """
+        available = {
+            'validation': partial(
+                self.document_validator.validate_document, document_text, document_type
+            ),
+            'signature': partial(
+                self.signature_validator.detect_signature, document_text, document_type
+            ),
+            'seal': partial(self.signature_validator.check_seal_stamp, document_text),
+        }
+        tasks = {name: available[name] for name in (checks or self.CHECKS)}
+        
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {
+                name: executor.submit(run_with_own_connection, fn)
+                for name, fn in tasks.items()
+            }
+        
+        return {name: future.result() for name, future in futures.items()}
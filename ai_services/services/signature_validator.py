@@ -5,7 +5,11 @@ Detects and validates signatures in documents.
 
 import base64
 from typing import Dict, Any, Optional, List
-from .claude import ClaudeService
+from django.conf import settings
+from core.services.base import ServiceResult
+from . import _json
+from ._tokens import fit_to_tokens_tail
+from .claude import get_shared_claude
 
 
 class SignatureValidator:
@@ -15,7 +19,9 @@ class SignatureValidator:
     """
     
     def __init__(self):
-        self.claude = ClaudeService()
+        self.claude = get_shared_claude()
+        # İmza ve kaşe belgenin sonunda yer alır; metnin sonu gönderilir
+        self.max_document_tokens = getattr(settings, 'AI_DOC_MAX_TOKENS', 1500)
     
     def detect_signature(
         self,
@@ -37,7 +43,7 @@ class SignatureValidator:
 Belge Tipi: {document_type}
 Belge İçeriği:
 ---
-{document_text[:3000]}
+{fit_to_tokens_tail(document_text, self.max_document_tokens)}
 ---
 
 Şunları kontrol et:
@@ -57,12 +63,13 @@ JSON formatında yanıt ver:
     "notes": "ek notlar"
 }}"""
         
-        response = self.claude.call_api(
+        result = self.claude.send_json_message(
             prompt=prompt,
-            system_prompt="Sen bir belge analiz uzmanısın. İmza ve paraf tespiti yapıyorsun."
+            system_prompt="Sen bir belge analiz uzmanısın. İmza ve paraf tespiti yapıyorsun.",
+            service_type='signature_detection'
         )
         
-        return self._parse_response(response)
+        return self._parse_response(result)
     
     def validate_signature_image(
         self,
@@ -109,7 +116,7 @@ JSON formatında yanıt ver:
 
 Belge İçeriği:
 ---
-{document_text[:3000]}
+{fit_to_tokens_tail(document_text, self.max_document_tokens)}
 ---
 
 Analiz et ve yanıtla:
@@ -127,12 +134,13 @@ Analiz et ve yanıtla:
     "missing_signatures": []
 }}"""
         
-        response = self.claude.call_api(
+        result = self.claude.send_json_message(
             prompt=prompt,
-            system_prompt="Sen çoklu imza analizi yapan bir uzman system."
+            system_prompt="Sen çoklu imza analizi yapan bir uzman system.",
+            service_type='signature_detection'
         )
         
-        return self._parse_response(response)
+        return self._parse_response(result)
     
     def check_seal_stamp(self, document_text: str) -> Dict[str, Any]:
         """
@@ -148,7 +156,7 @@ Analiz et ve yanıtla:
 
 Belge İçeriği:
 ---
-{document_text[:2000]}
+{fit_to_tokens_tail(document_text, self.max_document_tokens)}
 ---
 
 JSON yanıt:
@@ -159,29 +167,18 @@ JSON yanıt:
     "confidence": 0-100
 }}"""
         
-        response = self.claude.call_api(
+        result = self.claude.send_json_message(
             prompt=prompt,
-            system_prompt="Belge analiz uzmanısın."
+            system_prompt="Belge analiz uzmanısın.",
+            service_type='signature_detection'
         )
         
-        return self._parse_response(response)
+        return self._parse_response(result)
     
-    def _parse_response(self, response: str) -> Dict[str, Any]:
-        """AI yanıtını parse et."""
-        import json
-        
-        try:
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-            if start_idx != -1 and end_idx > start_idx:
-                return json.loads(response[start_idx:end_idx])
-        except (json.JSONDecodeError, ValueError):
-            pass
-        
-        return {
-            'error': 'Analiz yapılamadı',
-            'confidence': 0
-        }
+    def _parse_response(self, result: ServiceResult) -> Dict[str, Any]:
+        """AI yanıtından parse edilmiş JSON nesnesini al."""
+        parsed = result.data['parsed'] if result.success else None
+        return _json.as_object(parsed, default=_FALLBACK_RESULT)
     
     def get_signature_requirements(self, document_type: str) -> Dict[str, Any]:
         """
@@ -234,4 +231,8 @@ JSON yanıt:
         })
 
 
-
+# Yanıt parse edilemediğinde dönen sonuç
+_FALLBACK_RESULT = {
+    'error': 'Analiz yapılamadı',
+    'confidence': 0
+}
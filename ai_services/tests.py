@@ -1,3 +1,81 @@
-from django.test import TestCase
+from django.test import SimpleTestCase
 
-# Create your tests here.
+from ai_services.services.local_checks import (
+    find_labeled_values, validate_tc, validate_vergi_no
+)
+from ai_services.utils import truncate_text
+
+
+class LocalChecksTests(SimpleTestCase):
+    """
+    TC kimlik no / vergi no sağlama ve etiketli değer bulma testleri.
+    """
+
+    def test_validate_tc(self):
+        self.assertTrue(validate_tc('12345678950'))
+        self.assertFalse(validate_tc('12345678951'))  # hatalı son hane
+        self.assertFalse(validate_tc('02345678950'))  # 0 ile başlayamaz
+        self.assertFalse(validate_tc('1234567895'))  # eksik hane
+        self.assertFalse(validate_tc('1234567895a'))
+
+    def test_validate_vergi_no(self):
+        self.assertTrue(validate_vergi_no('1234567890'))
+        self.assertTrue(validate_vergi_no('9876543217'))
+        self.assertFalse(validate_vergi_no('1234567891'))
+        self.assertFalse(validate_vergi_no('123456789'))
+        self.assertFalse(validate_vergi_no('123456789a'))
+
+    def test_labeled_values(self):
+        text = 'T.C. Kimlik Numarası: 12345678950\nVKN: 1234567890'
+        found = find_labeled_values(text, ['tc_kimlik_no', 'vergi_no'])
+        self.assertEqual(found, {
+            'tc_kimlik_no': ['12345678950'],
+            'vergi_no': ['1234567890'],
+        })
+
+    def test_space_grouped_digits(self):
+        text = 'TC Kimlik No: 1234 5678 950\nTel: 05321234567'
+        found = find_labeled_values(text, ['tc_kimlik_no'])
+        self.assertEqual(found['tc_kimlik_no'], ['12345678950'])
+
+    def test_incomplete_groups_are_skipped(self):
+        found = find_labeled_values('TC Kimlik No: 123 45', ['tc_kimlik_no'])
+        self.assertEqual(found['tc_kimlik_no'], [])
+
+    def test_unlabeled_numbers_are_ignored(self):
+        # Telefon ve IBAN rakamları aday sayılmamalı, belge reddedilmemeli
+        text = 'Tel: 0532 123 45 67\nIBAN: TR33 0006 1005 1978 6457 8413 26\n05321234567'
+        found = find_labeled_values(text, ['tc_kimlik_no', 'vergi_no'])
+        self.assertEqual(found, {'tc_kimlik_no': [], 'vergi_no': []})
+
+    def test_unknown_field_is_skipped(self):
+        self.assertEqual(find_labeled_values('Adres: 12345', ['adres']), {})
+
+
+class TruncateTextTests(SimpleTestCase):
+    """
+    truncate_text kesme noktası testleri.
+    """
+
+    def test_short_text_unchanged(self):
+        self.assertEqual(truncate_text('kısa metin', 100), 'kısa metin')
+
+    def test_cuts_at_sentence_end(self):
+        text = 'a' * 85 + '. ' + 'b' * 30
+        self.assertEqual(truncate_text(text, 100), 'a' * 85 + '.')
+
+    def test_cuts_at_newline(self):
+        text = 'a' * 85 + '\n' + 'b' * 30
+        self.assertEqual(truncate_text(text, 100), 'a' * 85)
+
+    def test_falls_back_to_word_boundary(self):
+        result = truncate_text('kelime ' * 30, 100)
+        self.assertEqual(result, ' '.join(['kelime'] * 14) + '...')
+
+    def test_sentence_before_floor_is_ignored(self):
+        # %80'in altındaki cümle sonu kullanılmaz
+        text = 'a' * 50 + '. ' + 'b' * 100
+        self.assertEqual(truncate_text(text, 100), text[:100] + '...')
+
+    def test_hard_cut_without_boundary(self):
+        self.assertEqual(truncate_text('a' * 150, 100), 'a' * 100 + '...')
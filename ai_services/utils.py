@@ -3,13 +3,24 @@ AI Services utilities.
 Helper functions for AI operations.
 """
 
+import re
 import time
 import logging
-from typing import Callable, Any, Optional
+from typing import Callable, Any, List, Optional
 from functools import wraps
 
+from .services import _json
+from .services._tokens import estimate_tokens
+
 logger = logging.getLogger(__name__)
 
+# Markdown code fences (```json or ```) and runs of blank lines
+_RE_FENCE = re.compile(r'```(?:json)?\s*')
+_RE_MULTINL = re.compile(r'\n{3,}')
+
+# Swaps the thousands and decimal separators for Turkish formatting (1.234,56)
+_TR_CURRENCY_TABLE = str.maketrans({',': '.', '.': ','})
+
 
 def retry_with_backoff(
     max_retries: int = 3,
@@ -34,6 +45,8 @@ def retry_with_backoff(
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
+            sleep = time.sleep
+            started = time.monotonic()
             delay = initial_delay
             last_exception = None
             
@@ -44,14 +57,15 @@ def retry_with_backoff(
                     last_exception = e
                     if attempt < max_retries:
                         logger.warning(
-                            f"Attempt {attempt + 1} failed for {func.__name__}: {e}. "
-                            f"Retrying in {delay:.1f}s..."
+                            "Attempt %d failed for %s: %s. Retrying in %.1fs...",
+                            attempt + 1, func.__name__, e, delay
                         )
-                        time.sleep(delay)
+                        sleep(delay)
                         delay *= backoff_factor
                     else:
                         logger.error(
-                            f"All {max_retries + 1} attempts failed for {func.__name__}"
+                            "All %d attempts failed for %s after %.1fs",
+                            max_retries + 1, func.__name__, time.monotonic() - started
                         )
             
             raise last_exception
@@ -74,28 +88,36 @@ def truncate_text(text: str, max_length: int = 4000) -> str:
     if len(text) <= max_length:
         return text
     
-    # Try to truncate at a sentence boundary
-    truncated = text[:max_length]
+    sentence_floor = max_length * 0.8  # At least 80% of content
+    word_floor = max_length * 0.9
+    last_space = -1
     
-    # Find last sentence end
-    for end_char in ['. ', '! ', '? ', '\n']:
-        last_end = truncated.rfind(end_char)
-        if last_end > max_length * 0.8:  # At least 80% of content
-            return truncated[:last_end + 1].strip()
+    # Single reverse scan for the last sentence end, remembering the
+    # last word boundary on the way
+    i = max_length - 1
+    while i > sentence_floor:
+        char = text[i]
+        if char == '\n':
+            return text[:i + 1].strip()
+        if char == ' ':
+            if text[i - 1] in '.!?' and i - 1 > sentence_floor:
+                return text[:i].strip()
+            if last_space == -1:
+                last_space = i
+        i -= 1
     
     # Fallback to word boundary
-    last_space = truncated.rfind(' ')
-    if last_space > max_length * 0.9:
-        return truncated[:last_space].strip() + "..."
+    if last_space > word_floor:
+        return text[:last_space].strip() + "..."
     
-    return truncated.strip() + "..."
+    return text[:max_length].strip() + "..."
 
 
 def calculate_token_estimate(text: str) -> int:
     """
     Estimate the number of tokens in a text.
-    Rough estimation: ~4 characters per token for English,
-    ~2-3 characters per token for Turkish.
+    Uses the same UTF-8 bytes-per-token heuristic as the document
+    truncation, so a text gets one estimate everywhere.
     
     Args:
         text: Text to estimate tokens for
@@ -103,9 +125,21 @@ def calculate_token_estimate(text: str) -> int:
     Returns:
         Estimated token count
     """
-    # Turkish text tends to have more tokens per word
-    # Using a conservative estimate of 3 chars per token
-    return len(text) // 3
+    return estimate_tokens(text)
+
+
+def calculate_token_estimates(texts: List[str]) -> List[int]:
+    """
+    Estimate token counts for many texts at once.
+    Same estimate as calculate_token_estimate.
+    
+    Args:
+        texts: Texts to estimate tokens for
+    
+    Returns:
+        Estimated token counts, in the same order
+    """
+    return list(map(estimate_tokens, texts))
 
 
 def format_currency(amount: float, currency: str = "TL") -> str:
@@ -119,8 +153,7 @@ def format_currency(amount: float, currency: str = "TL") -> str:
     Returns:
         Formatted currency string
     """
-    formatted = f"{amount:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-    return f"{formatted} {currency}"
+    return f"{format(amount, ',.2f').translate(_TR_CURRENCY_TABLE)} {currency}"
 
 
 def clean_ai_response(response: str) -> str:
@@ -133,14 +166,11 @@ def clean_ai_response(response: str) -> str:
     Returns:
         Cleaned response
     """
-    import re
-    
     # Remove markdown code blocks
-    response = re.sub(r'```json\s*', '', response)
-    response = re.sub(r'```\s*', '', response)
+    response = _RE_FENCE.sub('', response)
     
     # Remove excessive whitespace
-    response = re.sub(r'\n{3,}', '\n\n', response)
+    response = _RE_MULTINL.sub('\n\n', response)
     response = response.strip()
     
     return response
@@ -157,35 +187,21 @@ def extract_json_from_response(response: str) -> Optional[dict]:
     Returns:
         Parsed JSON object or None
     """
-    import json
-    
     # Clean the response first
     cleaned = clean_ai_response(response)
     
     # Try direct parsing
     try:
-        return json.loads(cleaned)
-    except json.JSONDecodeError:
+        return _json.loads(cleaned)
+    except ValueError:
         pass
     
-    # Try to find JSON object
-    json_start = cleaned.find('{')
-    json_end = cleaned.rfind('}')
-    
-    if json_start != -1 and json_end > json_start:
-        try:
-            return json.loads(cleaned[json_start:json_end + 1])
-        except json.JSONDecodeError:
-            pass
-    
-    # Try to find JSON array
-    json_start = cleaned.find('[')
-    json_end = cleaned.rfind(']')
-    
-    if json_start != -1 and json_end > json_start:
+    # Try to find an embedded JSON object or array
+    span = _json.find_json_span(cleaned)
+    if span:
         try:
-            return json.loads(cleaned[json_start:json_end + 1])
-        except json.JSONDecodeError:
+            return _json.loads(cleaned[span[0]:span[1]])
+        except ValueError:
             pass
     
     return None
@@ -9,6 +9,24 @@ from django.core.exceptions import PermissionDenied
 from django.http import JsonResponse
 
 
+def _user_ctx(request):
+    """
+    İsteğin kullanıcısı için (giriş yapmış mı, superuser mı, kullanıcı tipi)
+    bilgisini bir kez okuyup request üzerinde saklar. Aynı view'da birden
+    fazla decorator/mixin olduğunda lazy user tekrar tekrar çözülmez.
+    """
+    ctx = getattr(request, '_user_ctx', None)
+    if ctx is None:
+        user = request.user
+        ctx = (
+            user.is_authenticated,
+            getattr(user, 'is_superuser', False),
+            getattr(user, 'user_type', None),
+        )
+        request._user_ctx = ctx
+    return ctx
+
+
 def user_type_required(*allowed_types):
     """
     Decorator to restrict access to specific user types.
@@ -21,19 +39,22 @@ def user_type_required(*allowed_types):
         def my_view(request):
             ...
     """
+    allowed = frozenset(allowed_types)
+    
     def decorator(view_func):
         @wraps(view_func)
         def wrapper(request, *args, **kwargs):
-            if not request.user.is_authenticated:
+            is_authenticated, is_superuser, user_type = _user_ctx(request)
+            if not is_authenticated:
                 messages.error(request, 'Bu sayfayı görüntülemek için giriş yapmalısınız.')
                 return redirect('accounts:login')
             
             # Superusers always have access
-            if request.user.is_superuser:
+            if is_superuser:
                 return view_func(request, *args, **kwargs)
             
             # Check user type
-            if request.user.user_type not in allowed_types:
+            if user_type not in allowed:
                 messages.error(request, 'Bu sayfaya erişim yetkiniz bulunmamaktadır.')
                 return redirect('dashboard')
             
@@ -48,11 +69,12 @@ def admin_required(view_func):
     """
     @wraps(view_func)
     def wrapper(request, *args, **kwargs):
-        if not request.user.is_authenticated:
+        is_authenticated, is_superuser, user_type = _user_ctx(request)
+        if not is_authenticated:
             messages.error(request, 'Bu sayfayı görüntülemek için giriş yapmalısınız.')
             return redirect('accounts:login')
         
-        if not request.user.is_admin:
+        if user_type != 'admin' and not is_superuser:
             messages.error(request, 'Bu sayfaya erişim yetkiniz bulunmamaktadır.')
             return redirect('dashboard')
         
@@ -66,11 +88,12 @@ def salesperson_required(view_func):
     """
     @wraps(view_func)
     def wrapper(request, *args, **kwargs):
-        if not request.user.is_authenticated:
+        is_authenticated, is_superuser, user_type = _user_ctx(request)
+        if not is_authenticated:
             messages.error(request, 'Bu sayfayı görüntülemek için giriş yapmalısınız.')
             return redirect('accounts:login')
         
-        if not (request.user.is_salesperson or request.user.is_admin):
+        if user_type not in ('salesperson', 'admin') and not is_superuser:
             messages.error(request, 'Bu sayfaya erişim yetkiniz bulunmamaktadır.')
             return redirect('dashboard')
         
@@ -84,11 +107,12 @@ def customer_required(view_func):
     """
     @wraps(view_func)
     def wrapper(request, *args, **kwargs):
-        if not request.user.is_authenticated:
+        is_authenticated, is_superuser, user_type = _user_ctx(request)
+        if not is_authenticated:
             messages.error(request, 'Bu sayfayı görüntülemek için giriş yapmalısınız.')
             return redirect('accounts:login')
         
-        if not request.user.is_customer_user:
+        if user_type != 'customer':
             messages.error(request, 'Bu sayfaya erişim yetkiniz bulunmamaktadır.')
             return redirect('dashboard')
         
@@ -118,11 +142,12 @@ def verified_user_required(view_func):
     """
     @wraps(view_func)
     def wrapper(request, *args, **kwargs):
-        if not request.user.is_authenticated:
+        is_authenticated, is_superuser, user_type = _user_ctx(request)
+        if not is_authenticated:
             messages.error(request, 'Bu sayfayı görüntülemek için giriş yapmalısınız.')
             return redirect('accounts:login')
         
-        if not request.user.is_verified and not request.user.is_superuser:
+        if not is_superuser and not request.user.is_verified:
             messages.warning(request, 'Hesabınız henüz doğrulanmamış.')
             return redirect('accounts:verification_required')
         
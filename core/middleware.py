@@ -3,8 +3,28 @@ Role-based routing middleware.
 Redirects users to their appropriate dashboards based on user type.
 """
 
+import time
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.http import JsonResponse
 from django.shortcuts import redirect
 from django.urls import reverse
+from django.utils import timezone
+
+
+# Asset and tooling paths that never need the user or the session
+STATIC_PREFIXES = ('/static/', '/media/', '/__debug__/')
+
+# User type -> dashboard URL name
+DASHBOARD_ROUTES = {
+    'admin': 'admin_dashboard',
+    'salesperson': 'sales_dashboard',
+    'customer': 'customer_dashboard',
+}
+
+# Pages only admins and salespeople may open
+SALES_AREA_PREFIXES = ('/customers/', '/tasks/')
 
 
 class RoleBasedRoutingMiddleware:
@@ -29,11 +49,15 @@ class RoleBasedRoutingMiddleware:
             '/media/',
             '/__debug__/',
         ]
+        # str.startswith checks a tuple of prefixes in a single call
+        self._exempt_prefixes = tuple(self.exempt_paths)
+        # user type -> reversed dashboard URL
+        self._dashboard_urls = {}
     
     def __call__(self, request):
         # Check if path is exempt
         path = request.path
-        if any(path.startswith(exempt) for exempt in self.exempt_paths):
+        if path.startswith(self._exempt_prefixes):
             return self.get_response(request)
         
         # Only handle authenticated users
@@ -49,7 +73,7 @@ class RoleBasedRoutingMiddleware:
             return self.get_response(request)
         
         # Check access permissions for specific areas
-        if path.startswith('/customers/') or path.startswith('/tasks/'):
+        if path.startswith(SALES_AREA_PREFIXES):
             if not self.can_access_sales_area(request.user):
                 return redirect('customer_dashboard')
         
@@ -63,14 +87,13 @@ class RoleBasedRoutingMiddleware:
         """
         Redirect user to their appropriate dashboard.
         """
-        if user.is_superuser or user.user_type == 'admin':
-            return redirect('admin_dashboard')
-        elif user.user_type == 'salesperson':
-            return redirect('sales_dashboard')
-        elif user.user_type == 'customer':
-            return redirect('customer_dashboard')
-        else:
-            return redirect('dashboard')
+        user_type = 'admin' if user.is_superuser else user.user_type
+        url = self._dashboard_urls.get(user_type)
+        if url is None:
+            # Reversed once per user type; the URLconf is not loaded yet in __init__
+            url = reverse(DASHBOARD_ROUTES.get(user_type, 'dashboard'))
+            self._dashboard_urls[user_type] = url
+        return redirect(url)
     
     def can_access_sales_area(self, user):
         """
@@ -85,19 +108,6 @@ class RoleBasedRoutingMiddleware:
         return user.is_superuser or user.user_type == 'admin'
 
 
-class CustomerAccessMiddleware:
-    """
-    Middleware that ensures customers can only access their own data.
-    """
-    
-    def __init__(self, get_response):
-        self.get_response = get_response
-    
-    def __call__(self, request):
-        response = self.get_response(request)
-        return response
-
-
 class KVKKApprovalMiddleware:
     """
     Middleware that enforces KVKK approval for customer users.
@@ -125,11 +135,13 @@ class KVKKApprovalMiddleware:
             '/media/',
             '/__debug__/',
         ]
+        # str.startswith checks a tuple of prefixes in a single call
+        self._exempt_prefixes = tuple(self.exempt_paths)
     
     def __call__(self, request):
         # Check if path is exempt
         path = request.path
-        if any(path.startswith(exempt) for exempt in self.exempt_paths):
+        if path.startswith(self._exempt_prefixes):
             return self.get_response(request)
         
         # Only check for authenticated customer users
@@ -160,23 +172,29 @@ class ActivityTrackingMiddleware:
     
     def __init__(self, get_response):
         self.get_response = get_response
+        self.interval = 300  # seconds between writes per user
     
     def __call__(self, request):
         response = self.get_response(request)
         
+        # Asset requests are not activity; skip them before request.user
+        # triggers a session and user lookup
+        if request.path.startswith(STATIC_PREFIXES):
+            return response
+        
         # Update last activity for authenticated users
         if request.user.is_authenticated:
             # Only update periodically to avoid excessive DB writes
-            from django.utils import timezone
-            from datetime import timedelta
-            
             user = request.user
             now = timezone.now()
             
             # Update if last_activity is None or older than 5 minutes
-            if not user.last_activity or (now - user.last_activity) > timedelta(minutes=5):
+            if not user.last_activity or (now - user.last_activity) > timedelta(seconds=self.interval):
+                # cache.add is atomic: concurrent requests of the same user
+                # collapse into a single write per interval
+                if cache.add(f"ua:{user.pk}", 1, timeout=self.interval):
+                    type(user).objects.filter(pk=user.pk).update(last_activity=now)
                 user.last_activity = now
-                user.save(update_fields=['last_activity'])
         
         return response
 
@@ -185,19 +203,16 @@ class RateLimitMiddleware:
     """
     Basit rate limiting middleware.
     API abuse'u önlemek için.
+    Sayaçlar Django cache'inde tutulur; böylece tüm worker'lar aynı
+    limiti paylaşır.
     """
     
     def __init__(self, get_response):
         self.get_response = get_response
-        self.cache = {}  # In production, use Django cache or Redis
         self.rate_limit = 100  # requests per minute
         self.window = 60  # seconds
     
     def __call__(self, request):
-        from django.http import JsonResponse
-        from django.utils import timezone
-        import time
-        
         # Only rate limit API endpoints
         if not request.path.startswith('/api/'):
             return self.get_response(request)
@@ -206,20 +221,21 @@ class RateLimitMiddleware:
         client_ip = self.get_client_ip(request)
         current_time = time.time()
         
-        # Clean old entries
-        self.clean_old_entries(current_time)
+        # Fixed window counter: one key per IP and window
+        bucket = f"rl:{client_ip}:{int(current_time) // self.window}"
+        cache.add(bucket, 0, timeout=self.window)
+        try:
+            count = cache.incr(bucket)
+        except ValueError:
+            # Key evicted or the cache backend does not store values
+            count = 1
         
         # Check rate limit
-        if client_ip in self.cache:
-            requests = self.cache[client_ip]
-            if len(requests) >= self.rate_limit:
-                return JsonResponse({
-                    'error': 'Rate limit exceeded',
-                    'message': 'Çok fazla istek gönderdiniz. Lütfen bekleyin.'
-                }, status=429)
-            requests.append(current_time)
-        else:
-            self.cache[client_ip] = [current_time]
+        if count > self.rate_limit:
+            return JsonResponse({
+                'error': 'Rate limit exceeded',
+                'message': 'Çok fazla istek gönderdiniz. Lütfen bekleyin.'
+            }, status=429)
         
         return self.get_response(request)
     
@@ -229,14 +245,25 @@ class RateLimitMiddleware:
         if x_forwarded_for:
             return x_forwarded_for.split(',')[0]
         return request.META.get('REMOTE_ADDR', 'unknown')
-    
-    def clean_old_entries(self, current_time):
-        """Remove entries older than the rate limit window."""
-        cutoff = current_time - self.window
-        for ip in list(self.cache.keys()):
-            self.cache[ip] = [t for t in self.cache[ip] if t > cutoff]
-            if not self.cache[ip]:
-                del self.cache[ip]
+
+
+# Security headers set on every response
+SECURITY_HEADERS = (
+    ('X-Content-Type-Options', 'nosniff'),
+    ('X-Frame-Options', 'DENY'),
+    ('X-XSS-Protection', '1; mode=block'),
+    ('Referrer-Policy', 'strict-origin-when-cross-origin'),
+)
+
+# Content Security Policy (basic), used when the view did not set one
+CONTENT_SECURITY_POLICY = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.jsdelivr.net https://cdn.tailwindcss.com; "
+    "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com https://cdn.jsdelivr.net; "
+    "font-src 'self' https://fonts.gstatic.com; "
+    "img-src 'self' data: https:; "
+    "connect-src 'self';"
+)
 
 
 class SecurityHeadersMiddleware:
@@ -250,22 +277,11 @@ class SecurityHeadersMiddleware:
     def __call__(self, request):
         response = self.get_response(request)
         
-        # Security headers
-        response['X-Content-Type-Options'] = 'nosniff'
-        response['X-Frame-Options'] = 'DENY'
-        response['X-XSS-Protection'] = '1; mode=block'
-        response['Referrer-Policy'] = 'strict-origin-when-cross-origin'
+        headers = response.headers
+        for name, value in SECURITY_HEADERS:
+            headers[name] = value
         
-        # Content Security Policy (basic)
-        if not response.get('Content-Security-Policy'):
-            response['Content-Security-Policy'] = (
-                "default-src 'self'; "
-                "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.jsdelivr.net https://cdn.tailwindcss.com; "
-                "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com https://cdn.jsdelivr.net; "
-                "font-src 'self' https://fonts.gstatic.com; "
-                "img-src 'self' data: https:; "
-                "connect-src 'self';"
-            )
+        if not headers.get('Content-Security-Policy'):
+            headers['Content-Security-Policy'] = CONTENT_SECURITY_POLICY
         
         return response
-
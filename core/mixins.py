@@ -2,12 +2,19 @@
 Mixins for Django models and views.
 """
 
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import redirect
 from django.contrib import messages
 
+from .decorators import _user_ctx
+from .utils.logging import ActivityLogger
+
+# Request-independent activity logger (stateless, shared across calls)
+_activity_logger = ActivityLogger()
+
 
 class SalespersonRequiredMixin(LoginRequiredMixin):
     """
@@ -15,10 +22,11 @@ class SalespersonRequiredMixin(LoginRequiredMixin):
     """
     
     def dispatch(self, request, *args, **kwargs):
-        if not request.user.is_authenticated:
+        is_authenticated, is_superuser, user_type = _user_ctx(request)
+        if not is_authenticated:
             return self.handle_no_permission()
         
-        if request.user.user_type != 'salesperson' and not request.user.is_superuser:
+        if user_type != 'salesperson' and not is_superuser:
             messages.error(request, 'Bu sayfaya erişim yetkiniz yok.')
             return redirect('dashboard')
         
@@ -31,10 +39,11 @@ class CustomerRequiredMixin(LoginRequiredMixin):
     """
     
     def dispatch(self, request, *args, **kwargs):
-        if not request.user.is_authenticated:
+        is_authenticated, is_superuser, user_type = _user_ctx(request)
+        if not is_authenticated:
             return self.handle_no_permission()
         
-        if request.user.user_type != 'customer' and not request.user.is_superuser:
+        if user_type != 'customer' and not is_superuser:
             messages.error(request, 'Bu sayfaya erişim yetkiniz yok.')
             return redirect('dashboard')
         
@@ -47,10 +56,11 @@ class AdminRequiredMixin(LoginRequiredMixin):
     """
     
     def dispatch(self, request, *args, **kwargs):
-        if not request.user.is_authenticated:
+        is_authenticated, is_superuser, user_type = _user_ctx(request)
+        if not is_authenticated:
             return self.handle_no_permission()
         
-        if request.user.user_type != 'admin' and not request.user.is_superuser:
+        if user_type != 'admin' and not is_superuser:
             messages.error(request, 'Bu sayfaya erişim yetkiniz yok.')
             return redirect('dashboard')
         
@@ -131,12 +141,31 @@ class SoftDeleteMixin(models.Model):
         Args:
             user: The user performing the delete operation
         """
-        from django.utils import timezone
-        self.is_deleted = True
-        self.deleted_at = timezone.now()
+        fields = {'is_deleted': True, 'deleted_at': timezone.now()}
         if user:
-            self.deleted_by = user
-        self.save(update_fields=['is_deleted', 'deleted_at', 'deleted_by'])
+            fields['deleted_by'] = user
+        
+        # Single UPDATE without model save() and its signals
+        type(self).objects.filter(pk=self.pk).update(**fields)
+        for name, value in fields.items():
+            setattr(self, name, value)
+    
+    @classmethod
+    def soft_delete_qs(cls, queryset, user=None) -> int:
+        """
+        Soft delete every record in a queryset with a single UPDATE.
+        
+        Args:
+            queryset: Records to delete
+            user: The user performing the delete operation
+        
+        Returns:
+            Number of records updated
+        """
+        fields = {'is_deleted': True, 'deleted_at': timezone.now()}
+        if user:
+            fields['deleted_by'] = user
+        return queryset.update(**fields)
     
     def restore(self):
         """
@@ -183,23 +212,65 @@ class StatusMixin(models.Model):
             new_status: The new status value
             user: The user making the change
         """
-        from django.utils import timezone
-        
         old_status = self.status
         self.status = new_status
         self.status_changed_at = timezone.now()
         if user:
             self.status_changed_by = user
-        self.save(update_fields=['status', 'status_changed_at', 'status_changed_by'])
-        
-        # Log the status change
-        from core.utils.logging import ActivityLogger
-        ActivityLogger().log(
-            action_type='update',
-            description=f"Durum değiştirildi: {old_status} -> {new_status}",
-            model_name=self.__class__.__name__,
-            object_id=self.pk,
-            object_repr=str(self),
-            extra_data={'old_status': old_status, 'new_status': new_status}
-        )
+        
+        # Status and its log entry are committed together
+        with transaction.atomic():
+            self.save(update_fields=['status', 'status_changed_at', 'status_changed_by'])
+            
+            # Log the status change
+            _activity_logger.log(
+                action_type='update',
+                description=f"Durum değiştirildi: {old_status} -> {new_status}",
+                model_name=self.__class__.__name__,
+                object_id=self.pk,
+                object_repr=str(self),
+                extra_data={'old_status': old_status, 'new_status': new_status},
+                sync=True
+            )
+    
+    @classmethod
+    def change_status_bulk(cls, instances, new_status: str, user=None):
+        """
+        Change the status of many records with one bulk update and one
+        bulk insert of their activity logs.
+        
+        Args:
+            instances: Records to update
+            new_status: The new status value
+            user: The user making the change
+        """
+        from core.models import ActivityLog
+        
+        instances = list(instances)
+        if not instances:
+            return
+        
+        now = timezone.now()
+        logs = []
+        for instance in instances:
+            old_status = instance.status
+            instance.status = new_status
+            instance.status_changed_at = now
+            if user:
+                instance.status_changed_by = user
+            logs.append(ActivityLog(
+                user=user,
+                action_type='update',
+                model_name=cls.__name__,
+                object_id=instance.pk,
+                object_repr=str(instance)[:200],
+                description=f"Durum değiştirildi: {old_status} -> {new_status}",
+                extra_data={'old_status': old_status, 'new_status': new_status}
+            ))
+        
+        with transaction.atomic():
+            cls.objects.bulk_update(
+                instances, ['status', 'status_changed_at', 'status_changed_by']
+            )
+            ActivityLog.objects.bulk_create(logs)
 
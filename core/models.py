@@ -76,6 +76,15 @@ class Notification(models.Model):
         verbose_name = _('Bildirim')
         verbose_name_plural = _('Bildirimler')
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+            # Okunmamış bildirim sayısı ve listesi yalnızca bu küçük indeksi tarar
+            models.Index(
+                fields=['user', '-created_at'],
+                name='notif_unread_idx',
+                condition=models.Q(is_read=False)
+            ),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.title}"
@@ -83,10 +92,14 @@ class Notification(models.Model):
     def mark_as_read(self):
         """Bildirimi okundu olarak işaretle."""
         from django.utils import timezone
+        from core.services.notifications import invalidate_unread_count
         if not self.is_read:
             self.is_read = True
             self.read_at = timezone.now()
-            self.save(update_fields=['is_read', 'read_at'])
+            Notification.objects.filter(pk=self.pk, is_read=False).update(
+                is_read=True, read_at=self.read_at
+            )
+            invalidate_unread_count(self.user_id)
 
 
 class ActivityLog(models.Model):
@@ -153,15 +166,21 @@ class ActivityLog(models.Model):
         default=dict,
         blank=True
     )
+    # auto_now_add yerine default: satırlar arka planda toplu yazıldığında
+    # zaman damgası yazma anını değil, olayın oluştuğu anı gösterir
     created_at = models.DateTimeField(
         _('Oluşturulma Tarihi'),
-        auto_now_add=True
+        default=timezone.now,
+        editable=False
     )
     
     class Meta:
         verbose_name = _('Aktivite Logu')
         verbose_name_plural = _('Aktivite Logları')
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+        ]
     
     def __str__(self):
         user_str = self.user.username if self.user else 'System'
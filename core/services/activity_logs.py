@@ -0,0 +1,49 @@
+"""
+Activity log service for listing user activities.
+
+Returned querysets already join the user; iterate them as they are
+instead of re-fetching each row's user (e.g. refresh_from_db in a loop).
+"""
+
+from typing import Optional
+from django.db.models import QuerySet
+
+from .base import BaseService
+from ..models import ActivityLog
+
+
+class ActivityLogService(BaseService):
+    """
+    Service for querying activity logs.
+    """
+    
+    def list(
+        self,
+        user=None,
+        action_type: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> QuerySet:
+        """
+        Get activity logs, newest first.
+        
+        Args:
+            user: Only return this user's activities
+            action_type: Only return activities of this type
+            limit: Maximum number of logs to return
+        
+        Returns:
+            QuerySet of activity logs with their users joined
+        """
+        qs = ActivityLog.objects.select_related('user')
+        
+        if user is not None:
+            qs = qs.filter(user=user)
+        if action_type:
+            qs = qs.filter(action_type=action_type)
+        
+        qs = qs.order_by('-created_at')
+        
+        if limit:
+            qs = qs[:limit]
+        
+        return qs
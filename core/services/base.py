@@ -14,28 +14,42 @@ class BaseService:
     All service classes should inherit from this.
     """
     
-    def __init__(self):
-        self.logger = logging.getLogger(self.__class__.__module__)
+    # One logger per service class, resolved when the class is defined
+    logger = logging.getLogger(__name__)
     
-    def log_info(self, message: str, **kwargs):
-        """Log an info message."""
-        self.logger.info(f"{self.__class__.__name__}: {message}", extra=kwargs)
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__module__)
     
-    def log_error(self, message: str, exc: Optional[Exception] = None, **kwargs):
-        """Log an error message."""
-        self.logger.error(
-            f"{self.__class__.__name__}: {message}", 
-            exc_info=exc,
-            extra=kwargs
-        )
+    def _log(self, level: int, message: str, args: tuple, exc_info=None, extra=None):
+        """
+        Log with the class name prefixed. Formatting is left to the
+        logging framework and skipped entirely when the level is disabled.
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        if args:
+            self.logger.log(level, "%s: " + message, type(self).__name__, *args,
+                            exc_info=exc_info, extra=extra)
+        else:
+            self.logger.log(level, "%s: %s", type(self).__name__, message,
+                            exc_info=exc_info, extra=extra)
     
-    def log_warning(self, message: str, **kwargs):
-        """Log a warning message."""
-        self.logger.warning(f"{self.__class__.__name__}: {message}", extra=kwargs)
+    def log_info(self, message: str, *args, **kwargs):
+        """Log an info message; %-style args are formatted lazily."""
+        self._log(logging.INFO, message, args, extra=kwargs)
     
-    def log_debug(self, message: str, **kwargs):
-        """Log a debug message."""
-        self.logger.debug(f"{self.__class__.__name__}: {message}", extra=kwargs)
+    def log_error(self, message: str, *args, exc: Optional[Exception] = None, **kwargs):
+        """Log an error message; %-style args are formatted lazily."""
+        self._log(logging.ERROR, message, args, exc_info=exc, extra=kwargs)
+    
+    def log_warning(self, message: str, *args, **kwargs):
+        """Log a warning message; %-style args are formatted lazily."""
+        self._log(logging.WARNING, message, args, extra=kwargs)
+    
+    def log_debug(self, message: str, *args, **kwargs):
+        """Log a debug message; %-style args are formatted lazily."""
+        self._log(logging.DEBUG, message, args, extra=kwargs)
     
     def success(self, data: Any = None, message: str = "İşlem başarılı") -> 'ServiceResult':
         """Create and return a successful result."""
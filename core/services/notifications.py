@@ -2,14 +2,34 @@
 Notification service for managing in-app notifications.
 """
 
-from typing import Optional, List
+from typing import Iterable, Optional, List
 from django.conf import settings
+from django.core.cache import cache
 from django.db.models import QuerySet
 
 from .base import BaseService, ServiceResult
 from ..models import Notification
 
 
+# Unread counts are cached for this many seconds
+UNREAD_COUNT_CACHE_TTL = 60
+
+
+def _unread_cache_key(user_id) -> str:
+    """Cache key of a user's unread notification count."""
+    return f"notif:unread:{user_id}"
+
+
+def invalidate_unread_count(*user_ids):
+    """
+    Drop the cached unread counts of the given users.
+    Saves are covered by a post_save receiver (core.signals); call this
+    after bulk_create, queryset update() and delete(), which send no
+    post_save.
+    """
+    cache.delete_many([_unread_cache_key(user_id) for user_id in user_ids])
+
+
 class NotificationService(BaseService):
     """
     Service for creating and managing notifications.
@@ -36,26 +56,71 @@ class NotificationService(BaseService):
         Returns:
             ServiceResult with the created notification
         """
+        result = self.create_notifications_bulk(
+            [user],
+            title=title,
+            message=message,
+            notification_type=notification_type,
+            link=link
+        )
+        if result.success:
+            result.data = result.data[0]
+        return result
+    
+    def create_notifications_bulk(
+        self,
+        users: Iterable,
+        title: str,
+        message: str,
+        notification_type: str = Notification.NotificationType.INFO,
+        link: Optional[str] = None
+    ) -> ServiceResult:
+        """
+        Create the same notification for many users with bulk inserts.
+        
+        Args:
+            users: Users (or user primary keys) to receive the notification
+            title: Notification title
+            message: Notification message
+            notification_type: Type of notification (info, success, warning, error)
+            link: Optional URL to link to
+        
+        Returns:
+            ServiceResult with the list of created notifications
+        """
         try:
-            notification = Notification.objects.create(
-                user=user,
-                title=title,
-                message=message,
-                notification_type=notification_type,
-                link=link
+            notifications = Notification.objects.bulk_create(
+                [
+                    Notification(
+                        user_id=getattr(user, 'pk', user),
+                        title=title,
+                        message=message,
+                        notification_type=notification_type,
+                        link=link
+                    )
+                    for user in users
+                ],
+                batch_size=getattr(settings, 'BULK_CREATE_BATCH_SIZE', 500)
             )
-            self.log_info(f"Notification created for user {user.username}: {title}")
+            invalidate_unread_count(*{n.user_id for n in notifications})
+            self.log_info("%d notifications created: %s", len(notifications), title)
             return ServiceResult.ok(
-                data=notification,
+                data=notifications,
                 message="Bildirim oluşturuldu"
             )
         except Exception as e:
-            self.log_error(f"Failed to create notification: {str(e)}", exc=e)
+            self.log_error(f"Failed to create notifications: {str(e)}", exc=e)
             return ServiceResult.fail(
                 message="Bildirim oluşturulamadı",
                 errors={'exception': str(e)}
             )
     
+    def _notify(self, users, **kwargs) -> ServiceResult:
+        """Create a notification for a single user or a list of users."""
+        if isinstance(users, (list, tuple, set, QuerySet)):
+            return self.create_notifications_bulk(users, **kwargs)
+        return self.create_notification(users, **kwargs)
+    
     def get_user_notifications(
         self,
         user,
@@ -73,7 +138,8 @@ class NotificationService(BaseService):
         Returns:
             QuerySet of notifications
         """
-        qs = Notification.objects.filter(user=user)
+        # __str__ reads user.username; join it instead of one query per row
+        qs = Notification.objects.select_related('user').filter(user=user)
         
         if unread_only:
             qs = qs.filter(is_read=False)
@@ -88,19 +154,40 @@ class NotificationService(BaseService):
     def get_unread_count(self, user) -> int:
         """
         Get the count of unread notifications for a user.
+        Cached briefly; invalidated when the user's notifications change.
+        """
+        return cache.get_or_set(
+            _unread_cache_key(user.pk),
+            lambda: Notification.objects.filter(user=user, is_read=False).count(),
+            timeout=UNREAD_COUNT_CACHE_TTL
+        )
+    
+    def has_unread(self, user) -> bool:
+        """
+        Check whether a user has any unread notification (SELECT ... LIMIT 1).
         """
-        return Notification.objects.filter(user=user, is_read=False).count()
+        return Notification.objects.filter(user=user, is_read=False).exists()
     
     def mark_as_read(self, notification_id: int, user) -> ServiceResult:
         """
         Mark a notification as read.
         """
         try:
-            notification = Notification.objects.get(id=notification_id, user=user)
-            notification.mark_as_read()
+            from django.utils import timezone
+            # Single UPDATE; the is_read filter makes it race-free
+            updated = Notification.objects.filter(
+                id=notification_id,
+                user=user,
+                is_read=False
+            ).update(
+                is_read=True,
+                read_at=timezone.now()
+            )
+            if updated:
+                invalidate_unread_count(user.pk)
+            elif not Notification.objects.filter(id=notification_id, user=user).exists():
+                return ServiceResult.fail(message="Bildirim bulunamadı", code="NOT_FOUND")
             return ServiceResult.ok(message="Bildirim okundu olarak işaretlendi")
-        except Notification.DoesNotExist:
-            return ServiceResult.fail(message="Bildirim bulunamadı", code="NOT_FOUND")
         except Exception as e:
             self.log_error(f"Failed to mark notification as read: {str(e)}", exc=e)
             return ServiceResult.fail(message="İşlem başarısız")
@@ -118,7 +205,8 @@ class NotificationService(BaseService):
                 is_read=True, 
                 read_at=timezone.now()
             )
-            self.log_info(f"Marked {updated} notifications as read for user {user.username}")
+            invalidate_unread_count(user.pk)
+            self.log_info("Marked %d notifications as read for user %s", updated, user.username)
             return ServiceResult.ok(
                 data={'updated_count': updated},
                 message=f"{updated} bildirim okundu olarak işaretlendi"
@@ -132,11 +220,12 @@ class NotificationService(BaseService):
         Delete a notification.
         """
         try:
-            notification = Notification.objects.get(id=notification_id, user=user)
-            notification.delete()
+            # No relations or delete signals, so Django issues a single DELETE
+            deleted, _ = Notification.objects.filter(id=notification_id, user=user).delete()
+            if not deleted:
+                return ServiceResult.fail(message="Bildirim bulunamadı", code="NOT_FOUND")
+            invalidate_unread_count(user.pk)
             return ServiceResult.ok(message="Bildirim silindi")
-        except Notification.DoesNotExist:
-            return ServiceResult.fail(message="Bildirim bulunamadı", code="NOT_FOUND")
         except Exception as e:
             self.log_error(f"Failed to delete notification: {str(e)}", exc=e)
             return ServiceResult.fail(message="İşlem başarısız")
@@ -144,9 +233,9 @@ class NotificationService(BaseService):
     # Convenience methods for creating specific notification types
     
     def notify_task_assigned(self, user, task_title: str, link: str = None):
-        """Notify user about a new task assignment."""
-        return self.create_notification(
-            user=user,
+        """Notify user (or a list of users) about a new task assignment."""
+        return self._notify(
+            user,
             title="Yeni Görev Atandı",
             message=f"Size yeni bir görev atandı: {task_title}",
             notification_type=Notification.NotificationType.TASK,
@@ -154,9 +243,9 @@ class NotificationService(BaseService):
         )
     
     def notify_order_status_change(self, user, order_id: str, new_status: str, link: str = None):
-        """Notify user about an order status change."""
-        return self.create_notification(
-            user=user,
+        """Notify user (or a list of users) about an order status change."""
+        return self._notify(
+            user,
             title="Sipariş Durumu Güncellendi",
             message=f"Sipariş #{order_id} durumu güncellendi: {new_status}",
             notification_type=Notification.NotificationType.ORDER,
@@ -164,9 +253,9 @@ class NotificationService(BaseService):
         )
     
     def notify_document_uploaded(self, user, document_name: str, link: str = None):
-        """Notify user about a new document upload."""
-        return self.create_notification(
-            user=user,
+        """Notify user (or a list of users) about a new document upload."""
+        return self._notify(
+            user,
             title="Yeni Belge Yüklendi",
             message=f"Yeni belge yüklendi: {document_name}",
             notification_type=Notification.NotificationType.DOCUMENT,
@@ -174,9 +263,9 @@ class NotificationService(BaseService):
         )
     
     def notify_approval_needed(self, user, item_type: str, item_title: str, link: str = None):
-        """Notify user about an item needing approval."""
-        return self.create_notification(
-            user=user,
+        """Notify user (or a list of users) about an item needing approval."""
+        return self._notify(
+            user,
             title="Onay Bekliyor",
             message=f"{item_type} onayınızı bekliyor: {item_title}",
             notification_type=Notification.NotificationType.WARNING,
@@ -0,0 +1,24 @@
+"""
+Core signals.
+Invalidates cached unread notification counts when notifications are saved.
+"""
+
+from django.db.models.signals import post_save
+
+from .models import Notification
+from .services.notifications import invalidate_unread_count
+
+
+def invalidate_notification_unread_count(sender, instance, **kwargs):
+    """Drop the cached unread count of the notification's user."""
+    invalidate_unread_count(instance.user_id)
+
+
+# No post_delete receiver: it would turn the single-statement
+# queryset delete() into SELECT + DELETE. Delete paths invalidate
+# explicitly instead.
+post_save.connect(
+    invalidate_notification_unread_count,
+    sender=Notification,
+    dispatch_uid='invalidate_notification_unread_count'
+)
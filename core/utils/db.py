@@ -0,0 +1,19 @@
+"""
+Database utilities.
+"""
+
+from django.db import connections
+
+
+def run_with_own_connection(fn, *args, **kwargs):
+    """
+    Run fn in a worker thread and close the database connections
+    the thread opened once it is done.
+    
+    Usage:
+        executor.submit(run_with_own_connection, fn, *args)
+    """
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        connections.close_all()
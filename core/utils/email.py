@@ -2,16 +2,194 @@
 Email utilities for sending emails.
 """
 
+import atexit
 import logging
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
 from django.conf import settings
-from django.core.mail import send_mail, EmailMultiAlternatives
-from django.template.loader import render_to_string
+from django.core.mail import EmailMessage, EmailMultiAlternatives, get_connection
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
 from django.utils.html import strip_tags
 
 
 logger = logging.getLogger(__name__)
 
+# Background senders; SMTP I/O stays off the request thread
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Create the shared email sender pool on first use.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'EMAIL_SEND_WORKERS', 4),
+                    thread_name_prefix='email'
+                )
+    return _executor
+
+
+# Open SMTP connections, one per sending thread; reused across sends
+_connections = threading.local()
+_open_connections = set()
+_connections_lock = threading.Lock()
+
+
+def _get_connection():
+    """
+    Return this thread's SMTP connection, opening it on first use.
+    Backend connections are not thread-safe, so each thread keeps its own.
+    """
+    connection = getattr(_connections, 'connection', None)
+    if connection is None or getattr(connection, 'connection', True) is None:
+        connection = get_connection(fail_silently=False)
+        connection.open()
+        _connections.connection = connection
+        with _connections_lock:
+            _open_connections.add(connection)
+    return connection
+
+
+def _drop_connection():
+    """
+    Close and forget this thread's SMTP connection (e.g. after the
+    server dropped it); the next send opens a fresh one.
+    """
+    connection = getattr(_connections, 'connection', None)
+    _connections.connection = None
+    if connection is not None:
+        with _connections_lock:
+            _open_connections.discard(connection)
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+@atexit.register
+def _close_all_connections():
+    """
+    At exit: let the background senders finish, then close every
+    thread's SMTP connection. Only safe once no thread is sending.
+    """
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+    
+    with _connections_lock:
+        connections = list(_open_connections)
+        _open_connections.clear()
+    for connection in connections:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+# Placeholder for the per-user part of the shared digest chrome
+_DIGEST_MARKER = "__DIGEST_CONTENT__"
+
+# Resolved email templates, keyed by name; filled on first send
+_templates = {}
+_templates_lock = threading.Lock()
+
+
+def _get_template(template_name: str):
+    """
+    Resolve an email template once and reuse it for later sends.
+    In DEBUG the loader is asked every time so template edits show up.
+    """
+    if settings.DEBUG:
+        return get_template(template_name)
+    
+    template = _templates.get(template_name)
+    if template is None:
+        with _templates_lock:
+            template = _templates.get(template_name)
+            if template is None:
+                template = _templates[template_name] = get_template(template_name)
+    return template
+
+
+def _get_text_template(template_name: str):
+    """
+    Plain-text pair of an HTML email template (foo.html -> foo.txt),
+    or None when the template has no text variant.
+    """
+    if not template_name.endswith('.html'):
+        return None
+    try:
+        return _get_template(template_name[:-len('.html')] + '.txt')
+    except TemplateDoesNotExist:
+        return None
+
+
+def _is_transient(exc: Exception) -> bool:
+    """
+    Whether a send error is worth retrying: dropped connections, socket
+    errors and 4xx replies. Permanent 5xx replies (refused sender or
+    recipients, rejected data, failed auth) are not retried.
+    """
+    # SMTPException subclasses OSError, so SMTP errors are checked first
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return exc.smtp_code < 500
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return False
+    if isinstance(exc, smtplib.SMTPServerDisconnected):
+        return True
+    return isinstance(exc, OSError) and not isinstance(exc, smtplib.SMTPException)
+
+
+def _deliver(email: EmailMessage, description: str) -> bool:
+    """
+    Send a prepared email, retrying transient SMTP errors with backoff.
+    
+    Returns:
+        True if email was sent successfully
+    """
+    max_retries = getattr(settings, 'EMAIL_MAX_RETRIES', 3)
+    delay = 1.0
+    
+    for attempt in range(max_retries + 1):
+        try:
+            email.connection = _get_connection()
+            email.send(fail_silently=False)
+            logger.info("%s sent successfully to %s: %s", description, email.to, email.subject)
+            return True
+        except (smtplib.SMTPException, OSError) as e:
+            # The connection may be stale or mid-transaction; use a fresh one
+            _drop_connection()
+            if attempt == max_retries or not _is_transient(e):
+                logger.error("Failed to send %s to %s: %s", description, email.to, e)
+                return False
+            time.sleep(delay)
+            delay *= 2
+        except Exception as e:
+            logger.error("Failed to send %s to %s: %s", description, email.to, e)
+            return False
+
+
+def _deliver_many(emails: List[EmailMessage], description: str) -> int:
+    """
+    Send prepared emails one after another on this thread's SMTP
+    connection, so the TCP/TLS handshake and login happen once for the
+    whole batch rather than once per recipient.
+    
+    Returns:
+        Number of emails sent successfully
+    """
+    sent = sum(1 for email in emails if _deliver(email, description))
+    logger.info("%s: %d of %d sent", description, sent, len(emails))
+    return sent
+
 
 class EmailService:
     """
@@ -22,12 +200,34 @@ class EmailService:
     def __init__(self):
         self.from_email = settings.DEFAULT_FROM_EMAIL
     
+    def close(self):
+        """
+        Close the calling thread's persistent SMTP connection.
+        Connections of the background senders are closed at exit.
+        """
+        _drop_connection()
+    
+    def _send(self, email: EmailMessage, description: str = "Email", sync: bool = False) -> bool:
+        """
+        Hand a prepared email to the background senders.
+        With sync (or EMAIL_SYNC) the email is sent in the calling thread.
+        
+        Returns:
+            True if the email was sent (sync) or queued (async)
+        """
+        if sync or getattr(settings, 'EMAIL_SYNC', False):
+            return _deliver(email, description)
+        
+        _get_executor().submit(_deliver, email, description)
+        return True
+    
     def send_simple_email(
         self,
         subject: str,
         message: str,
         recipients: List[str],
-        from_email: Optional[str] = None
+        from_email: Optional[str] = None,
+        sync: bool = False
     ) -> bool:
         """
         Send a simple text email.
@@ -37,23 +237,18 @@ class EmailService:
             message: Email body (plain text)
             recipients: List of recipient email addresses
             from_email: Sender email (uses default if not provided)
+            sync: Send now and report the delivery result instead of queueing
         
         Returns:
-            True if email was sent successfully
+            True if email was sent (or queued) successfully
         """
-        try:
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=from_email or self.from_email,
-                recipient_list=recipients,
-                fail_silently=False
-            )
-            logger.info(f"Email sent successfully to {recipients}: {subject}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to send email to {recipients}: {e}")
-            return False
+        email = EmailMessage(
+            subject=subject,
+            body=message,
+            from_email=from_email or self.from_email,
+            to=recipients
+        )
+        return self._send(email, sync=sync)
     
     def send_template_email(
         self,
@@ -61,7 +256,8 @@ class EmailService:
         template_name: str,
         context: Dict[str, Any],
         recipients: List[str],
-        from_email: Optional[str] = None
+        from_email: Optional[str] = None,
+        sync: bool = False
     ) -> bool:
         """
         Send an HTML email using a template.
@@ -72,36 +268,112 @@ class EmailService:
             context: Context data for the template
             recipients: List of recipient email addresses
             from_email: Sender email (uses default if not provided)
+            sync: Send now and report the delivery result instead of queueing
         
         Returns:
-            True if email was sent successfully
+            True if email was sent (or queued) successfully
         """
         try:
-            # Render HTML content
-            html_content = render_to_string(template_name, context)
-            text_content = strip_tags(html_content)
-            
-            # Create email
-            email = EmailMultiAlternatives(
-                subject=subject,
-                body=text_content,
-                from_email=from_email or self.from_email,
-                to=recipients
+            email = self._build_template_email(
+                subject, template_name, context, recipients, from_email
             )
-            email.attach_alternative(html_content, "text/html")
-            email.send(fail_silently=False)
-            
-            logger.info(f"Template email sent successfully to {recipients}: {subject}")
-            return True
         except Exception as e:
-            logger.error(f"Failed to send template email to {recipients}: {e}")
+            logger.error("Failed to render template email to %s: %s", recipients, e)
             return False
+        
+        return self._send(email, "Template email", sync=sync)
+    
+    def send_bulk_template_email(
+        self,
+        subject: str,
+        template_name: str,
+        contexts_by_recipient: Dict[str, Dict[str, Any]],
+        from_email: Optional[str] = None
+    ) -> int:
+        """
+        Send one templated email per recipient over a single SMTP connection.
+        Templates are rendered up front; delivery runs in the background
+        unless EMAIL_SYNC is set.
+        
+        Args:
+            subject: Email subject
+            template_name: Path to the email template
+            contexts_by_recipient: Template context keyed by recipient address
+            from_email: Sender email (uses default if not provided)
+        
+        Returns:
+            Number of emails sent (sync) or queued (async)
+        """
+        emails = []
+        for recipient, context in contexts_by_recipient.items():
+            try:
+                emails.append(self._build_template_email(
+                    subject, template_name, context, [recipient], from_email
+                ))
+            except Exception as e:
+                logger.error("Failed to render template email to %s: %s", recipient, e)
+        
+        return self._send_many(emails, "Bulk template email")
+    
+    def _send_many(self, emails: List[EmailMessage], description: str) -> int:
+        """
+        Hand prepared emails to one background sender as a batch.
+        With EMAIL_SYNC the emails are sent in the calling thread.
+        
+        Returns:
+            Number of emails sent (sync) or queued (async)
+        """
+        if not emails:
+            return 0
+        
+        if getattr(settings, 'EMAIL_SYNC', False):
+            return _deliver_many(emails, description)
+        
+        _get_executor().submit(_deliver_many, emails, description)
+        return len(emails)
+    
+    def _build_template_email(
+        self,
+        subject: str,
+        template_name: str,
+        context: Dict[str, Any],
+        recipients: List[str],
+        from_email: Optional[str] = None,
+        html_content: Optional[str] = None
+    ) -> EmailMultiAlternatives:
+        """
+        Render a template into an HTML email with a plain-text body.
+        Pass html_content when the HTML has already been rendered;
+        template_name is then only used to find the .txt variant.
+        """
+        # Render HTML content
+        if html_content is None:
+            html_content = _get_template(template_name).render(context)
+        
+        # Prefer the paired .txt template; strip_tags is the fallback
+        text_template = _get_text_template(template_name)
+        if text_template is not None:
+            text_content = text_template.render(context)
+        else:
+            text_content = strip_tags(html_content)
+        
+        # Create email
+        email = EmailMultiAlternatives(
+            subject=subject,
+            body=text_content,
+            from_email=from_email or self.from_email,
+            to=recipients
+        )
+        email.attach_alternative(html_content, "text/html")
+        return email
     
     # Specific email methods
     
     def send_welcome_email(self, user, password: Optional[str] = None) -> bool:
         """
         Send welcome email to a new user.
+        Sent synchronously: the email carries the password, so callers
+        need to know whether it was actually delivered.
         """
         context = {
             'user': user,
@@ -113,7 +385,8 @@ class EmailService:
             subject="Hoş Geldiniz - Leasing Yönetim Sistemi",
             template_name="emails/welcome.html",
             context=context,
-            recipients=[user.email]
+            recipients=[user.email],
+            sync=True
         )
     
     def send_kvkk_approval_notification(self, salesperson, customer) -> bool:
@@ -198,6 +471,55 @@ class EmailService:
             recipients=[user.email]
         )
     
+    def send_daily_digests(self, digests: List[tuple]) -> int:
+        """
+        Send daily digest emails to many users over one SMTP connection.
+        The user-independent chrome is rendered once for the batch; only
+        the per-user fragment is rendered for each recipient.
+        
+        Args:
+            digests: (user, tasks, orders) tuples
+        
+        Returns:
+            Number of emails sent (sync) or queued (async)
+        """
+        subject = "Günlük Özet - Leasing Yönetim Sistemi"
+        dashboard_url = f"{settings.SITE_URL}/dashboard/"
+        
+        try:
+            chrome = _get_template("emails/_digest_chrome.html").render({
+                'digest_content': _DIGEST_MARKER,
+                'dashboard_url': dashboard_url,
+            })
+            head, tail = chrome.split(_DIGEST_MARKER)
+            fragment = _get_template("emails/_digest_fragment.html")
+        except Exception as e:
+            logger.error("Failed to render daily digest chrome: %s", e)
+            return 0
+        
+        emails = []
+        for user, tasks, orders in digests:
+            if not user.email:
+                continue
+            context = {
+                'user': user,
+                'tasks': tasks,
+                'orders': orders,
+                'dashboard_url': dashboard_url,
+            }
+            try:
+                emails.append(self._build_template_email(
+                    subject,
+                    "emails/daily_digest.html",
+                    context,
+                    [user.email],
+                    html_content=head + fragment.render(context) + tail
+                ))
+            except Exception as e:
+                logger.error("Failed to render daily digest to %s: %s", user.email, e)
+        
+        return self._send_many(emails, "Daily digest email")
+    
     def send_proposal_email(
         self,
         subject: str,
@@ -208,6 +530,7 @@ class EmailService:
     ) -> bool:
         """
         Send proposal email with optional PDF attachment.
+        Sent synchronously so the result reflects actual delivery.
         
         Args:
             subject: Email subject
@@ -231,14 +554,11 @@ class EmailService:
             # Add PDF attachment if provided
             if pdf_attachment:
                 email.attach(pdf_filename, pdf_attachment, 'application/pdf')
-            
-            email.send(fail_silently=False)
-            
-            logger.info(f"Proposal email sent successfully to {recipients}: {subject}")
-            return True
         except Exception as e:
-            logger.error(f"Failed to send proposal email to {recipients}: {e}")
+            logger.error("Failed to build proposal email to %s: %s", recipients, e)
             return False
+        
+        return self._send(email, "Proposal email", sync=True)
 
 
 # Singleton instance
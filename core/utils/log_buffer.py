@@ -0,0 +1,126 @@
+"""
+Log Buffer.
+Collects log rows in memory and writes them in batches.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+
+
+logger = logging.getLogger(__name__)
+
+
+class LogBuffer:
+    """
+    Process-wide buffer for rows of one log model.
+    Callers only enqueue unsaved instances; a daemon thread, started on
+    the first enqueue, drains the queue with bulk_create every
+    `interval_setting` milliseconds, or as soon as `max_pending` rows are
+    waiting. Remaining rows are flushed at exit.
+    
+    The model's created_at must use default=timezone.now rather than
+    auto_now_add, so rows keep the time they were logged, not flushed.
+    """
+    
+    BATCH_SIZE = 500
+    
+    def __init__(
+        self,
+        model_label: str,
+        interval_setting: str,
+        default_interval_ms: int,
+        max_pending: int,
+        name: str
+    ):
+        self.model_label = model_label
+        self.interval_setting = interval_setting
+        self.default_interval_ms = default_interval_ms
+        self.max_pending = max_pending
+        self.name = name
+        
+        self._queue = queue.Queue()
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._atexit_registered = False
+    
+    def start(self):
+        """
+        Start the drainer thread (again, e.g. in a forked worker).
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            
+            self._thread = threading.Thread(
+                target=self._run, name=self.name, daemon=True
+            )
+            self._thread.start()
+            
+            if not self._atexit_registered:
+                atexit.register(self.flush)
+                self._atexit_registered = True
+    
+    def enqueue(self, log):
+        """
+        Queue an unsaved log instance for writing.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self.start()
+        
+        self._queue.put(log)
+        if self._queue.qsize() >= self.max_pending:
+            self._wakeup.set()
+    
+    def _run(self):
+        interval = getattr(settings, self.interval_setting, self.default_interval_ms) / 1000
+        while True:
+            self._wakeup.wait(interval)
+            self._wakeup.clear()
+            self.flush()
+    
+    def flush(self):
+        """
+        Write all queued rows with bulk_create.
+        """
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        if not batch:
+            return
+        
+        model = apps.get_model(self.model_label)
+        try:
+            model.objects.bulk_create(batch, batch_size=self.BATCH_SIZE)
+        except Exception:
+            # bulk_create is all-or-nothing; one bad row must not drop the rest
+            logger.exception(
+                "Batch write of %d %s rows failed; retrying row by row",
+                len(batch), self.model_label
+            )
+            self._write_rows(batch)
+        finally:
+            connections.close_all()
+    
+    def _write_rows(self, batch):
+        """
+        Insert rows one at a time, discarding only the ones that fail.
+        """
+        failed = 0
+        for row in batch:
+            try:
+                row.save(force_insert=True)
+            except Exception:
+                failed += 1
+                logger.exception("Discarded a %s row", self.model_label)
+        if failed:
+            logger.error("Discarded %d of %d %s rows", failed, len(batch), self.model_label)
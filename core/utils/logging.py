@@ -6,6 +6,19 @@ import logging
 from typing import Optional
 from functools import wraps
 from django.conf import settings
+from django.db import transaction
+
+from .log_buffer import LogBuffer
+
+
+# ActivityLog rows are written in background batches
+activity_log_buffer = LogBuffer(
+    model_label='core.ActivityLog',
+    interval_setting='ACTIVITY_LOG_FLUSH_INTERVAL_MS',
+    default_interval_ms=5000,
+    max_pending=500,
+    name='activity-log-buffer'
+)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -105,8 +118,15 @@ class ActivityLogger:
     """
     Specialized logger for user activities.
     Logs to both standard logger and ActivityLog model.
+    
+    Rows are written in batches by activity_log_buffer once the
+    surrounding transaction commits. SYNC_ACTION_TYPES, and calls with
+    sync=True, are written immediately inside the caller's transaction.
     """
     
+    # Audit events that must be durable as soon as log() returns
+    SYNC_ACTION_TYPES = frozenset({'login', 'logout'})
+    
     def __init__(self, request=None):
         self.request = request
         self.logger = logging.getLogger('leasing_core.activity')
@@ -118,7 +138,8 @@ class ActivityLogger:
         model_name: str = "",
         object_id: int = None,
         object_repr: str = "",
-        extra_data: dict = None
+        extra_data: dict = None,
+        sync: bool = False
     ):
         """
         Log an activity.
@@ -130,6 +151,8 @@ class ActivityLogger:
             object_id: ID of the object being acted upon
             object_repr: String representation of the object
             extra_data: Additional data to store
+            sync: Write the row now, in the caller's transaction, so it
+                commits or rolls back together with the logged change
         """
         from core.models import ActivityLog
         
@@ -152,19 +175,28 @@ class ActivityLogger:
             f"Description: {description}"
         )
         
-        # Log to database
+        activity = ActivityLog(
+            user=user,
+            action_type=action_type,
+            model_name=model_name,
+            object_id=object_id,
+            object_repr=object_repr,
+            description=description,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            extra_data=extra_data or {}
+        )
+        
+        if not sync and action_type not in self.SYNC_ACTION_TYPES:
+            # Queued only if the enclosing transaction commits
+            transaction.on_commit(lambda: activity_log_buffer.enqueue(activity))
+            return
+        
+        # Log to database; the savepoint keeps a failed insert from
+        # breaking an enclosing transaction
         try:
-            ActivityLog.objects.create(
-                user=user,
-                action_type=action_type,
-                model_name=model_name,
-                object_id=object_id,
-                object_repr=object_repr,
-                description=description,
-                ip_address=ip_address,
-                user_agent=user_agent,
-                extra_data=extra_data or {}
-            )
+            with transaction.atomic():
+                activity.save()
         except Exception as e:
             self.logger.error(f"Failed to create activity log: {e}")
 
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0004_alter_customernote_note_type'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(fields=['salesperson', 'stage'], name='customers_c_salespe_505ec5_idx'),
+        ),
+    ]
@@ -269,6 +269,7 @@ class Customer(models.Model):
             models.Index(fields=['stage']),
             models.Index(fields=['salesperson']),
             models.Index(fields=['created_at']),
+            models.Index(fields=['salesperson', 'stage']),
         ]
     
     def __str__(self):
@@ -303,7 +303,12 @@ class CustomerService:
         # Hoşgeldin emaili gönder
         if send_email:
             try:
-                email_service.send_welcome_email(user, password)
+                sent = email_service.send_welcome_email(user, password)
+            except Exception as e:
+                logger.error(f"Failed to send welcome email to {email}: {e}")
+                sent = False
+            
+            if sent:
                 logger.info(f"Welcome email sent to: {email}")
                 
                 # Aktivite notu ekle
@@ -313,8 +318,7 @@ class CustomerService:
                     content=f"Müşteri hesabı oluşturuldu. Kullanıcı adı: {username}. Hoşgeldin emaili gönderildi.",
                     created_by=salesperson
                 )
-            except Exception as e:
-                logger.error(f"Failed to send welcome email to {email}: {e}")
+            else:
                 # Email gönderilemese bile müşteriyi oluştur
                 CustomerNote.objects.create(
                     customer=customer,
@@ -346,10 +350,12 @@ class CustomerService:
         user.save()
         
         try:
-            email_service.send_welcome_email(user, new_password)
-            logger.info(f"Welcome email resent to: {user.email}")
-            return True, new_password
+            sent = email_service.send_welcome_email(user, new_password)
         except Exception as e:
             logger.error(f"Failed to resend welcome email: {e}")
             return False, new_password
+        
+        if sent:
+            logger.info(f"Welcome email resent to: {user.email}")
+        return sent, new_password
 
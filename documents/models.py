@@ -386,6 +386,19 @@ class KVKKStatus(models.TextChoices):
     REJECTED = 'rejected', _('Reddedildi')
 
 
+# Durum rozeti CSS sınıfları; model örneği olmadan da (values() satırları)
+# kullanılabilsin diye modül seviyesinde tutulur.
+KVKK_STATUS_CLASSES = {
+    KVKKStatus.DRAFT: 'bg-slate-100 text-slate-700',
+    KVKKStatus.PENDING_SIGNATURE: 'bg-blue-100 text-blue-700',
+    KVKKStatus.UPLOADED: 'bg-cyan-100 text-cyan-700',
+    KVKKStatus.PENDING_APPROVAL: 'bg-amber-100 text-amber-700',
+    KVKKStatus.REVISION_REQUESTED: 'bg-orange-100 text-orange-700',
+    KVKKStatus.APPROVED: 'bg-emerald-100 text-emerald-700',
+    KVKKStatus.REJECTED: 'bg-red-100 text-red-700',
+}
+
+
 class KVKKDocument(models.Model):
     """
     KVKK onay belgesi modeli.
@@ -514,16 +527,7 @@ class KVKKDocument(models.Model):
     @property
     def status_display_class(self):
         """CSS class for status badge."""
-        classes = {
-            KVKKStatus.DRAFT: 'bg-slate-100 text-slate-700',
-            KVKKStatus.PENDING_SIGNATURE: 'bg-blue-100 text-blue-700',
-            KVKKStatus.UPLOADED: 'bg-cyan-100 text-cyan-700',
-            KVKKStatus.PENDING_APPROVAL: 'bg-amber-100 text-amber-700',
-            KVKKStatus.REVISION_REQUESTED: 'bg-orange-100 text-orange-700',
-            KVKKStatus.APPROVED: 'bg-emerald-100 text-emerald-700',
-            KVKKStatus.REJECTED: 'bg-red-100 text-red-700',
-        }
-        return classes.get(self.status, 'bg-slate-100 text-slate-700')
+        return KVKK_STATUS_CLASSES.get(self.status, 'bg-slate-100 text-slate-700')
     
     @property
     def can_be_downloaded(self):
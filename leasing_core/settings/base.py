@@ -166,12 +166,55 @@ EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', 'True').lower() == 'true'
 EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
 EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
 DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@leasing.local')
+# E-postalar arka plan thread'lerinde gönderilir; True ise istek içinde (senkron)
+EMAIL_SYNC = os.environ.get('EMAIL_SYNC', 'False').lower() == 'true'
+# Arka planda eşzamanlı gönderim yapan thread sayısı
+EMAIL_SEND_WORKERS = int(os.environ.get('EMAIL_SEND_WORKERS', 4))
+# SMTP hatalarında yeniden deneme sayısı
+EMAIL_MAX_RETRIES = int(os.environ.get('EMAIL_MAX_RETRIES', 3))
 
 # Anthropic API settings
 ANTHROPIC_API_KEY = os.environ.get('ANTHROPIC_API_KEY', '')
 AI_MODEL = 'claude-sonnet-4-20250514'
 AI_MAX_TOKENS = 4096
 AI_TIMEOUT = 30  # seconds
+# 429/5xx yanıtlarında SDK'nın yeniden deneme sayısı
+AI_MAX_RETRIES = int(os.environ.get('AI_MAX_RETRIES', 3))
+# Claude API HTTP bağlantı havuzu: en fazla bağlantı ve boşta tutma süresi (saniye)
+AI_HTTP_MAX_CONNECTIONS = int(os.environ.get('AI_HTTP_MAX_CONNECTIONS', 50))
+AI_HTTP_KEEPALIVE = int(os.environ.get('AI_HTTP_KEEPALIVE', 60))
+# Bu token sayısının altındaki system promptlar prompt caching ile işaretlenmez
+AI_CACHE_MIN_TOKENS = int(os.environ.get('AI_CACHE_MIN_TOKENS', 1024))
+# Aynı istek için Claude yanıtlarının cache'te tutulma süresi
+AI_CACHE_TTL = int(os.environ.get('AI_CACHE_TTL', 7 * 24 * 60 * 60))  # seconds
+# Paralel gönderilebilecek en fazla Claude isteği
+AI_MAX_CONCURRENCY = int(os.environ.get('AI_MAX_CONCURRENCY', 10))
+# Bu sayıda ve üzeri belge Message Batches API ile toplu validate edilir
+AI_BATCH_THRESHOLD = int(os.environ.get('AI_BATCH_THRESHOLD', 10))
+# Message Batch sonuçları için en fazla bekleme süresi (saniye); aşılırsa batch iptal edilir
+AI_BATCH_TIMEOUT = int(os.environ.get('AI_BATCH_TIMEOUT', 600))
+# Tek istekte paketlenen belgelerin toplam girdi token sınırı
+AI_BATCH_MAX_INPUT_TOKENS = int(os.environ.get('AI_BATCH_MAX_INPUT_TOKENS', 40000))
+# Prompta eklenen belge metninin token sınırı (imza/kaşe kontrollerinde metnin sonu)
+AI_DOC_MAX_TOKENS = int(os.environ.get('AI_DOC_MAX_TOKENS', 1500))
+# AI istek logları arka planda bu aralıkla toplu yazılır
+AI_LOG_FLUSH_INTERVAL_MS = int(os.environ.get('AI_LOG_FLUSH_INTERVAL_MS', 500))
+# Aktivite logları arka planda bu aralıkla toplu yazılır (giriş/çıkış hariç)
+ACTIVITY_LOG_FLUSH_INTERVAL_MS = int(os.environ.get('ACTIVITY_LOG_FLUSH_INTERVAL_MS', 5000))
+
+# bulk_create batch boyutu.
+# batch_size x kolon sayısı, veritabanının sorgu başına parametre
+# sınırının (PostgreSQL'de 65535) altında kalmalıdır.
+BULK_CREATE_BATCH_SIZE = int(os.environ.get('BULK_CREATE_BATCH_SIZE', 500))
+
+# Admin dashboard snapshot (refresh_dashboard_snapshot komutu ile güncellenir)
+DASHBOARD_SNAPSHOT_MAX_AGE = int(os.environ.get('DASHBOARD_SNAPSHOT_MAX_AGE', 300))  # seconds
+# Admin dashboard istatistikleri paralel thread'lerde hesaplanır.
+# Testlerde False yapın: worker thread'ler kendi bağlantılarını kullanır
+# ve TestCase transaction'ındaki veriyi göremez.
+DASHBOARD_PARALLEL_STATS = os.environ.get('DASHBOARD_PARALLEL_STATS', 'True') == 'True'
+# Tüm isteklerin paylaştığı istatistik havuzundaki thread sayısı
+DASHBOARD_STATS_WORKERS = int(os.environ.get('DASHBOARD_STATS_WORKERS', 10))
 
 # File upload settings
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
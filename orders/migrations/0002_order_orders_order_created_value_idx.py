@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['created_at'], include=('equipment_value',), name='orders_order_created_value_idx'),
+        ),
+    ]
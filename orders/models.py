@@ -243,6 +243,12 @@ class Order(models.Model):
             models.Index(fields=['salesperson', 'status']),
             models.Index(fields=['status', 'created_at']),
             models.Index(fields=['order_number']),
+            # PostgreSQL'de aylık trend sorgusu index-only scan yapabilsin
+            models.Index(
+                fields=['created_at'],
+                include=['equipment_value'],
+                name='orders_order_created_value_idx'
+            ),
         ]
     
     def __str__(self):
@@ -433,9 +433,10 @@ class ProposalSendEmailView(SalespersonRequiredMixin, View):
         
         email_service = EmailService()
         success = email_service.send_simple_email(
-            to_email=recipient_email,
             subject=subject,
-            message=body
+            message=body,
+            recipients=[recipient_email],
+            sync=True
         )
         
         if success: